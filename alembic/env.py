@@ -16,6 +16,14 @@ from alembic import context
 from todo.db.base import Base
 from todo.models.project import Project
 from todo.models.task import Task
+from todo.models.idempotency_key import IdempotencyKey
+from todo.models.scheduler_lock import SchedulerLock
+from todo.models.job_run import JobRun
+from todo.models.background_job import BackgroundJob
+from todo.models.job_watermark import JobWatermark
+from todo.models.archived_task import ArchivedTask
+from todo.models.task_event import TaskEvent
+from todo.models.task_daily_stat import TaskDailyStat
 
 
 
@@ -0,0 +1,55 @@
+"""store_task_status_as_smallint
+
+Revision ID: f3a9d1c6b847
+Revises: e5b2c8f4a913
+Create Date: 2026-10-19 15:40:22.907315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d1c6b847'
+down_revision: Union[str, None] = 'e5b2c8f4a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Positions in todo.models.task.VALID_STATUSES (see todo.db.types.CodedString)
+STATUS_CODES = {'todo': 0, 'doing': 1, 'done': 2}
+
+# Rows converted per committed UPDATE, so the conversion never holds
+# millions of row locks or one huge transaction
+BATCH_SIZE = 50000
+
+
+def _convert_in_batches(column: str, expression: str) -> None:
+    """Fill ``column`` from ``expression`` in id ranges, committing each range."""
+    conn = op.get_bind()
+    max_id = conn.scalar(sa.text('SELECT max(id) FROM tasks')) or 0
+    with op.get_context().autocommit_block():
+        for low in range(0, max_id + 1, BATCH_SIZE):
+            conn.execute(
+                sa.text(f'UPDATE tasks SET {column} = {expression} WHERE id >= :low AND id < :high'),
+                {'low': low, 'high': low + BATCH_SIZE},
+            )
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('status_code', sa.SmallInteger(), nullable=True))
+    cases = ' '.join(f"WHEN '{status}' THEN {code}" for status, code in STATUS_CODES.items())
+    _convert_in_batches('status_code', f'CASE status {cases} END')
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('status')
+        batch_op.alter_column('status_code', new_column_name='status', existing_type=sa.SmallInteger(), nullable=False)
+
+
+def downgrade() -> None:
+    op.add_column('tasks', sa.Column('status_text', sa.String(length=10), nullable=True))
+    cases = ' '.join(f"WHEN {code} THEN '{status}'" for status, code in STATUS_CODES.items())
+    _convert_in_batches('status_text', f'CASE status {cases} END')
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('status')
+        batch_op.alter_column('status_text', new_column_name='status', existing_type=sa.String(length=10), nullable=False)
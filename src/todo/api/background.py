@@ -0,0 +1,34 @@
+"""Helpers for endpoints that hand their work to the background job queue."""
+
+from typing import Any, Dict
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from todo.services.background_job_service import BackgroundJobService
+
+from .controller_schemas.responses import JobAcceptedResponse
+
+
+def enqueue_job(
+    session: Session,
+    request: Request,
+    kind: str,
+    payload: Dict[str, Any],
+    priority: int = 0,
+) -> JSONResponse:
+    """
+    Queue a job and answer ``202 Accepted``.
+
+    The response body and its ``Location`` header point to the job status
+    endpoint, which clients poll until the job has finished.
+    """
+    job = BackgroundJobService(session).enqueue(kind, payload, priority)
+    status_url = request.app.url_path_for("get_job", job_id=job.id)
+    body = JobAcceptedResponse(job_id=job.id, status=job.status, status_url=status_url)
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=body.model_dump(),
+        headers={"Location": status_url},
+    )
@@ -9,9 +9,19 @@ from .task_requests import (
     TaskCreateRequest,
     TaskUpdateRequest,
     TaskStatusUpdateRequest,
+    TaskBulkStatusRequest,
     TaskStatus
 )
 
+from .batch_requests import (
+    BatchOperation,
+    BatchRequest
+)
+
+from .admin_requests import (
+    ProfileArmRequest
+)
+
 __all__ = [
     # Project requests
     "ProjectCreateRequest",
@@ -21,5 +31,13 @@ __all__ = [
     "TaskCreateRequest",
     "TaskUpdateRequest",
     "TaskStatusUpdateRequest",
+    "TaskBulkStatusRequest",
     "TaskStatus",
+
+    # Batch requests
+    "BatchOperation",
+    "BatchRequest",
+
+    # Admin requests
+    "ProfileArmRequest",
 ]
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Pydantic models for admin requests."""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ProfileArmRequest(BaseModel):
+    """Request schema for profiling the next requests of a route."""
+
+    route: str = Field(
+        ...,
+        min_length=1,
+        description="Route template to profile",
+        examples=["/api/v1/projects/{project_id}/tasks"]
+    )
+    method: Optional[str] = Field(
+        default=None,
+        description="HTTP method to match; any method if omitted",
+        examples=["GET"]
+    )
+    count: int = Field(
+        default=1,
+        ge=1,
+        le=100,
+        description="Number of matching requests to profile"
+    )
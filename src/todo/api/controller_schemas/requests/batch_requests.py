@@ -0,0 +1,65 @@
+"""Pydantic models for batch operation requests."""
+
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field, model_validator
+
+from todo.config import config
+
+BatchAction = Literal["create", "update", "delete", "status"]
+BatchResource = Literal["project", "task"]
+
+# Either a concrete id or "$<ref>" pointing at an earlier operation in the batch
+BatchReference = Union[int, str]
+
+
+class BatchOperation(BaseModel):
+    """A single operation inside a batch request."""
+
+    op: BatchAction = Field(..., description="Operation to perform")
+    resource: BatchResource = Field(..., description="Resource the operation targets")
+    ref: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=50,
+        pattern=r"^[A-Za-z0-9_-]+$",
+        description="Name under which later operations can reference the created id as '$<ref>'",
+    )
+    id: Optional[BatchReference] = Field(
+        default=None,
+        description="Target id (or '$<ref>') for update, delete and status operations",
+    )
+    project_id: Optional[BatchReference] = Field(
+        default=None,
+        description="Parent project id (or '$<ref>') for task operations",
+    )
+    data: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Payload, validated like the matching single-resource request",
+    )
+
+    @model_validator(mode="after")
+    def validate_operation(self):
+        if self.op == "status" and self.resource != "task":
+            raise ValueError("Status operations are only supported for tasks")
+        if self.op == "create" and self.id is not None:
+            raise ValueError("Create operations must not specify an id")
+        if self.op != "create" and self.id is None:
+            raise ValueError(f"'{self.op}' operations require an id")
+        if self.resource == "task" and self.project_id is None:
+            raise ValueError("Task operations require a project_id")
+        for value in (self.id, self.project_id):
+            if isinstance(value, str) and not value.startswith("$"):
+                raise ValueError("String references must have the form '$<ref>'")
+        return self
+
+
+class BatchRequest(BaseModel):
+    """Request schema for running several operations in one transaction."""
+
+    operations: List[BatchOperation] = Field(
+        ...,
+        min_length=1,
+        max_length=config.BATCH_MAX_OPERATIONS,
+        description="Operations executed in order; all succeed or none are applied",
+    )
@@ -1,7 +1,7 @@
 """Pydantic models for task-related requests."""
 
 from datetime import date
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -99,4 +99,16 @@ class TaskStatusUpdateRequest(BaseModel):
     )
 
 
+class TaskBulkStatusRequest(BaseModel):
+    """Request schema for changing the status of many tasks of a project."""
 
+    status: TaskStatus = Field(
+        ...,
+        description="New task status"
+    )
+
+    task_ids: Optional[List[int]] = Field(
+        default=None,
+        min_length=1,
+        description="Tasks to update; all tasks of the project if omitted"
+    )
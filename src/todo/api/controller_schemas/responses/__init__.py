@@ -3,7 +3,11 @@
 from .project_responses import (
     ProjectResponse,
     ProjectListResponse,
+    ProjectWithTasksResponse,
+    ProjectWithTasksListResponse,
     ProjectCreateResponse,
+    DailyTaskStatsResponse,
+    ProjectStatsResponse,
 )
 
 from .task_responses import (
@@ -11,19 +15,68 @@ from .task_responses import (
     TaskListResponse,
     TaskCreatedResponse,
     TaskStatusUpdateResponse,
+    TaskEventResponse,
+    TaskEventListResponse,
     TaskStatus
 )
 
+from .batch_responses import (
+    BatchOperationResult,
+    BatchResponse,
+)
+
+from .admin_responses import (
+    ProfileResponse,
+    ArmedRouteResponse,
+    ProfileListResponse,
+    SlowQueryResponse,
+    SlowQueryListResponse,
+    JobRunResponse,
+    JobSummaryResponse,
+    JobRunListResponse
+)
+
+from .job_responses import (
+    JobResponse,
+    JobAcceptedResponse,
+    JobStatus
+)
+
 __all__ = [
     # Project responses
     "ProjectResponse",
     "ProjectListResponse",
+    "ProjectWithTasksResponse",
+    "ProjectWithTasksListResponse",
     "ProjectCreateResponse",
+    "DailyTaskStatsResponse",
+    "ProjectStatsResponse",
 
     # Task responses
     "TaskResponse",
     "TaskListResponse",
     "TaskCreatedResponse",
     "TaskStatusUpdateResponse",
+    "TaskEventResponse",
+    "TaskEventListResponse",
     "TaskStatus",
+
+    # Batch responses
+    "BatchOperationResult",
+    "BatchResponse",
+
+    # Admin responses
+    "ProfileResponse",
+    "ArmedRouteResponse",
+    "ProfileListResponse",
+    "SlowQueryResponse",
+    "SlowQueryListResponse",
+    "JobRunResponse",
+    "JobSummaryResponse",
+    "JobRunListResponse",
+
+    # Job responses
+    "JobResponse",
+    "JobAcceptedResponse",
+    "JobStatus",
 ]
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""Pydantic models for admin responses."""
+
+from datetime import datetime
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ProfileResponse(BaseModel):
+    """Metadata of a stored request profile."""
+
+    id: str = Field(..., description="Profile id")
+    method: str = Field(..., description="HTTP method of the profiled request")
+    path: str = Field(..., description="Path of the profiled request")
+    duration_ms: float = Field(..., description="Request duration while profiled")
+    format: str = Field(..., description="Artifact format (pstats or speedscope)")
+    created_at: datetime = Field(..., description="Capture timestamp")
+
+    class Config:
+        from_attributes = True
+
+
+class ArmedRouteResponse(BaseModel):
+    """A route armed for profiling."""
+
+    route: str = Field(..., description="Route template")
+    method: Optional[str] = Field(None, description="HTTP method, any if empty")
+    remaining: int = Field(..., description="Requests still to be profiled")
+
+
+class ProfileListResponse(BaseModel):
+    """Response schema for listing profiles."""
+
+    profiles: List[ProfileResponse] = Field(..., description="Stored profiles, newest first")
+    armed: List[ArmedRouteResponse] = Field(..., description="Routes armed for profiling")
+    count: int = Field(..., description="Number of stored profiles")
+
+
+class SlowQueryResponse(BaseModel):
+    """A statement recorded by the slow query log."""
+
+    statement: str = Field(..., description="SQL statement")
+    parameters: Any = Field(None, description="Bound parameters, with text values redacted")
+    duration_ms: float = Field(..., description="Execution time (slowest seen for top entries)")
+    origin: Optional[str] = Field(None, description="Repository method that issued the statement")
+    recorded_at: datetime = Field(..., description="When the statement ran")
+    count: int = Field(..., description="Times the statement was slow (top entries)")
+    explain: Optional[str] = Field(None, description="EXPLAIN (ANALYZE, BUFFERS) output, if captured")
+
+    class Config:
+        from_attributes = True
+
+
+class SlowQueryListResponse(BaseModel):
+    """Response schema for the slow query log."""
+
+    threshold_ms: float = Field(..., description="Slow query threshold")
+    top: List[SlowQueryResponse] = Field(..., description="Slowest distinct statements")
+    recent: List[SlowQueryResponse] = Field(..., description="Most recent slow statements")
+
+
+class JobRunResponse(BaseModel):
+    """One recorded scheduler job run."""
+
+    id: int = Field(..., description="Run id")
+    job_name: str = Field(..., description="Job name")
+    started_at: datetime = Field(..., description="Start time")
+    duration_ms: float = Field(..., description="Duration (mean duration for compacted rows)")
+    rows_scanned: Optional[int] = Field(None, description="Rows examined")
+    rows_affected: Optional[int] = Field(None, description="Rows changed or deleted")
+    error: Optional[str] = Field(None, description="Error message if the run failed")
+    runs: int = Field(..., description="Number of runs in this row (>1 once compacted)")
+
+    class Config:
+        from_attributes = True
+
+
+class JobSummaryResponse(BaseModel):
+    """Run counts and duration percentiles of one job."""
+
+    job_name: str = Field(..., description="Job name")
+    runs: int = Field(..., description="Runs in the window")
+    errors: int = Field(..., description="Failed runs in the window")
+    last_run_at: datetime = Field(..., description="Start of the latest run")
+    last_error: Optional[str] = Field(None, description="Latest error message")
+    rows_affected: int = Field(..., description="Rows changed or deleted in the window")
+    p50_ms: Optional[float] = Field(None, description="Median duration")
+    p95_ms: Optional[float] = Field(None, description="95th percentile duration")
+    p99_ms: Optional[float] = Field(None, description="99th percentile duration")
+    max_ms: Optional[float] = Field(None, description="Slowest run")
+
+
+class JobRunListResponse(BaseModel):
+    """Response schema for the job run history."""
+
+    window_days: int = Field(..., description="Window of the summaries")
+    jobs: List[JobSummaryResponse] = Field(..., description="Per-job summaries")
+    recent: List[JobRunResponse] = Field(..., description="Most recent runs, newest first")
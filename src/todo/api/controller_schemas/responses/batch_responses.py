@@ -0,0 +1,35 @@
+"""Pydantic models for batch operation responses."""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from ..requests.batch_requests import BatchAction, BatchResource
+
+
+class BatchOperationResult(BaseModel):
+    """Result of a single batch operation."""
+
+    index: int = Field(..., description="Position of the operation in the batch")
+    op: BatchAction = Field(..., description="Operation performed")
+    resource: BatchResource = Field(..., description="Resource the operation targeted")
+    id: int = Field(..., description="Id of the affected resource")
+    ref: Optional[str] = Field(None, description="Reference name given in the request")
+    result: Optional[Dict[str, Any]] = Field(
+        None, description="Resulting resource, omitted for delete operations"
+    )
+
+
+class BatchResponse(BaseModel):
+    """Response schema for a committed batch."""
+
+    results: List[BatchOperationResult] = Field(..., description="Per-operation results")
+    count: int = Field(..., description="Number of operations applied")
+
+    @classmethod
+    def from_results(cls, results: list) -> "BatchResponse":
+        """Helper method to create response from operation results."""
+        return cls(
+            results=results,
+            count=len(results)
+        )
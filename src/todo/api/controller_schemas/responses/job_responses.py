@@ -0,0 +1,34 @@
+"""Pydantic models for background job responses."""
+
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class JobResponse(BaseModel):
+    """Status of a background job."""
+
+    id: int = Field(..., description="Job id")
+    kind: str = Field(..., description="Job kind")
+    status: JobStatus = Field(..., description="Job status")
+    attempts: int = Field(..., description="Attempts made so far")
+    max_attempts: int = Field(..., description="Attempts before the job is marked failed")
+    run_at: datetime = Field(..., description="When the job is (or was last) due to run")
+    created_at: datetime = Field(..., description="Enqueue timestamp")
+    finished_at: Optional[datetime] = Field(None, description="Completion timestamp")
+    result: Any = Field(None, description="Job result, once succeeded")
+    error: Optional[str] = Field(None, description="Error of the latest failed attempt")
+
+    class Config:
+        from_attributes = True
+
+
+class JobAcceptedResponse(BaseModel):
+    """Response schema for an operation queued as a background job."""
+
+    job_id: int = Field(..., description="Job id")
+    status: JobStatus = Field(..., description="Job status")
+    status_url: str = Field(..., description="URL to poll for the job status")
@@ -1,10 +1,12 @@
 """Pydantic models for project-related responses."""
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import List
 
 from pydantic import BaseModel, Field
 
+from .task_responses import TaskResponse
+
 
 class ProjectResponse(BaseModel):
     """Response schema for Project model."""
@@ -33,6 +35,27 @@ class ProjectListResponse(BaseModel):
         )
 
 
+class ProjectWithTasksResponse(ProjectResponse):
+    """Response schema for a project with its tasks embedded."""
+
+    tasks: List[TaskResponse] = Field(..., description="Tasks of the project")
+
+
+class ProjectWithTasksListResponse(BaseModel):
+    """Response schema for listing projects with their tasks embedded."""
+
+    projects: List[ProjectWithTasksResponse] = Field(..., description="List of projects")
+    count: int = Field(..., description="Total number of projects")
+
+    @classmethod
+    def from_projects(cls, projects: list) -> "ProjectWithTasksListResponse":
+        """Helper method to create response from project list."""
+        return cls(
+            projects=projects,
+            count=len(projects)
+        )
+
+
 class ProjectCreateResponse(ProjectResponse):
     """Response schema for project creation."""
 
@@ -42,3 +65,44 @@ class ProjectCreateResponse(ProjectResponse):
     )
 
 
+
+
+class DailyTaskStatsResponse(BaseModel):
+    """Tasks created and closed in a project on one day."""
+
+    day: date = Field(..., description="Day")
+    created: int = Field(..., description="Tasks created that day")
+    closed: int = Field(..., description="Tasks closed that day")
+
+
+class ProjectStatsResponse(BaseModel):
+    """Response schema for a project's daily task throughput."""
+
+    project_id: int = Field(..., description="Project ID")
+    start: date = Field(..., alias="from", description="First day")
+    end: date = Field(..., alias="to", description="Last day")
+    days: List[DailyTaskStatsResponse] = Field(..., description="One entry per day, oldest first")
+    created: int = Field(..., description="Tasks created in the range")
+    closed: int = Field(..., description="Tasks closed in the range")
+
+    @classmethod
+    def from_rollups(cls, project_id: int, start: date, end: date, rollups: list) -> "ProjectStatsResponse":
+        """Helper method to create response from rollup rows, filling days without rows with zeros."""
+        by_day = {rollup.day: rollup for rollup in rollups}
+        days = []
+        for offset in range((end - start).days + 1):
+            day = start + timedelta(days=offset)
+            rollup = by_day.get(day)
+            days.append(DailyTaskStatsResponse(
+                day=day,
+                created=rollup.created if rollup else 0,
+                closed=rollup.closed if rollup else 0,
+            ))
+        return cls(**{
+            "project_id": project_id,
+            "from": start,
+            "to": end,
+            "days": days,
+            "created": sum(day.created for day in days),
+            "closed": sum(day.closed for day in days),
+        })
@@ -1,7 +1,7 @@
 """Pydantic models for task-related responses."""
 
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Literal, Optional, List
 
 from pydantic import BaseModel, Field
 
@@ -55,4 +55,34 @@ class TaskStatusUpdateResponse(BaseModel):
     previous_status: str = Field(..., description="Previous status")
     new_status: str = Field(..., description="New status")
     updated_at: datetime = Field(default_factory=datetime.now, description="Update timestamp")
-    message: str = Field(..., description="Operation message")
\ No newline at end of file
+    message: str = Field(..., description="Operation message")
+
+class TaskEventResponse(BaseModel):
+    """Response schema for one entry of a task's history."""
+
+    id: int = Field(..., description="Event ID")
+    task_id: int = Field(..., description="Task ID")
+    kind: Literal["created", "updated", "status_changed", "deleted", "restored"] = Field(
+        ..., description="What happened to the task"
+    )
+    from_status: Optional[TaskStatus] = Field(None, description="Status before the event")
+    to_status: Optional[TaskStatus] = Field(None, description="Status after the event")
+    occurred_at: datetime = Field(..., description="Event timestamp")
+
+    class Config:
+        from_attributes = True
+
+
+class TaskEventListResponse(BaseModel):
+    """Response schema for a task's history."""
+
+    events: List[TaskEventResponse] = Field(..., description="Events, oldest first")
+    count: int = Field(..., description="Number of events")
+
+    @classmethod
+    def from_events(cls, events: list) -> "TaskEventListResponse":
+        """Helper method to create response from event list."""
+        return cls(
+            events=events,
+            count=len(events)
+        )
@@ -2,6 +2,11 @@
 
 from .projects_controller import router as projects_router
 from .tasks_controller import router as tasks_router
+from .batch_controller import router as batch_router
+from .metrics_controller import router as metrics_router
+from .admin_controller import router as admin_router
+from .health_controller import router as health_router
+from .jobs_controller import router as jobs_router
 
 # Export routers for easy access
-__all__ = ["projects_router", "tasks_router"]
\ No newline at end of file
+__all__ = ["projects_router", "tasks_router", "batch_router", "metrics_router", "admin_router", "health_router", "jobs_router"]
\ No newline at end of file
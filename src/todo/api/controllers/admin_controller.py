@@ -0,0 +1,148 @@
+"""Controller for administrative endpoints (requires X-Admin-Token)."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+
+from todo.db.session import get_session
+from todo.db.slow_query_log import SLOW_QUERIES
+from todo.services.job_run_service import JobRunService
+from todo.observability.profiling import PROFILES
+
+from ..routing import InstrumentedRoute
+
+from ..controller_schemas.requests import ProfileArmRequest
+from ..controller_schemas.responses import (
+    ArmedRouteResponse,
+    JobRunListResponse,
+    JobRunResponse,
+    JobSummaryResponse,
+    ProfileListResponse,
+    ProfileResponse,
+    SlowQueryListResponse,
+    SlowQueryResponse,
+)
+
+# Create router
+router = APIRouter(route_class=InstrumentedRoute)
+
+
+def get_db():
+    """Dependency to get database session."""
+    session = get_session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@router.post(
+    "/profiles/arm",
+    response_model=ProfileListResponse,
+    summary="Profile the next requests of a route",
+    description="Arm a route template so its next `count` requests are profiled."
+)
+def arm_profiling(arm_data: ProfileArmRequest):
+    """Arm a route for profiling."""
+    PROFILES.arm(arm_data.route, arm_data.count, arm_data.method)
+    return list_profiles()
+
+
+@router.delete(
+    "/profiles/arm",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Disarm all routes",
+    description="Stop profiling armed routes."
+)
+def disarm_profiling():
+    """Disarm every armed route."""
+    PROFILES.disarm()
+    return None
+
+
+@router.get(
+    "/profiles",
+    response_model=ProfileListResponse,
+    summary="List profiles",
+    description="List the most recent request profiles and the armed routes."
+)
+def list_profiles():
+    """List stored profiles."""
+    profiles = PROFILES.list()
+    return ProfileListResponse(
+        profiles=[ProfileResponse.model_validate(p) for p in profiles],
+        armed=[ArmedRouteResponse(**a) for a in PROFILES.armed_routes()],
+        count=len(profiles)
+    )
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    response_class=Response,
+    summary="Download a profile",
+    description="Download a profile as a pstats file (cProfile) or speedscope JSON (pyinstrument)."
+)
+def download_profile(profile_id: str):
+    """Download one profile artifact."""
+    artifact = PROFILES.get(profile_id)
+    if artifact is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile with ID {profile_id} not found"
+        )
+    return Response(
+        content=artifact.content,
+        media_type=artifact.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{artifact.filename}"'}
+    )
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueryListResponse,
+    summary="Slow query log",
+    description="Slowest distinct statements and the most recent slow statements of this worker."
+)
+def list_slow_queries(
+    limit: int = Query(20, ge=1, le=1000, description="Maximum entries per list")
+):
+    """List slow statements."""
+    return SlowQueryListResponse(
+        threshold_ms=SLOW_QUERIES.threshold * 1000,
+        top=[SlowQueryResponse.model_validate(q) for q in SLOW_QUERIES.top(limit)],
+        recent=[SlowQueryResponse.model_validate(q) for q in SLOW_QUERIES.recent()[:limit]]
+    )
+
+
+@router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Clear the slow query log",
+    description="Forget all recorded slow statements."
+)
+def clear_slow_queries():
+    """Clear the slow query log."""
+    SLOW_QUERIES.clear()
+    return None
+
+
+@router.get(
+    "/jobs",
+    response_model=JobRunListResponse,
+    summary="Scheduler job runs",
+    description="Recent scheduler job runs and per-job duration percentiles."
+)
+def list_job_runs(
+    job: Optional[str] = Query(None, description="Only this job"),
+    days: int = Query(7, ge=1, le=365, description="Window of the summaries in days"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of recent runs"),
+    db: Session = Depends(get_db)
+):
+    """List job runs."""
+    service = JobRunService(db)
+    return JobRunListResponse(
+        window_days=days,
+        jobs=[JobSummaryResponse(**summary) for summary in service.summarize(days, job)],
+        recent=[JobRunResponse.model_validate(run) for run in service.get_recent_runs(job, limit)]
+    )
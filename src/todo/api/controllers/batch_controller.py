@@ -0,0 +1,118 @@
+"""Controller for transactional batch operations."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import ValidationError as SchemaValidationError
+from sqlalchemy.orm import Session
+
+from todo.db.session import get_session
+from todo.services.batch_service import BatchService
+from todo.exceptions.base import ValidationError
+from todo.exceptions.service_exceptions import (
+    BatchOperationError,
+    ProjectNotFoundError,
+    TaskNotFoundError,
+    ProjectNameExistsError,
+    ProjectLimitExceededError,
+    TaskLimitExceededError,
+)
+
+from ..routing import InstrumentedRoute
+
+from ..controller_schemas.requests import (
+    BatchRequest,
+    ProjectCreateRequest,
+    ProjectUpdateRequest,
+    TaskCreateRequest,
+    TaskUpdateRequest,
+    TaskStatusUpdateRequest,
+)
+from ..controller_schemas.responses import (
+    BatchResponse,
+    BatchOperationResult,
+    ProjectResponse,
+    TaskResponse,
+)
+
+# Create router
+router = APIRouter(route_class=InstrumentedRoute)
+
+# Payload schema for every (resource, op) pair; delete takes no payload
+PAYLOAD_SCHEMAS = {
+    ("project", "create"): ProjectCreateRequest,
+    ("project", "update"): ProjectUpdateRequest,
+    ("task", "create"): TaskCreateRequest,
+    ("task", "update"): TaskUpdateRequest,
+    ("task", "status"): TaskStatusUpdateRequest,
+}
+
+RESPONSE_SCHEMAS = {
+    "project": ProjectResponse,
+    "task": TaskResponse,
+}
+
+
+# Dependency to get database session
+def get_db():
+    """Dependency to get database session."""
+    session = get_session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _error_status(error: Exception) -> int:
+    """Map the error of a failed operation to an HTTP status code."""
+    if isinstance(error, (ProjectNotFoundError, TaskNotFoundError)):
+        return status.HTTP_404_NOT_FOUND
+    if isinstance(error, ProjectNameExistsError):
+        return status.HTTP_409_CONFLICT
+    if isinstance(error, (ProjectLimitExceededError, TaskLimitExceededError, ValidationError)):
+        return status.HTTP_400_BAD_REQUEST
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+@router.post(
+    "",
+    response_model=BatchResponse,
+    summary="Run a batch of operations",
+    description=(
+        "Run an ordered list of project and task operations in one transaction. "
+        "Later operations can reference ids created earlier as '$<ref>'. "
+        "If any operation fails, nothing is applied."
+    ),
+    responses={
+        404: {"description": "Referenced project or task not found"},
+        409: {"description": "Project name already exists"},
+        400: {"description": "Validation error or limit exceeded"},
+        422: {"description": "Invalid operation payload"}
+    }
+)
+def run_batch(batch: BatchRequest, session: Session = Depends(get_db)):
+    """Execute a batch of operations atomically."""
+    # Validate every payload before touching the database
+    operations = []
+    for index, operation in enumerate(batch.operations):
+        schema = PAYLOAD_SCHEMAS.get((operation.resource, operation.op))
+        try:
+            data = schema(**operation.data).model_dump() if schema else {}
+        except SchemaValidationError as e:
+            raise HTTPException(
+                status_code=422,
+                detail={"index": index, "errors": e.errors(include_url=False, include_context=False)}
+            )
+        operations.append(operation.model_copy(update={"data": data}))
+
+    try:
+        service = BatchService(session)
+        results = service.execute(
+            operations,
+            lambda resource, entity: RESPONSE_SCHEMAS[resource].model_validate(entity).model_dump(),
+        )
+    except BatchOperationError as e:
+        raise HTTPException(
+            status_code=_error_status(e.error),
+            detail={"index": e.index, "error": str(e.error)}
+        )
+
+    return BatchResponse.from_results([BatchOperationResult(**result) for result in results])
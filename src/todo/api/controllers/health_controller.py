@@ -0,0 +1,46 @@
+"""Controller for liveness and readiness probes."""
+
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from todo.config import config
+from todo.db.session import engine
+from todo.observability.health import HealthChecker
+
+# Create router
+router = APIRouter(prefix="/health")
+
+# Readiness state of this worker
+health = HealthChecker(
+    engine,
+    probe_interval=config.HEALTH_PROBE_INTERVAL_SECONDS,
+    heartbeat_file=config.SCHEDULER_HEARTBEAT_FILE,
+    max_heartbeat_age=config.SCHEDULER_HEARTBEAT_MAX_AGE_SECONDS,
+)
+
+
+@router.get(
+    "/live",
+    summary="Liveness probe",
+    description="Returns 200 while the process can serve requests. Performs no I/O."
+)
+async def live():
+    """Report that the process is alive."""
+    return {"status": "ok"}
+
+
+@router.get(
+    "/ready",
+    summary="Readiness probe",
+    description=(
+        "Returns 200 when the database answers and the connection pool has room, "
+        "503 otherwise. The database probe result is cached for a short interval."
+    )
+)
+async def ready():
+    """Report whether this worker should receive traffic."""
+    report = await health.check()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if report["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "ok" if report["ready"] else "unavailable", **report}
+    )
@@ -0,0 +1,46 @@
+"""Controller for background job status endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from todo.db.session import get_session
+from todo.services.background_job_service import BackgroundJobService
+from todo.exceptions.service_exceptions import JobNotFoundError
+
+from ..routing import InstrumentedRoute
+
+from ..controller_schemas.responses import JobResponse
+
+# Create router
+router = APIRouter(route_class=InstrumentedRoute)
+
+
+# Dependency to get database session
+def get_db():
+    """Dependency to get database session."""
+    session = get_session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Get job status",
+    description="Retrieve the status and, once finished, the result of a background job.",
+    responses={
+        404: {"description": "Job not found"}
+    }
+)
+def get_job(job_id: int, session: Session = Depends(get_db)):
+    """Get a background job by ID."""
+    try:
+        service = BackgroundJobService(session)
+        return service.get_job(job_id)
+    except JobNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
@@ -0,0 +1,20 @@
+"""Controller exposing application metrics."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from todo.observability.metrics import REGISTRY, CONTENT_TYPE
+
+# Create router
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus metrics",
+    description="Metrics of this worker process in Prometheus text exposition format."
+)
+def metrics():
+    """Render all collected metrics."""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
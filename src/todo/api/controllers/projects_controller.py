@@ -1,26 +1,39 @@
 """Controller for project-related endpoints."""
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from typing import List, Literal, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
 from todo.db.session import get_session
+from todo.exceptions.base import ValidationError
 from todo.services.project_service import ProjectService
 from todo.exceptions.service_exceptions import (
     ProjectNotFoundError,
     ProjectNameExistsError,
-    ProjectLimitExceededError
+    ProjectLimitExceededError,
+    ProjectPurgeInProgressError,
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyMismatchError
 )
 
+from ..background import enqueue_job
+from ..idempotency import get_idempotency_key, run_idempotent
+from ..routing import InstrumentedRoute
+
 from ..controller_schemas.requests import ProjectCreateRequest, ProjectUpdateRequest
 from ..controller_schemas.responses import (
     ProjectResponse,
     ProjectListResponse,
-    ProjectCreateResponse
+    ProjectWithTasksResponse,
+    ProjectWithTasksListResponse,
+    ProjectCreateResponse,
+    ProjectStatsResponse,
+    JobAcceptedResponse
 )
 
 # Create router
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 # Dependency to get database session
 def get_db():
@@ -31,33 +44,59 @@ def get_db():
     finally:
         session.close()
 
+# Query parameter embedding related resources in project responses
+def get_include(
+    include: Optional[Literal["tasks"]] = Query(
+        default=None,
+        description="Embed related resources; 'tasks' embeds each project's tasks"
+    )
+) -> Optional[str]:
+    return include
+
+
 @router.get(
     "/",
-    response_model=ProjectListResponse,
+    response_model=Union[ProjectWithTasksListResponse, ProjectListResponse],
     summary="List all projects",
-    description="Retrieve a list of all projects sorted by creation time."
+    description=(
+        "Retrieve a list of all projects sorted by creation time. "
+        "With include=tasks every project embeds its tasks."
+    )
 )
-def list_projects(session: Session = Depends(get_db)):
+def list_projects(include: Optional[str] = Depends(get_include), session: Session = Depends(get_db)):
     """Get all projects."""
     service = ProjectService(session)
+    if include == "tasks":
+        projects = service.list_projects(include_tasks=True)
+        return ProjectWithTasksListResponse.from_projects(projects)
     projects = service.list_projects()
     return ProjectListResponse.from_projects(projects)
 
 @router.get(
     "/{project_id}",
-    response_model=ProjectResponse,
+    response_model=Union[ProjectWithTasksResponse, ProjectResponse],
     summary="Get project by ID",
-    description="Retrieve details of a specific project by its ID.",
+    description=(
+        "Retrieve details of a specific project by its ID. "
+        "With include=tasks the project embeds its tasks."
+    ),
     responses={
         404: {"description": "Project not found"}
     }
 )
-def get_project(project_id: int, session: Session = Depends(get_db)):
+def get_project(
+    project_id: int,
+    include: Optional[str] = Depends(get_include),
+    session: Session = Depends(get_db)
+):
     """Get a specific project by ID."""
     try:
         service = ProjectService(session)
+        if include == "tasks":
+            project = service.get_project(project_id, include_tasks=True)
+            return ProjectWithTasksResponse.model_validate(project)
         project = service.get_project(project_id)
-        return project
+        return ProjectResponse.model_validate(project)
     except ProjectNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -71,28 +110,51 @@ def get_project(project_id: int, session: Session = Depends(get_db)):
     summary="Create a new project",
     description="Create a new project with a unique name.",
     responses={
-        409: {"description": "Project name already exists"},
-        400: {"description": "Validation error or limit exceeded"}
+        409: {"description": "Project name already exists or Idempotency-Key in use"},
+        400: {"description": "Validation error or limit exceeded"},
+        422: {"description": "Idempotency-Key reused with a different payload"}
     }
 )
 def create_project(
     project_data: ProjectCreateRequest,
+    request: Request,
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
     session: Session = Depends(get_db)
 ):
     """Create a new project."""
     try:
         service = ProjectService(session)
-        project = service.create_project(
-            name=project_data.name,
-            description=project_data.description
-        )
 
-        return ProjectCreateResponse(
-            id=project.id,
-            name=project.name,
-            description=project.description,
-            created_at=project.created_at,
-            message="Project created successfully"
+        def create():
+            project = service.create_project(
+                name=project_data.name,
+                description=project_data.description
+            )
+
+            return ProjectCreateResponse(
+                id=project.id,
+                name=project.name,
+                description=project.description,
+                created_at=project.created_at,
+                message="Project created successfully"
+            )
+
+        if idempotency_key:
+            return run_idempotent(
+                session, idempotency_key, request, project_data,
+                status.HTTP_201_CREATED, create
+            )
+        return create()
+    except IdempotencyKeyInProgressError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except IdempotencyKeyMismatchError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=str(e)
         )
     except ProjectNameExistsError:
         raise HTTPException(
@@ -155,16 +217,28 @@ def update_project(
     "/{project_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a project",
-    description="Delete a project and all its associated tasks.",
+    description=(
+        "Soft-delete a project; it and its tasks disappear at once and are purged "
+        "by a nightly job. With background=true the purge is queued right away "
+        "and 202 is returned with the job's status URL."
+    ),
     responses={
+        202: {"model": JobAcceptedResponse, "description": "Purge queued"},
         404: {"description": "Project not found"}
     }
 )
-def delete_project(project_id: int, session: Session = Depends(get_db)):
+def delete_project(
+    project_id: int,
+    request: Request,
+    background: bool = Query(False, description="Purge in a background job now"),
+    session: Session = Depends(get_db)
+):
     """Delete a project."""
     try:
         service = ProjectService(session)
         service.delete_project(project_id)
+        if background:
+            return enqueue_job(session, request, "project.delete", {"project_id": project_id})
         # No content to return for 204
     except ProjectNotFoundError as e:
         raise HTTPException(
@@ -173,5 +247,90 @@ def delete_project(project_id: int, session: Session = Depends(get_db)):
         )
 
 
+@router.post(
+    "/{project_id}/restore",
+    response_model=ProjectResponse,
+    summary="Restore a deleted project",
+    description="Undo the deletion of a project, with its tasks, before it is purged.",
+    responses={
+        404: {"description": "No deleted project with this ID"},
+        409: {"description": "A live project has taken the name, or a background job is purging the project"},
+        400: {"description": "Project limit exceeded"}
+    }
+)
+def restore_project(project_id: int, session: Session = Depends(get_db)):
+    """Restore a deleted project."""
+    try:
+        project = ProjectService(session).restore_project(project_id)
+        return ProjectResponse.model_validate(project)
+    except ProjectNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except (ProjectNameExistsError, ProjectPurgeInProgressError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except ProjectLimitExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get(
+    "/{project_id}/stats",
+    response_model=ProjectStatsResponse,
+    summary="Project task throughput",
+    description=(
+        "Tasks created and closed per day, read from the daily rollups. "
+        "Defaults to the last 30 days; at most 366 days at once."
+    ),
+    responses={
+        404: {"description": "Project not found"},
+        400: {"description": "Invalid date range"}
+    }
+)
+def get_project_stats(
+    project_id: int,
+    start: Optional[date] = Query(None, alias="from", description="First day (YYYY-MM-DD)"),
+    end: Optional[date] = Query(None, alias="to", description="Last day (YYYY-MM-DD), default today"),
+    session: Session = Depends(get_db)
+):
+    """Get daily task stats of a project."""
+    try:
+        start, end, rollups = ProjectService(session).get_project_stats(project_id, start, end)
+        return ProjectStatsResponse.from_rollups(project_id, start, end, rollups)
+    except ProjectNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 
+@router.post(
+    "/{project_id}/export",
+    response_model=JobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Export a project",
+    description="Queue a background job exporting a project and its tasks; the job result holds the export.",
+    responses={
+        404: {"description": "Project not found"}
+    }
+)
+def export_project(project_id: int, request: Request, session: Session = Depends(get_db)):
+    """Queue a project export."""
+    try:
+        ProjectService(session).get_project(project_id)
+        return enqueue_job(session, request, "project.export", {"project_id": project_id})
+    except ProjectNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
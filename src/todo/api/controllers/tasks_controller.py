@@ -1,33 +1,43 @@
 """Controller for task-related endpoints."""
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Path
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Path, Query
 from sqlalchemy.orm import Session
 
 from todo.db.session import get_session
 from todo.services.task_service import TaskService
+from todo.services.project_service import ProjectService
 from todo.exceptions.service_exceptions import (
     TaskNotFoundError,
     ProjectNotFoundError,
     TaskLimitExceededError,
-    InvalidDeadlineError
+    InvalidDeadlineError,
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyMismatchError
 )
 from todo.exceptions.base import ValidationError
 
+from ..background import enqueue_job
+from ..idempotency import get_idempotency_key, run_idempotent
+from ..routing import InstrumentedRoute
+
 from ..controller_schemas.requests import (
     TaskCreateRequest,
     TaskUpdateRequest,
-    TaskStatusUpdateRequest
+    TaskStatusUpdateRequest,
+    TaskBulkStatusRequest
 )
 from ..controller_schemas.responses import (
     TaskResponse,
     TaskListResponse,
     TaskCreatedResponse,
-    TaskStatusUpdateResponse
+    TaskStatusUpdateResponse,
+    TaskEventListResponse,
+    JobAcceptedResponse
 )
 
 # Create router
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 # Dependency to get database session (همون پروژه‌ها)
@@ -50,23 +60,30 @@ def validate_task_id(task_id: int = Path(..., gt=0, description="Task ID must be
     return task_id
 
 
+def get_include_archived(
+    include_archived: bool = Query(False, description="Also return tasks moved to the archive")
+):
+    return include_archived
+
+
 @router.get(
     "/projects/{project_id}/tasks",
     response_model=TaskListResponse,
     summary="List tasks in a project",
-    description="Retrieve all tasks belonging to a specific project.",
+    description="Retrieve all tasks belonging to a specific project, archived ones too with `include_archived`.",
     responses={
         404: {"description": "Project not found"}
     }
 )
 def list_tasks(
         project_id: int = Depends(validate_project_id),
+        include_archived: bool = Depends(get_include_archived),
         session: Session = Depends(get_db)
 ):
     """Get all tasks in a project."""
     try:
         service = TaskService(session)
-        tasks = service.list_tasks(project_id)
+        tasks = service.list_tasks(project_id, include_archived)
         return TaskListResponse.from_tasks(tasks)
     except ProjectNotFoundError as e:
         raise HTTPException(
@@ -87,12 +104,13 @@ def list_tasks(
 def get_task(
     project_id: int = Depends(validate_project_id),
     task_id: int = Depends(validate_task_id),
+    include_archived: bool = Depends(get_include_archived),
     session: Session = Depends(get_db)
 ):
     """Get a specific task by ID within a project."""
     try:
         service = TaskService(session)
-        task = service.get_task(project_id, task_id)
+        task = service.get_task(project_id, task_id, include_archived)
         return task
     except (TaskNotFoundError, ProjectNotFoundError) as e:
         raise HTTPException(
@@ -101,6 +119,32 @@ def get_task(
         )
 
 
+@router.get(
+    "/projects/{project_id}/tasks/{task_id}/events",
+    response_model=TaskEventListResponse,
+    summary="Get task history",
+    description="Retrieve the events of a task (creation, edits, status changes, deletion), oldest first.",
+    responses={
+        404: {"description": "Task or project not found"}
+    }
+)
+def get_task_events(
+    project_id: int = Depends(validate_project_id),
+    task_id: int = Depends(validate_task_id),
+    session: Session = Depends(get_db)
+):
+    """Get the history of a task."""
+    try:
+        service = TaskService(session)
+        events = service.get_task_history(project_id, task_id)
+        return TaskEventListResponse.from_events(events)
+    except (TaskNotFoundError, ProjectNotFoundError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
 @router.post(
     "/projects/{project_id}/tasks",
     response_model=TaskCreatedResponse,
@@ -110,34 +154,57 @@ def get_task(
     responses={
         404: {"description": "Project not found"},
         400: {"description": "Validation error or task limit exceeded"},
-        422: {"description": "Invalid input data"}
+        409: {"description": "Idempotency-Key in use"},
+        422: {"description": "Invalid input data or Idempotency-Key reused with a different payload"}
     }
 )
 def create_task(
+        request: Request,
         project_id: int = Depends(validate_project_id),
         task_data: TaskCreateRequest = ...,
+        idempotency_key: Optional[str] = Depends(get_idempotency_key),
         session: Session = Depends(get_db)
 ):
     """Create a new task in a project."""
     try:
         service = TaskService(session)
-        task = service.create_task(
-            project_id=project_id,
-            title=task_data.title,
-            description=task_data.description,
-            status=task_data.status,
-            deadline=task_data.deadline
+
+        def create():
+            task = service.create_task(
+                project_id=project_id,
+                title=task_data.title,
+                description=task_data.description,
+                status=task_data.status,
+                deadline=task_data.deadline
+            )
+            return TaskCreatedResponse(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                status=task.status,
+                deadline=task.deadline,
+                created_at=task.created_at,
+                closed_at=task.closed_at,
+                project_id=task.project_id,
+                message="Task created successfully"
+            )
+
+        if idempotency_key:
+            return run_idempotent(
+                session, idempotency_key, request, task_data,
+                status.HTTP_201_CREATED, create
+            )
+        return create()
+    except IdempotencyKeyInProgressError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+            headers={"Retry-After": "1"}
         )
-        return TaskCreatedResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            deadline=task.deadline,
-            created_at=task.created_at,
-            closed_at=task.closed_at,
-            project_id=task.project_id,
-            message="Task created successfully"
+    except IdempotencyKeyMismatchError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=str(e)
         )
     except ProjectNotFoundError as e:
         raise HTTPException(
@@ -258,4 +325,66 @@ def delete_task(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
-        )
\ No newline at end of file
+        )
+
+
+@router.post(
+    "/projects/{project_id}/tasks/{task_id}/restore",
+    response_model=TaskResponse,
+    summary="Restore a deleted task",
+    description="Undo the deletion of a task before it is purged.",
+    responses={
+        404: {"description": "Project or deleted task not found"},
+        400: {"description": "Task limit exceeded"}
+    }
+)
+def restore_task(
+        project_id: int = Depends(validate_project_id),
+        task_id: int = Depends(validate_task_id),
+        session: Session = Depends(get_db)
+):
+    """Restore a deleted task."""
+    try:
+        service = TaskService(session)
+        return service.restore_task(project_id, task_id)
+    except (TaskNotFoundError, ProjectNotFoundError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except TaskLimitExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.post(
+    "/projects/{project_id}/tasks/bulk-status",
+    response_model=JobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Change the status of many tasks",
+    description="Queue a background job setting the status of all (or the listed) tasks of a project.",
+    responses={
+        404: {"description": "Project not found"}
+    }
+)
+def bulk_update_task_status(
+        status_data: TaskBulkStatusRequest,
+        request: Request,
+        project_id: int = Depends(validate_project_id),
+        session: Session = Depends(get_db)
+):
+    """Queue a bulk status change."""
+    try:
+        ProjectService(session).get_project(project_id)
+        return enqueue_job(session, request, "tasks.bulk_status", {
+            "project_id": project_id,
+            "status": status_data.status,
+            "task_ids": status_data.task_ids,
+        })
+    except ProjectNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
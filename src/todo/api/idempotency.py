@@ -0,0 +1,55 @@
+"""Helpers for honouring the Idempotency-Key header on POST endpoints."""
+
+from typing import Callable, Optional
+
+from fastapi import Header, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from todo.services.idempotency_service import IdempotencyService
+
+
+def get_idempotency_key(
+    idempotency_key: Optional[str] = Header(
+        default=None,
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=255,
+        description="Client-generated key; retries with the same key replay the first response",
+    )
+) -> Optional[str]:
+    """Dependency reading the optional Idempotency-Key header."""
+    return idempotency_key
+
+
+def run_idempotent(
+    session: Session,
+    key: str,
+    request: Request,
+    payload: BaseModel,
+    status_code: int,
+    handler: Callable[[], BaseModel],
+) -> JSONResponse:
+    """
+    Run ``handler`` at most once per key and endpoint.
+
+    Retries with the same key and payload get the stored response back
+    without touching the write path.
+
+    Raises:
+        IdempotencyKeyMismatchError: If the key was used with another payload.
+        IdempotencyKeyInProgressError: If the first request is still running.
+    """
+    service = IdempotencyService(session)
+    result = service.run(
+        key=key,
+        scope=f"{request.method} {request.url.path}",
+        request_hash=service.fingerprint(payload.model_dump(mode="json")),
+        status_code=status_code,
+        handler=lambda: jsonable_encoder(handler()),
+    )
+
+    headers = {"Idempotency-Replayed": "true"} if result.replayed else None
+    return JSONResponse(status_code=result.status_code, content=result.body, headers=headers)
@@ -5,10 +5,54 @@ Run with:
     uvicorn todo.api.main:app --reload
 """
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
+from todo.config import config
+from todo.commands.scheduler import scheduler
+
+from todo.db.session import pool_capacity
+from todo.observability import log, profiling, tracing
+from todo.observability.metrics import REGISTRY
+
+from .middleware import (
+    RateLimitMiddleware,
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitMiddleware,
+    MetricsMiddleware,
+    ServerTimingMiddleware,
+    TracingMiddleware,
+    ProfilingMiddleware,
+)
+from .controllers import health_controller, metrics_controller
+from .middleware.rate_limit import InMemoryTokenBucketStore, RedisTokenBucketStore
 from .routers import api_router
+from .warmup import warm_up
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the worker before it accepts requests; run the scheduler if in-process."""
+    if config.WARMUP_ENABLED:
+        health_controller.health.ready = False
+        await run_in_threadpool(warm_up, app)
+        health_controller.health.ready = True
+
+    scheduler_task = None
+    if config.SCHEDULER_IN_PROCESS:
+        scheduler_task = asyncio.create_task(scheduler.run_in_process(), name="scheduler")
+
+    yield
+
+    if scheduler_task is not None:
+        await scheduler.stop_in_process(scheduler_task, timeout=config.SERVER_GRACEFUL_TIMEOUT)
 
 
 def create_application() -> FastAPI:
@@ -18,6 +62,9 @@ def create_application() -> FastAPI:
     Returns:
         FastAPI: Configured application instance
     """
+    # Structured logs go through a queue to a writer thread
+    log.configure_from_env(config)
+
     app = FastAPI(
         title="ToDo List API",
         description=(
@@ -25,9 +72,49 @@ def create_application() -> FastAPI:
             "This is Phase 3 of the ToDo List project, replacing the CLI interface."
         ),
         version="1.0.0",
-        docs_url="/docs"
+        docs_url="/docs",
+        lifespan=lifespan
     )
 
+    # Add on-demand profiling; admin-only, so not installed without a token
+    if config.ADMIN_TOKEN:
+        app.add_middleware(
+            ProfilingMiddleware,
+            store=profiling.PROFILES,
+            use_pyinstrument=config.PROFILER == "pyinstrument",
+        )
+
+    # Add opt-in Server-Timing breakdown (X-Debug-Timing header or sampling)
+    app.add_middleware(ServerTimingMiddleware, sample_rate=config.SERVER_TIMING_SAMPLE_RATE)
+
+    # Add adaptive admission control sized to the DB pool
+    if config.CONCURRENCY_LIMIT_ENABLED:
+        capacity = pool_capacity()
+        app.state.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=capacity,
+            min_limit=1,
+            max_limit=max(1, int(capacity * config.CONCURRENCY_MAX_MULTIPLIER)),
+            target_latency=config.CONCURRENCY_TARGET_LATENCY_MS / 1000,
+        )
+        app.add_middleware(ConcurrencyLimitMiddleware, limiter=app.state.concurrency_limiter)
+
+    # Add per-client rate limiting (inside CORS so 429s carry CORS headers)
+    if config.RATE_LIMIT_ENABLED:
+        if config.RATE_LIMIT_BACKEND == "redis":
+            store = RedisTokenBucketStore(config.RATE_LIMIT_REDIS_URL)
+        else:
+            store = InMemoryTokenBucketStore()
+        app.add_middleware(
+            RateLimitMiddleware,
+            capacity=config.RATE_LIMIT_CAPACITY,
+            refill_rate=config.RATE_LIMIT_REFILL_PER_SECOND,
+            store=store,
+            key_header=config.RATE_LIMIT_KEY_HEADER or None,
+            trusted_proxies=tuple(
+                proxy.strip() for proxy in config.RATE_LIMIT_TRUSTED_PROXIES.split(",") if proxy.strip()
+            ),
+        )
+
     # Add CORS middleware
     # In production, you should restrict origins
     app.add_middleware(
@@ -38,8 +125,26 @@ def create_application() -> FastAPI:
         allow_headers=["*"],  # Allows all headers
     )
 
+    # Start a server span per sampled request, continuing incoming traceparents
+    tracing.configure_from_env(config)
+    if tracing.is_enabled():
+        app.add_middleware(TracingMiddleware)
+
+    # Record request metrics outermost (added last) so shed and rate-limited
+    # requests count too, and the measured latency includes tracing
+    if config.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_controller.router, tags=["Monitoring"])
+
+        if config.CONCURRENCY_LIMIT_ENABLED:
+            limiter = app.state.concurrency_limiter
+            REGISTRY.gauge(
+                "todo_concurrency_limit", "Current adaptive in-flight request limit."
+            ).set_function(lambda: {(): limiter.limit})
+
     # Include API routes
     app.include_router(api_router)
+    app.include_router(health_controller.router, tags=["Monitoring"])
 
     return app
 
@@ -64,6 +169,10 @@ def root():
             "projects": "/api/v1/projects",
             "tasks": "/api/v1/tasks",
         },
+        "health": {
+            "liveness": "/health/live",
+            "readiness": "/health/ready"
+        },
         "documentation": {
             "swagger_ui": "/docs"
         },
@@ -84,7 +193,11 @@ def api_info():
         "base_path": "/api/v1",
         "available_resources": ["projects", "tasks"],
         "authentication": "None (public API for now)",
-        "rate_limiting": "None"
+        "rate_limiting": (
+            f"Token bucket per client: {config.RATE_LIMIT_CAPACITY:g} tokens, "
+            f"refilled at {config.RATE_LIMIT_REFILL_PER_SECOND:g}/s"
+            if config.RATE_LIMIT_ENABLED else "None"
+        )
     }
 
 
@@ -99,27 +212,19 @@ def run_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False):
     """
     import uvicorn
 
-    print("🚀 Starting ToDo List API Server...")
-    print(f"   URL: http://{host}:{port}")
-    print(f"   Docs: http://{host}:{port}/docs")
-    print("\n📋 Available Endpoints:")
-    print("   • GET  /                    - API information")
-    print("   • GET  /api                 - API configuration")
-    print("   • GET  /api/v1/projects     - List projects")
-    print("   • POST /api/v1/projects     - Create project")
-    print("   • GET  /api/v1/projects/{id} - Get project")
-    print("   • PUT  /api/v1/projects/{id} - Update project")
-    print("   • DEL  /api/v1/projects/{id} - Delete project")
-    print("   • GET  /api/v1/tasks        - List tasks (with project_id query)")
-    print("   • POST /api/v1/tasks        - Create task")
-    print("\n⚡ Press Ctrl+C to stop the server")
+    logger.info("Starting ToDo List API Server", extra={
+        "url": f"http://{host}:{port}",
+        "docs": f"http://{host}:{port}/docs",
+        "reload": reload,
+    })
 
     uvicorn.run(
         "todo.api.main:app",
         host=host,
         port=port,
         reload=reload,
-        log_level="info"
+        log_level="info",
+        log_config=None
     )
 
 
@@ -0,0 +1,18 @@
+"""ASGI middleware for the API application."""
+
+from .rate_limit import RateLimitMiddleware
+from .concurrency import AdaptiveConcurrencyLimiter, ConcurrencyLimitMiddleware
+from .metrics import MetricsMiddleware
+from .server_timing import ServerTimingMiddleware
+from .tracing import TracingMiddleware
+from .profiling import ProfilingMiddleware
+
+__all__ = [
+    "RateLimitMiddleware",
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyLimitMiddleware",
+    "MetricsMiddleware",
+    "ServerTimingMiddleware",
+    "TracingMiddleware",
+    "ProfilingMiddleware",
+]
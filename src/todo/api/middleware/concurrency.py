@@ -0,0 +1,108 @@
+"""Adaptive admission control sized to the database pool."""
+
+import time
+from typing import Tuple
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .rate_limit import DEFAULT_EXEMPT_PATHS
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD-adjusted limit on requests in flight.
+
+    While the smoothed request latency stays under ``target_latency`` the
+    limit grows additively (about +1 per ``limit`` completions); when it
+    exceeds the target the limit is cut multiplicatively, at most once per
+    target interval. All methods run on the event loop thread, so no
+    locking is needed.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        target_latency: float,
+        backoff: float = 0.9,
+        smoothing: float = 0.2,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.target_latency = target_latency
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self.shed_count = 0
+        self.latency = 0.0
+        self._last_decrease = 0.0
+
+    def try_acquire(self) -> bool:
+        """Admit a request if the current limit allows it."""
+        if self.in_flight >= int(self.limit):
+            self.shed_count += 1
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, latency: float) -> None:
+        """Record a finished request and adjust the limit."""
+        self.in_flight -= 1
+        self.latency += self.smoothing * (latency - self.latency)
+
+        if self.latency > self.target_latency:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.target_latency:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = now
+        elif self.in_flight >= int(self.limit) - 1:
+            # Only grow when the limit is actually what constrains us
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Shed load with ``503`` when more requests are in flight than allowed.
+
+    Rejecting early keeps excess requests from piling up on the database
+    pool checkout, where they would time out slowly and drag every other
+    request down with them.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: AdaptiveConcurrencyLimiter,
+        exempt_paths: Tuple[str, ...] = DEFAULT_EXEMPT_PATHS,
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.exempt_paths = exempt_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path in self.exempt_paths or path.startswith(("/health/", "/docs/")):
+            await self.app(scope, receive, send)
+            return
+
+        if not self.limiter.try_acquire():
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "Server is overloaded, retry later"},
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.limiter.release(time.perf_counter() - start)
@@ -0,0 +1,61 @@
+"""Request count, latency and in-flight metrics per route template."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from todo.observability.metrics import REGISTRY
+
+REQUESTS = REGISTRY.counter(
+    "todo_http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ("method", "route", "status"),
+)
+REQUEST_DURATION = REGISTRY.histogram(
+    "todo_http_request_duration_seconds",
+    "HTTP request latency by method and route template.",
+    ("method", "route"),
+)
+REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "todo_http_requests_in_flight",
+    "HTTP requests currently being processed.",
+)
+
+
+class MetricsMiddleware:
+    """
+    Record every HTTP request in the metrics registry.
+
+    Requests are labelled with the route template (``/api/v1/projects/{project_id}``)
+    rather than the raw path to keep label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            REQUESTS_IN_FLIGHT.dec()
+
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "<unmatched>"
+            method = scope["method"]
+            REQUESTS.inc(method, template, str(status_code))
+            REQUEST_DURATION.observe(duration, method, template)
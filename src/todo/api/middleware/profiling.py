@@ -0,0 +1,64 @@
+"""Profile selected requests on demand."""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from todo.observability import profiling
+
+from ..security import verify_admin_token
+
+
+class ProfilingMiddleware:
+    """
+    Run a request under a profiler when it sends ``X-Profile: 1`` with a
+    valid ``X-Admin-Token``, or when its route was armed through the admin
+    API. The profile id is returned in ``X-Profile-Id``.
+
+    Only installed when an admin token is configured.
+    """
+
+    def __init__(self, app: ASGIApp, store: profiling.ProfileStore, use_pyinstrument: bool = False):
+        self.app = app
+        self.store = store
+        self.use_pyinstrument = use_pyinstrument
+
+    def _requested(self, scope: Scope) -> bool:
+        wants_profile = False
+        token = None
+        for name, value in scope["headers"]:
+            if name == b"x-profile":
+                wants_profile = value not in (b"0", b"false")
+            elif name == b"x-admin-token":
+                token = value.decode("latin-1")
+        return wants_profile and verify_admin_token(token)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method, path = scope["method"], scope["path"]
+        if not self._requested(scope) and not (self.store.armed and self.store.claim(method, path)):
+            await self.app(scope, receive, send)
+            return
+
+        session = profiling.ProfileSession(self.store.next_id(), self.use_pyinstrument)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", session.profile_id)
+            await send(message)
+
+        token = profiling.activate(session)
+        start = time.perf_counter()
+        session.start_loop()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            session.stop_loop()
+            profiling.deactivate(token)
+            artifact = session.finish(method, path, time.perf_counter() - start)
+            if artifact is not None:
+                self.store.add(artifact)
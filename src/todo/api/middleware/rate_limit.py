@@ -0,0 +1,218 @@
+"""Per-client token bucket rate limiting."""
+
+import ipaddress
+import logging
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# (method or "*", path pattern, cost); first match wins
+DEFAULT_ROUTE_COSTS: List[Tuple[str, str, float]] = [
+    ("GET", r"^/api/v1/projects/?$", 5),
+    ("GET", r"^/api/v1/projects/\d+/tasks/?$", 5),
+    ("POST", r"^/api/v1/batch/?$", 10),
+    ("GET", r".*", 1),
+    ("*", r".*", 2),
+]
+
+# Paths that are never limited (probes, docs, metrics)
+DEFAULT_EXEMPT_PATHS: Tuple[str, ...] = ("/", "/api", "/docs", "/openapi.json", "/health", "/metrics")
+
+
+class InMemoryTokenBucketStore:
+    """
+    Token buckets kept in process memory; limits apply per worker.
+
+    At most ``max_keys`` buckets are kept. The least recently used one is
+    dropped to make room; it has usually refilled already, and at worst
+    its client starts over with a full bucket.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def take(self, key: str, cost: float, capacity: float, rate: float) -> Tuple[bool, float]:
+        """Take ``cost`` tokens; return ``(allowed, seconds until allowed)``."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                while len(self._buckets) >= self.max_keys:
+                    self._buckets.popitem(last=False)
+                bucket = self._buckets[key] = [capacity, now]
+            else:
+                self._buckets.move_to_end(key)
+
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if tokens >= cost:
+                bucket[0] = tokens - cost
+                return True, 0.0
+            bucket[0] = tokens
+            return False, (cost - tokens) / rate
+
+
+class RedisTokenBucketStore:
+    """Token buckets shared by all workers through Redis."""
+
+    SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local cost = tonumber(ARGV[3])
+    local t = redis.call('TIME')
+    local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    local allowed = 0
+    local retry = 0
+    if tokens >= cost then
+        tokens = tokens - cost
+        allowed = 1
+    else
+        retry = (cost - tokens) / rate
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return {allowed, tostring(retry)}
+    """
+
+    def __init__(self, url: str, prefix: str = "todo:ratelimit:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the 'redis' package") from e
+
+        self.prefix = prefix
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    async def take(self, key: str, cost: float, capacity: float, rate: float) -> Tuple[bool, float]:
+        """Take ``cost`` tokens; return ``(allowed, seconds until allowed)``."""
+        try:
+            allowed, retry = await self._script(keys=[self.prefix + key], args=[capacity, rate, cost])
+        except Exception as e:
+            # Fail open: a broken limiter must not take the API down
+            logger.warning("Rate limit backend unavailable: %s", e)
+            return True, 0.0
+        return bool(allowed), float(retry)
+
+
+class RateLimitMiddleware:
+    """
+    Limit request rate per client with token buckets.
+
+    Every client key (its IP address, or the value of ``key_header`` when
+    set) owns a bucket of ``capacity`` tokens refilled at ``refill_rate``
+    tokens per second. Clients can send any header, so ``key_header`` is
+    only honoured on connections from ``trusted_proxies`` (addresses or
+    networks of the proxies that set it); other requests are keyed by IP.
+    Each request costs tokens according to its route, so list endpoints
+    drain the bucket faster than single-resource reads. A route costing
+    more than ``capacity`` could never be admitted and is rejected up
+    front. Requests that find the bucket empty get ``429`` with
+    ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        capacity: float,
+        refill_rate: float,
+        store=None,
+        key_header: Optional[str] = None,
+        trusted_proxies: Tuple[str, ...] = (),
+        route_costs: Optional[List[Tuple[str, str, float]]] = None,
+        exempt_paths: Tuple[str, ...] = DEFAULT_EXEMPT_PATHS,
+    ):
+        self.app = app
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.store = store or InMemoryTokenBucketStore()
+        self.key_header = key_header.lower().encode() if key_header else None
+        self.trusted_proxies = [ipaddress.ip_network(proxy, strict=False) for proxy in trusted_proxies]
+        if self.key_header and not self.trusted_proxies:
+            logger.warning("Rate limit key header ignored: no trusted proxies configured")
+        self.exempt_paths = exempt_paths
+        self.route_costs: List[Tuple[str, Pattern, float]] = [
+            (method, re.compile(pattern), cost)
+            for method, pattern, cost in (route_costs or DEFAULT_ROUTE_COSTS)
+        ]
+        self._cost_cache: Dict[Tuple[str, str], float] = {}
+        if refill_rate <= 0:
+            raise ValueError("Rate limit refill rate must be positive")
+        # Unmatched routes cost 1
+        if capacity < 1:
+            raise ValueError(f"Rate limit capacity {capacity:g} is below the cost of a request")
+        for method, pattern, cost in self.route_costs:
+            if cost > capacity:
+                raise ValueError(
+                    f"Rate limit cost {cost:g} of {method} {pattern.pattern} exceeds the capacity {capacity:g}"
+                )
+
+    def _cost(self, method: str, path: str) -> float:
+        """Return the token cost of a request."""
+        cost = self._cost_cache.get((method, path))
+        if cost is None:
+            cost = next(
+                (c for m, pattern, c in self.route_costs
+                 if m in ("*", method) and pattern.match(path)),
+                1,
+            )
+            if len(self._cost_cache) < 10_000:
+                self._cost_cache[(method, path)] = cost
+        return cost
+
+    def _trusted(self, host: str) -> bool:
+        """Whether ``host`` is one of the proxies allowed to set ``key_header``."""
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return False
+        return any(address in network for network in self.trusted_proxies)
+
+    def _client_key(self, scope: Scope) -> str:
+        """Return the bucket key identifying the caller."""
+        client = scope.get("client")
+        host = client[0] if client else "unknown"
+        if self.key_header and self.trusted_proxies and self._trusted(host):
+            for name, value in scope["headers"]:
+                if name == self.key_header:
+                    return "key:" + value.decode("latin-1")
+        return "ip:" + host
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path in self.exempt_paths or path.startswith(("/health/", "/docs/")):
+            await self.app(scope, receive, send)
+            return
+
+        cost = self._cost(scope["method"], path)
+        allowed, retry_after = await self.store.take(
+            self._client_key(scope), cost, self.capacity, self.refill_rate
+        )
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse(
+            status_code=429,
+            content={"detail": "Rate limit exceeded"},
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,49 @@
+"""Opt-in Server-Timing response header."""
+
+import random
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from todo.observability import timing
+
+
+class ServerTimingMiddleware:
+    """
+    Attach a ``Server-Timing`` header breaking the request into phases.
+
+    Timing is collected when the request carries ``debug_header`` or when
+    it is picked by ``sample_rate``; other requests pay almost nothing.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 0.0, debug_header: str = "X-Debug-Timing"):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.debug_header = debug_header.lower().encode()
+
+    def _enabled(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == self.debug_header:
+                return value not in (b"0", b"false")
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._enabled(scope):
+            await self.app(scope, receive, send)
+            return
+
+        collector = timing.ServerTiming()
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", collector.header_value(time.perf_counter() - start))
+            await send(message)
+
+        token = timing.activate(collector)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            timing.deactivate(token)
@@ -0,0 +1,53 @@
+"""Server spans for incoming HTTP requests."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from todo.observability import tracing
+
+
+class TracingMiddleware:
+    """
+    Start a server span per request, continuing the caller's trace when a
+    ``traceparent`` header is present. Unsampled requests create no spans.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        method = scope["method"]
+        root = tracing.start_root_span(
+            f"{method} {scope['path']}",
+            traceparent=traceparent,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        )
+        if root is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                root.set_attribute("http.response.status_code", status_code)
+                if status_code >= 500:
+                    root.status = tracing.STATUS_ERROR
+            await send(message)
+
+        with tracing.activate(root):
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    root.name = f"{method} {route.path}"
+                    root.set_attribute("http.route", route.path)
@@ -1,8 +1,15 @@
 """API router definitions for the TodoList application."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from .controllers import projects_controller, tasks_controller
+from .controllers import (
+    projects_controller,
+    tasks_controller,
+    batch_controller,
+    jobs_controller,
+    admin_controller,
+)
+from .security import require_admin
 
 # Create main API router with version prefix
 api_router = APIRouter(prefix="/api/v1")
@@ -20,3 +27,24 @@ api_router.include_router(
     tags=["Tasks"],
 )
 
+# Register batch routes
+api_router.include_router(
+    batch_controller.router,
+    prefix="/batch",
+    tags=["Batch"],
+)
+
+# Register background job routes
+api_router.include_router(
+    jobs_controller.router,
+    prefix="/jobs",
+    tags=["Jobs"],
+)
+
+# Register admin routes
+api_router.include_router(
+    admin_controller.router,
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin)],
+)
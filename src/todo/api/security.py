@@ -0,0 +1,31 @@
+"""Access control for administrative endpoints."""
+
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from todo.config import config
+
+
+def verify_admin_token(token: Optional[str]) -> bool:
+    """Return True if ``token`` matches the configured ADMIN_TOKEN."""
+    if not config.ADMIN_TOKEN or not token:
+        return False
+    return secrets.compare_digest(token.encode(), config.ADMIN_TOKEN.encode())
+
+
+def require_admin(
+    admin_token: Optional[str] = Header(default=None, alias="X-Admin-Token")
+) -> None:
+    """Dependency rejecting requests without a valid admin token."""
+    if not config.ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin API is disabled; set ADMIN_TOKEN to enable it"
+        )
+    if not verify_admin_token(admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing admin token"
+        )
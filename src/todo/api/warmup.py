@@ -0,0 +1,93 @@
+"""
+Startup warmup so the first requests after a deploy do not pay one-off costs.
+
+Runs once per worker before it accepts traffic:
+
+* opens ``pool_size`` connections so requests find them established,
+* configures the ORM mappers,
+* runs the read queries of the repositories with ids that match no rows,
+  which fills SQLAlchemy's compiled statement cache,
+* builds the response model serializers and the OpenAPI schema.
+"""
+
+import logging
+import time
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
+
+from todo.db.session import engine, get_session
+from todo.repositories.background_job_repository import BackgroundJobRepository
+from todo.repositories.project_repository import ProjectRepository
+from todo.repositories.task_repository import TaskRepository
+
+from .controller_schemas import responses
+
+logger = logging.getLogger(__name__)
+
+# Id that matches no row; only used to compile statements
+_NO_ROW = 0
+
+
+def warm_pool() -> int:
+    """Open the pool's steady-state connections at once, then return them."""
+    pool = engine.pool
+    size = pool.size() if hasattr(pool, "size") else 1
+    connections = []
+    try:
+        for _ in range(size):
+            conn = engine.connect()
+            connections.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in connections:
+            conn.close()
+    return len(connections)
+
+
+def warm_queries() -> None:
+    """Compile and cache the repository read statements."""
+    session = get_session()
+    try:
+        projects = ProjectRepository(session)
+        projects.get_by_id(_NO_ROW)
+        projects.get_by_name("")
+        projects.get_project_count()
+
+        tasks = TaskRepository(session)
+        tasks.get_by_id(_NO_ROW)
+        tasks.get_by_project_id(_NO_ROW)
+        tasks.get_task_count_by_project(_NO_ROW)
+
+        BackgroundJobRepository(session).get_by_id(_NO_ROW)
+    finally:
+        session.rollback()
+        session.close()
+
+
+def warm_schemas(app: FastAPI) -> None:
+    """Build response model schemas and the OpenAPI document."""
+    for name in responses.__all__:
+        model = getattr(responses, name)
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            model.model_json_schema()
+    app.openapi()
+
+
+def warm_up(app: FastAPI) -> None:
+    """Run every warmup step; failures are logged and do not block startup."""
+    start = time.perf_counter()
+    configure_mappers()
+    warm_schemas(app)
+    try:
+        connections = warm_pool()
+        warm_queries()
+    except Exception as e:
+        logger.warning("Database warmup failed: %s", e)
+        return
+    logger.info(
+        "Warmup finished in %.0f ms (%d connections opened)",
+        (time.perf_counter() - start) * 1000, connections
+    )
@@ -0,0 +1,65 @@
+"""Command to move long closed tasks to the archive table."""
+
+import logging
+from datetime import datetime, timedelta
+
+from todo.config import config
+from todo.db.locks import JobLock, job_lock
+from todo.db.session import get_session
+from todo.observability import log
+from todo.repositories.task_archive_repository import TaskArchiveRepository
+
+from .job_runs import JobRunStats, track_job_run
+
+logger = logging.getLogger(__name__)
+
+
+def archive_closed_tasks():
+    """
+    Move tasks done for more than ``TASK_ARCHIVE_AFTER_DAYS`` days from
+    ``tasks`` to ``tasks_archive``, keeping the hot table and its indexes small.
+    """
+    with job_lock("archive_closed_tasks") as lock:
+        if not lock.held:
+            logger.info("Archive of closed tasks is running on another instance; skipped")
+            return 0
+        with track_job_run("archive_closed_tasks") as run:
+            return _archive_closed_tasks(lock, run)
+
+
+def _archive_closed_tasks(lock: JobLock, run: JobRunStats):
+    """Archive closed tasks in batches in a new session."""
+    session = get_session()
+    closed_before = datetime.now() - timedelta(days=config.TASK_ARCHIVE_AFTER_DAYS)
+
+    def on_batch(archived: int) -> bool:
+        run.add(archived, archived)
+        return lock.renew()
+
+    try:
+        archived_count = TaskArchiveRepository(session).archive_closed(
+            closed_before, config.SCHEDULER_BATCH_SIZE, on_batch=on_batch
+        )
+        logger.info(
+            "Archived closed tasks",
+            extra={"archived": archived_count, "closed_before": closed_before.isoformat(timespec="seconds")},
+        )
+        return archived_count
+
+    except Exception as e:
+        logger.exception("Archive of closed tasks failed")
+        run.error = str(e)
+        session.rollback()
+        return 0
+    finally:
+        session.close()
+
+
+def main():
+    """Entry point for command line execution."""
+    log.configure_from_env(config)
+    return archive_closed_tasks()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,60 +1,153 @@
 """Command to auto-close overdue tasks."""
 
-from datetime import datetime
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from todo.config import config
+from todo.db.locks import JobLock, job_lock
 from todo.db.session import get_session
+from todo.observability import log, tracing
+from todo.observability.metrics import REGISTRY
+from todo.repositories.job_watermark_repository import JobWatermarkRepository
 from todo.repositories.task_repository import TaskRepository
 
+from .job_runs import JobRunStats, track_job_run
+
+logger = logging.getLogger(__name__)
+
+JOB_RUNS = REGISTRY.counter(
+    "todo_job_runs_total",
+    "Scheduled job runs by job name and outcome.",
+    ("job", "outcome"),
+)
+TASKS_AUTOCLOSED = REGISTRY.counter(
+    "todo_autoclose_tasks_closed_total",
+    "Overdue tasks closed by the autoclose job.",
+)
+
 
 def autoclose_overdue_tasks():
     """
     Close tasks that are overdue (deadline passed) and not done.
     Uses the model's business logic for consistency.
     """
-    session = get_session()
-    task_repo = TaskRepository(session)
-
-    try:
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        print(f"🕐 [{timestamp}] Checking for overdue tasks...")
-
+    # Job runs are rare, so every run is traced when tracing is enabled
+    root = tracing.start_root_span(
+        "job autoclose_overdue_tasks", kind=tracing.SPAN_KIND_INTERNAL, sample_rate=1.0
+    )
+    with tracing.activate(root):
+        return _autoclose_overdue_tasks()
 
-        overdue_before = task_repo.get_overdue_tasks()
 
-        if not overdue_before:
-            print("   ✅ No overdue tasks found.")
-            return 0
+def _autoclose_overdue_tasks():
+    """
+    Run one autoclose pass over every shard this instance can lock.
 
-        print(f" Found {len(overdue_before)} overdue task(s)")
+    Shards locked by another instance are skipped, so N scheduler replicas
+    split the work instead of closing the same rows. A run that held no
+    shard is not recorded in the job history.
+    """
+    shards = max(config.SCHEDULER_SHARDS, 1)
+    closed_count = 0
+    with track_job_run("autoclose_overdue_tasks") as run:
+        run.skipped = True
+        for shard in range(shards):
+            with job_lock(f"autoclose_overdue_tasks:{shard}/{shards}") as lock:
+                if not lock.held:
+                    logger.info(
+                        "Autoclose shard is being processed by another instance",
+                        extra={"shard": shard, "shards": shards},
+                    )
+                    continue
+                run.skipped = False
+                closed_count += _autoclose_shard(shard, shards, lock, run)
+
+    logger.info(
+        "Autoclose finished",
+        extra={"closed": closed_count, "scanned": run.rows_scanned or 0, "shards": shards},
+    )
+    return closed_count
+
+
+def _autoclose_shard(shard: int, shards: int, lock: JobLock, run: JobRunStats) -> int:
+    """
+    Close the overdue tasks of one shard in its own session.
 
-        closed_count = task_repo.close_overdue_tasks()
+    Only deadlines after the shard's watermark (the last deadline date fully
+    processed) are scanned, plus tasks flagged with ``overdue_recheck``, so a
+    run costs O(newly overdue tasks). The first run of a shard scans all.
+    """
+    session = get_session()
+    task_repo = TaskRepository(session)
+    watermark_repo = JobWatermarkRepository(session)
+    watermark_name = f"autoclose_overdue_tasks:{shard}/{shards}"
+    today = date.today()
 
-        if closed_count > 0:
-            print(f" Successfully auto-closed {closed_count} overdue task(s)")
-        else:
-            print("    No tasks were closed (possible errors)")
+    def on_batch(scanned: int, closed: int) -> bool:
+        run.add(scanned, closed)
+        return lock.renew()
 
+    try:
+        watermark = watermark_repo.get(watermark_name)
+        closed_count = task_repo.close_overdue_tasks(
+            shard, shards, batch_size=config.SCHEDULER_BATCH_SIZE, on_batch=on_batch,
+            deadline_after=watermark
+        )
+        if watermark is not None and lock.held:
+            closed_count += task_repo.close_overdue_tasks(
+                shard, shards, batch_size=config.SCHEDULER_BATCH_SIZE, on_batch=on_batch,
+                recheck=True
+            )
+
+        if lock.held:
+            # Stop short of tasks that could not be closed (or were locked by
+            # another transaction) so the next run looks at them again
+            remaining = task_repo.get_earliest_open_deadline(
+                shard, shards, after=watermark, before=today
+            )
+            processed = (remaining if remaining is not None else today) - timedelta(days=1)
+            if watermark is None or processed > watermark:
+                watermark_repo.set(watermark_name, processed)
+
+        JOB_RUNS.inc("autoclose_overdue_tasks", "success")
+        TASKS_AUTOCLOSED.inc(amount=closed_count)
         return closed_count
 
     except Exception as e:
-        print(f"❌ Error in autoclose_overdue_tasks: {e}")
+        logger.exception("Autoclose shard failed", extra={"shard": shard, "shards": shards})
+        JOB_RUNS.inc("autoclose_overdue_tasks", "error")
+        run.error = str(e)
         session.rollback()
         return 0
     finally:
         session.close()
 
 
-def main():
-    """Entry point for command line execution."""
+def next_autoclose_run(now: datetime) -> Optional[datetime]:
+    """
+    Return when the next open task becomes overdue, or None if none can.
 
-    print(" Starting auto-close overdue tasks job...")
-    result = autoclose_overdue_tasks()
+    Deadlines are whole dates, so a task becomes overdue at the midnight
+    that ends its deadline day. Returns ``now`` if some task is overdue already;
+    the scheduler delays that while runs fail to close anything.
+    """
+    session = get_session()
+    try:
+        earliest = TaskRepository(session).get_earliest_open_deadline()
+    finally:
+        session.close()
 
-    if result > 0:
-        print(f"✅ Auto-close job completed. Closed {result} task(s).")
-    else:
-        print("✅ Auto-close job completed. No tasks were closed.")
+    if earliest is None:
+        return None
+    return max(now, datetime.combine(earliest + timedelta(days=1), time.min))
 
-    return result
+
+def main():
+    """Entry point for command line execution."""
+    log.configure_from_env(config)
+    tracing.configure_from_env(config)
+    return autoclose_overdue_tasks()
 
 
 if __name__ == "__main__":
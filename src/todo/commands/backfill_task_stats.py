@@ -0,0 +1,85 @@
+"""
+Command to build ``task_daily_stats`` history from the task tables.
+
+    todo-backfill-stats [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+
+Days default to the first task's creation day through yesterday. Counts
+come from ``created_at``/``closed_at`` of live and archived tasks, which is
+how history before the task event log is recovered. When the backfilled
+range reaches the rollup job's watermark, the watermark is moved to its
+end so the job carries on from there.
+"""
+
+import argparse
+import logging
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from todo.config import config
+from todo.db.locks import job_lock
+from todo.db.session import get_session
+from todo.observability import log
+from todo.repositories.job_watermark_repository import JobWatermarkRepository
+from todo.repositories.task_stats_repository import TaskStatsRepository
+
+from .job_runs import track_job_run
+from .rollup_task_stats import ROLLUP_JOB
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_task_stats(start: Optional[date] = None, end: Optional[date] = None) -> int:
+    """Recompute the rollups of ``start`` to ``end`` from the task tables."""
+    with job_lock(ROLLUP_JOB) as lock:
+        if not lock.held:
+            logger.warning("Rollup of task stats is running; try the backfill again later")
+            return 0
+        with track_job_run("backfill_task_stats") as run:
+            session = get_session()
+            try:
+                stats_repo = TaskStatsRepository(session)
+                watermark_repo = JobWatermarkRepository(session)
+                start = start or stats_repo.get_first_task_day()
+                end = end or date.today() - timedelta(days=1)
+                if start is None or start > end:
+                    logger.info("Nothing to backfill")
+                    return 0
+
+                rows = stats_repo.rollup_tasks(start, end)
+                run.add((end - start).days + 1, rows)
+
+                watermark = watermark_repo.get(ROLLUP_JOB)
+                if watermark is None or (start <= watermark + timedelta(days=1) and end > watermark):
+                    watermark_repo.set(ROLLUP_JOB, end)
+
+                logger.info(
+                    "Backfilled task stats",
+                    extra={"rows": rows, "from": start.isoformat(), "to": end.isoformat()},
+                )
+                return rows
+            except Exception as e:
+                logger.exception("Backfill of task stats failed")
+                run.error = str(e)
+                session.rollback()
+                return 0
+            finally:
+                session.close()
+
+
+def _date(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def main():
+    """Entry point for command line execution."""
+    parser = argparse.ArgumentParser(description="Build task_daily_stats history from the task tables.")
+    parser.add_argument("--from", dest="start", type=_date, help="First day (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", type=_date, help="Last day (YYYY-MM-DD), default yesterday")
+    args = parser.parse_args()
+
+    log.configure_from_env(config)
+    return backfill_task_stats(args.start, args.end)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Job run history: recording scheduled job runs and keeping the table small."""
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional
+
+from todo.config import config
+from todo.db.locks import job_lock
+from todo.db.session import get_session
+from todo.observability import log
+from todo.services.job_run_service import JobRunService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobRunStats:
+    """Counters a job fills in while it runs."""
+
+    rows_scanned: Optional[int] = None
+    rows_affected: Optional[int] = None
+    error: Optional[str] = None
+    # Set by jobs that found all their work locked by other instances
+    skipped: bool = False
+
+    def add(self, scanned: Optional[int] = None, affected: Optional[int] = None) -> None:
+        if scanned is not None:
+            self.rows_scanned = (self.rows_scanned or 0) + scanned
+        if affected is not None:
+            self.rows_affected = (self.rows_affected or 0) + affected
+
+
+@contextmanager
+def track_job_run(job_name: str) -> Iterator[JobRunStats]:
+    """Time the enclosed job run and store it in the job_runs table, unless skipped."""
+    stats = JobRunStats()
+    started_at = datetime.now()
+    start = time.perf_counter()
+    try:
+        yield stats
+    except Exception as e:
+        stats.error = str(e) or type(e).__name__
+        raise
+    finally:
+        if not stats.skipped or stats.error:
+            _store(job_name, started_at, (time.perf_counter() - start) * 1000, stats)
+
+
+def _store(job_name: str, started_at: datetime, duration_ms: float, stats: JobRunStats) -> None:
+    """Write a run in its own session; failing to record never fails the job."""
+    session = get_session()
+    try:
+        JobRunService(session).record(
+            job_name, started_at, duration_ms, stats.rows_scanned, stats.rows_affected, stats.error
+        )
+    except Exception as e:
+        logger.warning("Could not record job run", extra={"job": job_name, "error": str(e)})
+        session.rollback()
+    finally:
+        session.close()
+
+
+def maintain_job_runs():
+    """
+    Compact old successful runs into daily rows and delete runs past retention.
+    """
+    with job_lock("maintain_job_runs") as lock:
+        if not lock.held:
+            return 0
+        with track_job_run("maintain_job_runs") as run:
+            session = get_session()
+            try:
+                service = JobRunService(session)
+                compacted = service.compact(config.JOB_RUNS_COMPACT_AFTER_DAYS)
+                purged = service.purge(config.JOB_RUNS_RETENTION_DAYS)
+                run.add(affected=compacted + purged)
+                logger.info("Job history maintained", extra={"compacted": compacted, "purged": purged})
+                return compacted + purged
+            finally:
+                session.close()
+
+
+def main():
+    """Entry point for command line execution."""
+    log.configure_from_env(config)
+    return maintain_job_runs()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Command to hard-delete soft-deleted projects and tasks."""
+
+import logging
+from datetime import datetime, timedelta
+
+from todo.config import config
+from todo.db.locks import JobLock, job_lock
+from todo.db.session import get_session
+from todo.observability import log
+from todo.repositories.project_repository import ProjectRepository
+from todo.repositories.task_repository import TaskRepository
+from todo.services.project_service import ProjectService
+
+from .job_runs import JobRunStats, track_job_run
+
+logger = logging.getLogger(__name__)
+
+
+def purge_deleted_records():
+    """
+    Hard-delete tasks and projects soft-deleted more than
+    ``SOFT_DELETE_RETENTION_DAYS`` days ago, in batches.
+    """
+    with job_lock("purge_deleted_records") as lock:
+        if not lock.held:
+            logger.info("Purge of deleted records is running on another instance; skipped")
+            return 0
+        with track_job_run("purge_deleted_records") as run:
+            return _purge_deleted_records(lock, run)
+
+
+def _purge_deleted_records(lock: JobLock, run: JobRunStats):
+    """Purge deleted tasks, then deleted projects with their tasks, in a new session."""
+    session = get_session()
+    deleted_before = datetime.now() - timedelta(days=config.SOFT_DELETE_RETENTION_DAYS)
+    batch_size = config.SCHEDULER_BATCH_SIZE
+
+    def on_batch(deleted: int) -> bool:
+        run.add(deleted, deleted)
+        return lock.renew()
+
+    try:
+        tasks_purged = TaskRepository(session).purge_deleted(deleted_before, batch_size, on_batch=on_batch)
+
+        projects_purged = 0
+        project_repo = ProjectRepository(session)
+        service = ProjectService(session)
+        while lock.held:
+            project_ids = project_repo.get_deleted_ids(deleted_before, batch_size)
+            for project_id in project_ids:
+                deleted = service.purge_project(project_id, batch_size)
+                if deleted is None:
+                    # Restored since it was listed
+                    continue
+                tasks_purged += deleted
+                projects_purged += 1
+                if not on_batch(deleted + 1):
+                    break
+            if len(project_ids) < batch_size:
+                break
+
+        logger.info(
+            "Purged deleted records",
+            extra={"tasks": tasks_purged, "projects": projects_purged},
+        )
+        return tasks_purged + projects_purged
+
+    except Exception as e:
+        logger.exception("Purge of deleted records failed")
+        run.error = str(e)
+        session.rollback()
+        return 0
+    finally:
+        session.close()
+
+
+def main():
+    """Entry point for command line execution."""
+    log.configure_from_env(config)
+    return purge_deleted_records()
+
+
+if __name__ == "__main__":
+    main()
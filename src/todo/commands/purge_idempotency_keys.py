@@ -0,0 +1,55 @@
+"""Command to delete expired idempotency keys."""
+
+import logging
+
+from todo.config import config
+from todo.db.locks import job_lock
+from todo.db.session import get_session
+from todo.observability import log
+from todo.services.idempotency_service import IdempotencyService
+
+from .job_runs import JobRunStats, track_job_run
+
+logger = logging.getLogger(__name__)
+
+
+def purge_expired_idempotency_keys():
+    """
+    Delete stored idempotent responses whose TTL has passed.
+    """
+    with job_lock("purge_expired_idempotency_keys") as lock:
+        if not lock.held:
+            logger.info("Purge of idempotency keys is running on another instance; skipped")
+            return 0
+        with track_job_run("purge_expired_idempotency_keys") as run:
+            return _purge_expired_idempotency_keys(run)
+
+
+def _purge_expired_idempotency_keys(run: JobRunStats):
+    """Delete expired keys in a new session."""
+    session = get_session()
+
+    try:
+        purged_count = IdempotencyService(session).purge_expired()
+        logger.info("Purged expired idempotency keys", extra={"purged": purged_count})
+        run.add(affected=purged_count)
+
+        return purged_count
+
+    except Exception as e:
+        logger.exception("Purge of expired idempotency keys failed")
+        run.error = str(e)
+        session.rollback()
+        return 0
+    finally:
+        session.close()
+
+
+def main():
+    """Entry point for command line execution."""
+    log.configure_from_env(config)
+    return purge_expired_idempotency_keys()
+
+
+if __name__ == "__main__":
+    main()
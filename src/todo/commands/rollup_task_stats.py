@@ -0,0 +1,87 @@
+"""Command to roll task events up into per-project daily stats."""
+
+import logging
+from datetime import date, timedelta
+
+from todo.config import config
+from todo.db.locks import JobLock, job_lock
+from todo.db.session import get_session
+from todo.observability import log
+from todo.repositories.job_watermark_repository import JobWatermarkRepository
+from todo.repositories.task_stats_repository import TaskStatsRepository
+
+from .job_runs import JobRunStats, track_job_run
+
+logger = logging.getLogger(__name__)
+
+# Lock and watermark name, shared with todo-backfill-stats
+ROLLUP_JOB = "rollup_task_stats"
+
+# Days recomputed per transaction when catching up
+ROLLUP_CHUNK_DAYS = 7
+
+
+def rollup_task_stats():
+    """
+    Recompute ``task_daily_stats`` for the days after the watermark (the
+    last day fully rolled up) through today, from ``task_events``.
+
+    Each run only reads the events of those days, so it costs O(new
+    events); today is recomputed on every run to keep the numbers current.
+    """
+    with job_lock(ROLLUP_JOB) as lock:
+        if not lock.held:
+            logger.info("Rollup of task stats is running on another instance; skipped")
+            return 0
+        with track_job_run(ROLLUP_JOB) as run:
+            return _rollup_task_stats(lock, run)
+
+
+def _rollup_task_stats(lock: JobLock, run: JobRunStats):
+    """Roll up the pending days in chunks in a new session."""
+    session = get_session()
+    stats_repo = TaskStatsRepository(session)
+    watermark_repo = JobWatermarkRepository(session)
+    today = date.today()
+
+    try:
+        watermark = watermark_repo.get(ROLLUP_JOB)
+        start = watermark + timedelta(days=1) if watermark is not None else stats_repo.get_first_event_day()
+        if start is None:
+            logger.info("No task events to roll up")
+            return 0
+
+        written = 0
+        while start <= today and lock.held:
+            end = min(start + timedelta(days=ROLLUP_CHUNK_DAYS - 1), today)
+            rows = stats_repo.rollup_events(start, end)
+            run.add((end - start).days + 1, rows)
+            written += rows
+            # Days before today are final
+            done = min(end, today - timedelta(days=1))
+            if watermark is None or done > watermark:
+                watermark_repo.set(ROLLUP_JOB, done)
+                watermark = done
+            start = end + timedelta(days=1)
+            lock.renew()
+
+        logger.info("Rolled up task stats", extra={"rows": written, "through": today.isoformat()})
+        return written
+
+    except Exception as e:
+        logger.exception("Rollup of task stats failed")
+        run.error = str(e)
+        session.rollback()
+        return 0
+    finally:
+        session.close()
+
+
+def main():
+    """Entry point for command line execution."""
+    log.configure_from_env(config)
+    return rollup_task_stats()
+
+
+if __name__ == "__main__":
+    main()
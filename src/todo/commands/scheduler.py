@@ -1,12 +1,90 @@
-"""Scheduler for periodic tasks using the schedule library."""
+"""
+Scheduler for periodic tasks on a timer heap.
 
-import time
+Each job computes its next run time and the scheduler sleeps until the
+earliest one is due. The autoclose job is deadline driven: it runs at the
+midnight when the earliest open deadline lapses, and is rescheduled
+whenever a task write may have moved that deadline (see ``todo.signals``).
+
+The scheduler runs either in its own process (``todo-schedule``) or inside
+the API as an asyncio task (``SCHEDULER_IN_PROCESS``), where one worker is
+elected leader through a job lock and blocking work runs on a small
+executor.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
 import threading
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from todo.config import config
+from todo.db.locks import JobLock
+from todo.db.session import engine
+from todo.observability import health, log, tracing
+from todo import signals
+
+from .autoclose_overdue import autoclose_overdue_tasks, next_autoclose_run
+from .purge_idempotency_keys import purge_expired_idempotency_keys
+from .archive_closed_tasks import archive_closed_tasks
+from .purge_deleted import purge_deleted_records
+from .rollup_task_stats import rollup_task_stats
+from .job_runs import maintain_job_runs
+
+logger = logging.getLogger(__name__)
+
+# Delay before retrying a job whose next run time could not be computed
+RETRY_DELAY = timedelta(seconds=60)
+
+# Upper bound of the backoff between autoclose runs that close nothing while
+# overdue tasks remain (shards locked elsewhere, tasks failing to close)
+AUTOCLOSE_MAX_BACKOFF = timedelta(hours=1)
+
+# In-process mode: lock electing the worker that runs jobs, and how often
+# the other workers try to take it over
+LEADER_LOCK = "scheduler:leader"
+LEADER_RETRY_SECONDS = 30
+
+
+def next_midnight(now: datetime) -> datetime:
+    """Return the start of the day after ``now``."""
+    return datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+
 
-import schedule
+@dataclass
+class Job:
+    """A scheduled job and the rule computing its next run time."""
 
-from .autoclose_overdue import autoclose_overdue_tasks
+    name: str
+    func: Callable[[], object]
+    next_run: Callable[[datetime], Optional[datetime]]
+    deadline_driven: bool = False
+    description: str = ""
+
+
+def every(interval: timedelta) -> Callable[[datetime], datetime]:
+    """Next-run rule for a job repeating at a fixed interval."""
+    return lambda now: now + interval
+
+
+def daily_at(hour: int) -> Callable[[datetime], datetime]:
+    """Next-run rule for a job running once a day at ``hour`` o'clock (off-peak)."""
+    def next_run(now: datetime) -> datetime:
+        when = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        return when if when > now else when + timedelta(days=1)
+    return next_run
+
+
+@dataclass(order=True)
+class _Entry:
+    when: datetime
+    seq: int
+    job: Job = field(compare=False)
 
 
 class TaskScheduler:
@@ -16,66 +94,317 @@ class TaskScheduler:
         self.is_running = False
         self.thread = None
         self.stop_event = threading.Event()
+        self.wake_event = threading.Event()
+        self.jobs: List[Job] = []
+        self._heap: List[_Entry] = []
+        self._seq = itertools.count()
+        self._listener: Optional[signals.DeadlineListener] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_wake: Optional[asyncio.Event] = None
+        # Consecutive autoclose runs that closed nothing while tasks stayed overdue
+        self._autoclose_stalls = 0
 
     def setup_schedules(self):
         """Setup all scheduled tasks."""
-        schedule.every(15).minutes.do(autoclose_overdue_tasks)
+        self.jobs = [
+            Job(
+                "autoclose_overdue_tasks",
+                self._run_autoclose,
+                self._autoclose_next_run,
+                deadline_driven=True,
+                description="when the earliest open deadline lapses",
+            ),
+            Job(
+                "purge_expired_idempotency_keys",
+                purge_expired_idempotency_keys,
+                every(timedelta(hours=1)),
+                description="every hour",
+            ),
+            Job(
+                "rollup_task_stats",
+                rollup_task_stats,
+                every(timedelta(hours=1)),
+                description="every hour",
+            ),
+            Job(
+                "archive_closed_tasks",
+                archive_closed_tasks,
+                every(timedelta(days=1)),
+                description="every day",
+            ),
+            Job(
+                "purge_deleted_records",
+                purge_deleted_records,
+                daily_at(config.SOFT_DELETE_PURGE_HOUR),
+                description=f"every day at {config.SOFT_DELETE_PURGE_HOUR:02d}:00",
+            ),
+            Job(
+                "maintain_job_runs",
+                maintain_job_runs,
+                every(timedelta(days=1)),
+                description="every day",
+            ),
+        ]
+        now = datetime.now()
+        self._heap = []
+        for job in self.jobs:
+            self._schedule(job, now)
+
+        logger.info(
+            "Schedules set up",
+            extra={"jobs": {job.name: job.description for job in self.jobs}},
+        )
+
+    def _run_autoclose(self) -> int:
+        closed = 0
+        try:
+            closed = autoclose_overdue_tasks()
+        finally:
+            self._autoclose_stalls = 0 if closed else self._autoclose_stalls + 1
+        return closed
+
+    def _autoclose_next_run(self, now: datetime) -> Optional[datetime]:
+        due = next_autoclose_run(now)
+        if due is None or due > now:
+            self._autoclose_stalls = 0
+        elif self._autoclose_stalls:
+            # Overdue tasks the last run could not close would otherwise make
+            # it run again right away; back off until a run makes progress
+            due = now + min(RETRY_DELAY * 2 ** (self._autoclose_stalls - 1), AUTOCLOSE_MAX_BACKOFF)
+        # Writes made by other processes only wake us on PostgreSQL; elsewhere
+        # check again at every midnight, when a new deadline may have lapsed.
+        if self._listener is None:
+            fallback = next_midnight(now)
+            return fallback if due is None else min(due, fallback)
+        return due
+
+    def _schedule(self, job: Job, now: datetime) -> None:
+        """Push the next run of ``job`` on the heap."""
+        try:
+            when = job.next_run(now)
+        except Exception as e:
+            logger.warning("Could not schedule job", extra={"job": job.name, "error": str(e)})
+            when = now + RETRY_DELAY
+        if when is not None:
+            heapq.heappush(self._heap, _Entry(when, next(self._seq), job))
+            logger.info("Job scheduled", extra={"job": job.name, "next_run": when.isoformat(timespec="seconds")})
 
-        print(" Schedules setup completed:")
-        print("   - Auto-close overdue tasks: every 15 minutes")
+    def _reschedule_deadline_jobs(self) -> None:
+        """Recompute the run time of deadline driven jobs after a wake-up."""
+        self._heap = [entry for entry in self._heap if not entry.job.deadline_driven]
+        heapq.heapify(self._heap)
+        now = datetime.now()
+        for job in self.jobs:
+            if job.deadline_driven:
+                self._schedule(job, now)
+
+    def wake(self):
+        """Ask the scheduler to recompute deadline driven jobs (thread-safe)."""
+        self.wake_event.set()
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._async_wake.set)
+
+    def _start_listener(self):
+        if signals.DeadlineListener.supported(engine):
+            self._listener = signals.DeadlineListener(engine, self.wake)
+            self._listener.start()
+
+    def _stop_listener(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _wait(self, timeout: float) -> bool:
+        """Sleep up to ``timeout`` seconds; True if woken by a deadline change."""
+        # Sleep in heartbeat-sized slices so readiness can see we are alive
+        deadline = time.monotonic() + timeout
+        while not self.stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            health.beat(config.SCHEDULER_HEARTBEAT_FILE)
+            if self.wake_event.wait(timeout=min(remaining, 60)):
+                self.wake_event.clear()
+                return not self.stop_event.is_set()
+        return False
 
     def run_scheduler(self):
-        """Run the scheduler in a loop."""
+        """Run the scheduler loop until stopped."""
         self.is_running = True
+        signals.deadlines_changed.connect(self.wake)
+        self._start_listener()
         self.setup_schedules()
 
-        print(f" Task scheduler started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("   Press Ctrl+C in the terminal to stop the scheduler.")
+        logger.info("Task scheduler started")
 
         try:
             while self.is_running and not self.stop_event.is_set():
+                if not self._heap:
+                    if self._wait(3600):
+                        self._reschedule_deadline_jobs()
+                    continue
+
+                delay = (self._heap[0].when - datetime.now()).total_seconds()
+                if delay > 0:
+                    if self._wait(delay):
+                        self._reschedule_deadline_jobs()
+                    continue
+
+                entry = heapq.heappop(self._heap)
                 try:
-                    schedule.run_pending()
-                    self.stop_event.wait(timeout=60)
-                except Exception as e:
-                    print(f"❌ Scheduler error: {e}")
-                    time.sleep(60)
+                    entry.job.func()
+                except Exception:
+                    logger.exception("Scheduled job failed", extra={"job": entry.job.name})
+                self._schedule(entry.job, datetime.now())
         except KeyboardInterrupt:
-            print("\n Scheduler interrupted by user.")
+            logger.info("Scheduler interrupted by user")
+        finally:
+            signals.deadlines_changed.disconnect(self.wake)
+            self._stop_listener()
+            self.is_running = False
+            logger.info("Scheduler loop ended")
+
+    async def _sleep(self, timeout: float) -> bool:
+        """Async counterpart of ``_wait``; True if woken by a deadline change."""
+        health.beat(config.SCHEDULER_HEARTBEAT_FILE)
+        try:
+            await asyncio.wait_for(self._async_wake.wait(), timeout=min(max(timeout, 0), 60))
+        except asyncio.TimeoutError:
+            return False
+        self._async_wake.clear()
+        return not self.stop_event.is_set()
+
+    async def _renew_leadership(self, leader: JobLock, lead) -> None:
+        """Renew the leader lock every third of its TTL until it is lost."""
+        renew_every = config.SCHEDULER_LOCK_TTL_SECONDS / 3
+        while leader.held:
+            await asyncio.sleep(renew_every)
+            try:
+                renewed = await lead(leader.renew)
+            except Exception as e:
+                logger.warning("Scheduler leadership renewal failed", extra={"error": str(e)})
+                renewed = leader.held = False
+            if not renewed:
+                # Let the job loop notice once its current job is done
+                self.wake()
+
+    async def run_in_process(self):
+        """
+        Run the job loop as an asyncio task of the API process.
+
+        Every worker runs this loop, but only the one holding the leader
+        lock runs jobs; the others retry the lock periodically and take
+        over when the leader stops or dies. DB work runs on a one-thread
+        executor so the event loop is never blocked; the leader lock is
+        renewed on its own thread, so a long job cannot let it expire.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._async_wake = asyncio.Event()
+        self.stop_event.clear()
+        self.is_running = True
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scheduler")
+        leader_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scheduler-leader")
+        leader = JobLock(LEADER_LOCK, config.SCHEDULER_LOCK_TTL_SECONDS)
+        leading = False
+        renewer: Optional[asyncio.Task] = None
+
+        def call(func, *args):
+            return self._loop.run_in_executor(executor, func, *args)
+
+        def lead(func, *args):
+            return self._loop.run_in_executor(leader_executor, func, *args)
+
+        signals.deadlines_changed.connect(self.wake)
+        try:
+            while not self.stop_event.is_set():
+                if leading and not leader.held:
+                    logger.warning("Scheduler leadership lost; jobs stopped on this worker")
+                    leading = False
+                    self._stop_listener()
+                    self._heap = []
+
+                if not leader.held:
+                    try:
+                        elected = await lead(leader.acquire)
+                    except Exception as e:
+                        logger.warning("Scheduler leader election failed", extra={"error": str(e)})
+                        elected = False
+                    if not elected:
+                        await self._sleep(LEADER_RETRY_SECONDS)
+                        continue
+                    logger.info("This worker was elected to run scheduled jobs")
+                    leading = True
+                    self._start_listener()
+                    await call(self.setup_schedules)
+                    renewer = asyncio.create_task(self._renew_leadership(leader, lead))
+
+                delay = (self._heap[0].when - datetime.now()).total_seconds() if self._heap else 3600
+                if delay > 0:
+                    if await self._sleep(delay) and leader.held:
+                        await call(self._reschedule_deadline_jobs)
+                    continue
+
+                entry = heapq.heappop(self._heap)
+                try:
+                    await call(entry.job.func)
+                except Exception:
+                    logger.exception("Scheduled job failed", extra={"job": entry.job.name})
+                await call(self._schedule, entry.job, datetime.now())
         finally:
+            signals.deadlines_changed.disconnect(self.wake)
+            if renewer is not None:
+                renewer.cancel()
+            self._stop_listener()
+            self._heap = []
+            try:
+                await lead(leader.release)
+            except Exception as e:
+                logger.warning("Could not release scheduler leadership", extra={"error": str(e)})
+            executor.shutdown(wait=False)
+            leader_executor.shutdown(wait=False)
+            self._loop = None
             self.is_running = False
-            print("✅ Scheduler loop ended.")
+            logger.info("Scheduler loop ended")
+
+    async def stop_in_process(self, task: "asyncio.Task", timeout: float):
+        """Stop ``run_in_process``, letting a running job finish within ``timeout``."""
+        self.stop_event.set()
+        self.wake()
+        try:
+            await asyncio.wait_for(task, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Scheduler did not stop in time")
 
     def start(self):
         """Start the scheduler in a background thread."""
         if self.is_running:
-            print(" Scheduler is already running.")
+            logger.info("Scheduler is already running")
             return
 
         self.stop_event.clear()
         self.thread = threading.Thread(target=self.run_scheduler, daemon=False)
         self.thread.start()
-        print("✅ Background scheduler started.")
+        logger.info("Background scheduler started")
 
     def stop(self):
         """Stop the scheduler gracefully."""
         if not self.is_running:
-            print("ℹ Scheduler is not running.")
+            logger.info("Scheduler is not running")
             return
 
-        print(" Stopping scheduler gracefully...")
+        logger.info("Stopping scheduler gracefully")
         self.is_running = False
         self.stop_event.set()
+        self.wake_event.set()
 
         if self.thread:
             self.thread.join(timeout=5)
             if self.thread.is_alive():
-                print("⚠️ Scheduler thread did not stop in time.")
+                logger.warning("Scheduler thread did not stop in time")
             else:
-                print("✅ Scheduler stopped successfully.")
+                logger.info("Scheduler stopped")
 
-        schedule.clear()
-        print(" All scheduled jobs cleared.")
+        self._heap = []
 
 
 # Global scheduler instance
@@ -84,6 +413,8 @@ scheduler = TaskScheduler()
 
 def start_scheduler():
     """Start the global scheduler."""
+    log.configure_from_env(config)
+    tracing.configure_from_env(config)
     scheduler.start()
 
 
@@ -94,20 +425,24 @@ def stop_scheduler():
 
 def run_once():
     """Run all scheduled tasks once (for testing)."""
-    print(" Running scheduled tasks once...")
-    schedule.run_all()
-    print(" All scheduled tasks completed.")
+    logger.info("Running scheduled tasks once")
+    autoclose_overdue_tasks()
+    purge_expired_idempotency_keys()
+    archive_closed_tasks()
+    purge_deleted_records()
+    rollup_task_stats()
+    maintain_job_runs()
+    logger.info("All scheduled tasks completed")
 
 
 if __name__ == "__main__":
-    print("Starting Todo List Scheduler...")
     start_scheduler()
 
     try:
         while scheduler.is_running:
             time.sleep(1)
     except KeyboardInterrupt:
-        print("\n Main thread interrupted.")
+        logger.info("Main thread interrupted")
     finally:
         stop_scheduler()
-    print("👋 Scheduler program ended.")
\ No newline at end of file
+    logger.info("Scheduler program ended")
@@ -0,0 +1,104 @@
+"""
+Production server for the ToDo List API.
+
+Runs ``WEB_CONCURRENCY`` workers (CPU count by default). With gunicorn
+installed, the app is imported once in the master and workers are forked
+from it so they share its memory; otherwise uvicorn's own process manager
+is used. uvloop and httptools are picked up automatically when installed.
+On SIGTERM workers stop accepting connections and finish in-flight
+requests for up to ``SERVER_GRACEFUL_TIMEOUT`` seconds.
+"""
+
+import importlib.util
+import logging
+
+from todo.config import config
+from todo.db.session import engine, pool_capacity
+from todo.observability import log, tracing
+
+logger = logging.getLogger(__name__)
+
+APP = "todo.api.main:app"
+
+
+def _worker_class() -> str:
+    """UvicornWorker moved to the uvicorn-worker package; prefer it when present."""
+    if importlib.util.find_spec("uvicorn_worker") is not None:
+        return "uvicorn_worker.UvicornWorker"
+    return "uvicorn.workers.UvicornWorker"
+
+
+def _post_fork(server, worker) -> None:
+    """Drop pooled connections inherited from the master and restart helper threads."""
+    engine.dispose(close=False)
+    log.after_fork()
+    tracing.after_fork()
+
+
+def run_gunicorn(host: str, port: int, workers: int) -> None:
+    """Serve with gunicorn, preloading the app before forking workers."""
+    from gunicorn.app.base import BaseApplication
+
+    class TodoApplication(BaseApplication):
+        def load_config(self):
+            settings = {
+                "bind": f"{host}:{port}",
+                "workers": workers,
+                "worker_class": _worker_class(),
+                "preload_app": True,
+                "graceful_timeout": int(config.SERVER_GRACEFUL_TIMEOUT),
+                "timeout": max(30, int(config.SERVER_GRACEFUL_TIMEOUT) * 2),
+                "keepalive": 5,
+                "post_fork": _post_fork,
+            }
+            for key, value in settings.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from todo.api.main import app
+            return app
+
+    TodoApplication().run()
+
+
+def run_uvicorn(host: str, port: int, workers: int) -> None:
+    """Serve with uvicorn's process manager (workers import the app themselves)."""
+    import uvicorn
+
+    uvicorn.run(
+        APP,
+        host=host,
+        port=port,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        timeout_graceful_shutdown=int(config.SERVER_GRACEFUL_TIMEOUT),
+        log_level="info",
+        # Let uvicorn's records propagate to the queued root handler
+        log_config=None,
+    )
+
+
+def main():
+    """Entry point for the todo-serve console script."""
+    host, port, workers = config.SERVER_HOST, config.SERVER_PORT, config.WEB_CONCURRENCY
+    use_gunicorn = importlib.util.find_spec("gunicorn") is not None
+
+    log.configure_from_env(config)
+    logger.info("Starting ToDo List API Server", extra={
+        "url": f"http://{host}:{port}",
+        "workers": workers,
+        "server": "gunicorn" if use_gunicorn else "uvicorn",
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+        "db_connections_per_worker": pool_capacity(),
+    })
+
+    if use_gunicorn:
+        run_gunicorn(host, port, workers)
+    else:
+        run_uvicorn(host, port, workers)
+
+
+if __name__ == "__main__":
+    main()
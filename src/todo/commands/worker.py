@@ -0,0 +1,158 @@
+"""
+Worker pool running jobs from the ``jobs`` table.
+
+Runs ``WORKER_CONCURRENCY`` threads that each claim the next due job (with
+``FOR UPDATE SKIP LOCKED`` on PostgreSQL, so workers never wait on each
+other), run it and record the outcome. Failed jobs are retried with
+exponential backoff until ``JOB_MAX_ATTEMPTS``. Idle threads poll every
+``WORKER_POLL_INTERVAL_SECONDS``. The locks of running jobs are refreshed
+every third of ``JOB_LOCK_TIMEOUT_SECONDS``, so only jobs of dead workers
+go stale. On SIGTERM or Ctrl+C no new jobs are
+claimed and running jobs are finished before exiting.
+"""
+
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Dict
+
+from todo.config import config
+from todo.db.session import get_session
+from todo.observability import log, tracing
+from todo.services.background_job_service import BackgroundJobService
+
+logger = logging.getLogger(__name__)
+
+# How often stale jobs of crashed workers are re-queued
+REQUEUE_INTERVAL_SECONDS = 60
+
+
+class Worker:
+    """A pool of threads claiming and running background jobs."""
+
+    def __init__(self, concurrency: int, poll_interval: float):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.stop_event = threading.Event()
+        self.threads = []
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        # Job run by each thread, by worker id, for the heartbeat
+        self.running: Dict[str, int] = {}
+        self.heartbeat_interval = min(REQUEUE_INTERVAL_SECONDS, config.JOB_LOCK_TIMEOUT_SECONDS / 3)
+
+    def run_one(self, worker_id: str) -> bool:
+        """Claim and run one job; False if no job was due."""
+        session = get_session()
+        try:
+            service = BackgroundJobService(session)
+            job = service.claim(worker_id)
+            if job is None:
+                return False
+            self.running[worker_id] = job.id
+            try:
+                recorded = service.run(job, worker_id)
+            finally:
+                self.running.pop(worker_id, None)
+            if not recorded:
+                logger.warning("Job was taken over while running; outcome discarded", extra={
+                    "worker": worker_id, "job_id": job.id, "kind": job.kind,
+                })
+                return True
+            logger.info("Job finished", extra={
+                "worker": worker_id, "job_id": job.id, "kind": job.kind,
+                "attempt": job.attempts, "status": job.status, "error": job.error,
+            })
+            return True
+        finally:
+            session.close()
+
+    def _loop(self, index: int) -> None:
+        worker_id = f"{self.name}:{index}"
+        while not self.stop_event.is_set():
+            try:
+                if self.run_one(worker_id):
+                    continue
+            except Exception:
+                logger.exception("Worker thread error", extra={"worker": worker_id})
+            self.stop_event.wait(self.poll_interval)
+
+    def heartbeat(self) -> None:
+        """Refresh the locks of the jobs this worker is running."""
+        session = get_session()
+        try:
+            service = BackgroundJobService(session)
+            for worker_id, job_id in list(self.running.items()):
+                if not service.heartbeat(job_id, worker_id):
+                    logger.warning("Lost the lock of a running job", extra={
+                        "worker": worker_id, "job_id": job_id,
+                    })
+        except Exception:
+            logger.exception("Could not refresh running job locks")
+        finally:
+            session.close()
+
+    def requeue_stale(self) -> None:
+        """Re-queue jobs left running by workers that died."""
+        session = get_session()
+        try:
+            requeued, failed = BackgroundJobService(session).requeue_stale()
+            if requeued or failed:
+                logger.warning("Recovered stale jobs", extra={"requeued": requeued, "failed": failed})
+        except Exception:
+            logger.exception("Could not re-queue stale jobs")
+        finally:
+            session.close()
+
+    def start(self) -> None:
+        for index in range(self.concurrency):
+            thread = threading.Thread(target=self._loop, args=(index,), name=f"worker-{index}")
+            thread.start()
+            self.threads.append(thread)
+        logger.info("Worker started", extra={"threads": self.concurrency})
+
+    def stop(self) -> None:
+        """Stop claiming jobs and wait for running ones to finish."""
+        self.stop_event.set()
+        for thread in self.threads:
+            # Keep the locks of the jobs being finished fresh meanwhile
+            thread.join(self.heartbeat_interval)
+            while thread.is_alive():
+                self.heartbeat()
+                thread.join(self.heartbeat_interval)
+        self.threads = []
+        logger.info("Worker stopped")
+
+    def run(self) -> None:
+        """Run until SIGTERM or Ctrl+C, refreshing job locks and re-queueing stale jobs."""
+        def handle_sigterm(signum, frame):
+            logger.info("Stopping worker gracefully")
+            self.stop_event.set()
+
+        signal.signal(signal.SIGTERM, handle_sigterm)
+        self.start()
+        requeue_at = 0.0
+        try:
+            while not self.stop_event.is_set():
+                if time.monotonic() >= requeue_at:
+                    self.requeue_stale()
+                    requeue_at = time.monotonic() + REQUEUE_INTERVAL_SECONDS
+                self.stop_event.wait(self.heartbeat_interval)
+                self.heartbeat()
+        except KeyboardInterrupt:
+            logger.info("Stopping worker gracefully")
+        finally:
+            self.stop()
+
+
+def main():
+    """Entry point for command line execution."""
+    log.configure_from_env(config)
+    tracing.configure_from_env(config)
+    Worker(config.WORKER_CONCURRENCY, config.WORKER_POLL_INTERVAL_SECONDS).run()
+
+
+if __name__ == "__main__":
+    main()
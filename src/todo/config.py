@@ -25,6 +25,63 @@ class Config:
     MAX_NUMBER_OF_PROJECT: int = int(os.getenv("MAX_NUMBER_OF_PROJECT", "50"))
     MAX_NUMBER_OF_TASK: int = int(os.getenv("MAX_NUMBER_OF_TASK", "500"))
     DEFAULT_TASK_STATUS: str = os.getenv("DEFAULT_TASK_STATUS", "todo")
+    BATCH_MAX_OPERATIONS: int = int(os.getenv("BATCH_MAX_OPERATIONS", "100"))
+    IDEMPOTENCY_KEY_TTL_SECONDS: int = int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))
+    IDEMPOTENCY_LOCK_TIMEOUT_SECONDS: int = int(os.getenv("IDEMPOTENCY_LOCK_TIMEOUT_SECONDS", "60"))
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_CONNECTION_BUDGET: int = int(os.getenv("DB_CONNECTION_BUDGET", "0"))
+    DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    SLOW_QUERY_LOG_SIZE: int = int(os.getenv("SLOW_QUERY_LOG_SIZE", "100"))
+    SLOW_QUERY_EXPLAIN: bool = os.getenv("SLOW_QUERY_EXPLAIN", "false").lower() == "true"
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_CAPACITY: float = float(os.getenv("RATE_LIMIT_CAPACITY", "100"))
+    RATE_LIMIT_REFILL_PER_SECOND: float = float(os.getenv("RATE_LIMIT_REFILL_PER_SECOND", "20"))
+    RATE_LIMIT_KEY_HEADER: str = os.getenv("RATE_LIMIT_KEY_HEADER", "")
+    RATE_LIMIT_TRUSTED_PROXIES: str = os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "")
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    RATE_LIMIT_REDIS_URL: str = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+    CONCURRENCY_LIMIT_ENABLED: bool = os.getenv("CONCURRENCY_LIMIT_ENABLED", "true").lower() == "true"
+    CONCURRENCY_TARGET_LATENCY_MS: float = float(os.getenv("CONCURRENCY_TARGET_LATENCY_MS", "250"))
+    CONCURRENCY_MAX_MULTIPLIER: float = float(os.getenv("CONCURRENCY_MAX_MULTIPLIER", "2"))
+    SERVER_TIMING_SAMPLE_RATE: float = float(os.getenv("SERVER_TIMING_SAMPLE_RATE", "0"))
+    TRACING_EXPORTER: str = os.getenv("TRACING_EXPORTER", "none")
+    TRACING_SAMPLE_RATE: float = float(os.getenv("TRACING_SAMPLE_RATE", "0.01"))
+    TRACING_FILE_PATH: str = os.getenv("TRACING_FILE_PATH", "traces.jsonl")
+    TRACING_OTLP_ENDPOINT: str = os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+    TRACING_SERVICE_NAME: str = os.getenv("TRACING_SERVICE_NAME", "todo")
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "")
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    LOG_RATE_LIMIT_PER_MINUTE: int = int(os.getenv("LOG_RATE_LIMIT_PER_MINUTE", "60"))
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    HEALTH_PROBE_INTERVAL_SECONDS: float = float(os.getenv("HEALTH_PROBE_INTERVAL_SECONDS", "2"))
+    SCHEDULER_HEARTBEAT_FILE: str = os.getenv("SCHEDULER_HEARTBEAT_FILE", "scheduler.heartbeat")
+    SCHEDULER_HEARTBEAT_MAX_AGE_SECONDS: float = float(os.getenv("SCHEDULER_HEARTBEAT_MAX_AGE_SECONDS", "180"))
+    SCHEDULER_IN_PROCESS: bool = os.getenv("SCHEDULER_IN_PROCESS", "false").lower() == "true"
+    SCHEDULER_SHARDS: int = int(os.getenv("SCHEDULER_SHARDS", "1"))
+    SCHEDULER_BATCH_SIZE: int = int(os.getenv("SCHEDULER_BATCH_SIZE", "500"))
+    SCHEDULER_LOCK_TTL_SECONDS: float = float(os.getenv("SCHEDULER_LOCK_TTL_SECONDS", "900"))
+    TASK_ARCHIVE_AFTER_DAYS: int = int(os.getenv("TASK_ARCHIVE_AFTER_DAYS", "30"))
+    SOFT_DELETE_RETENTION_DAYS: int = int(os.getenv("SOFT_DELETE_RETENTION_DAYS", "7"))
+    SOFT_DELETE_PURGE_HOUR: int = int(os.getenv("SOFT_DELETE_PURGE_HOUR", "3"))
+    JOB_RUNS_COMPACT_AFTER_DAYS: int = int(os.getenv("JOB_RUNS_COMPACT_AFTER_DAYS", "7"))
+    JOB_RUNS_RETENTION_DAYS: int = int(os.getenv("JOB_RUNS_RETENTION_DAYS", "90"))
+    WORKER_CONCURRENCY: int = int(os.getenv("WORKER_CONCURRENCY", "4"))
+    WORKER_POLL_INTERVAL_SECONDS: float = float(os.getenv("WORKER_POLL_INTERVAL_SECONDS", "1"))
+    JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+    JOB_RETRY_BASE_SECONDS: float = float(os.getenv("JOB_RETRY_BASE_SECONDS", "5"))
+    JOB_LOCK_TIMEOUT_SECONDS: float = float(os.getenv("JOB_LOCK_TIMEOUT_SECONDS", "600"))
+    WARMUP_ENABLED: bool = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+    SERVER_HOST: str = os.getenv("SERVER_HOST", "0.0.0.0")
+    SERVER_PORT: int = int(os.getenv("SERVER_PORT", "8000"))
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+    SERVER_GRACEFUL_TIMEOUT: float = float(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30"))
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+    PROFILER: str = os.getenv("PROFILER", "cprofile")
 
 
 # Global configuration instance
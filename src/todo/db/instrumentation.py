@@ -0,0 +1,100 @@
+"""SQLAlchemy engine event hooks feeding metrics, timing, tracing and the slow query log."""
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from todo.observability import timing, tracing
+from todo.observability.metrics import REGISTRY
+
+from .slow_query_log import SLOW_QUERIES
+
+STATEMENTS = REGISTRY.counter(
+    "todo_db_statements_total",
+    "SQL statements executed, by statement type.",
+    ("operation",),
+)
+STATEMENT_DURATION = REGISTRY.histogram(
+    "todo_db_statement_duration_seconds",
+    "SQL statement execution time, by statement type.",
+    ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+STATEMENT_ERRORS = REGISTRY.counter(
+    "todo_db_statement_errors_total",
+    "SQL statements that raised an error, by statement type.",
+    ("operation",),
+)
+SLOW_STATEMENTS = REGISTRY.counter(
+    "todo_db_slow_statements_total",
+    "SQL statements slower than the slow query threshold, by statement type.",
+    ("operation",),
+)
+POOL_CONNECTIONS = REGISTRY.gauge(
+    "todo_db_pool_connections",
+    "Connections of the engine pool by state.",
+    ("state",),
+)
+
+_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "BEGIN", "COMMIT", "ROLLBACK", "EXPLAIN"})
+
+
+def _operation(statement: str) -> str:
+    """Return the statement keyword used as metric label."""
+    keyword = statement.lstrip()[:8].split(None, 1)
+    keyword = keyword[0].upper() if keyword else ""
+    return keyword if keyword in _OPERATIONS else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = tracing.start_span(
+        f"SQL {_operation(statement)}",
+        kind=tracing.SPAN_KIND_CLIENT,
+        attributes={"db.system": conn.dialect.name, "db.statement": statement},
+    )
+    conn.info.setdefault("query_start_time", []).append((time.perf_counter(), span))
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start, span = conn.info["query_start_time"].pop()
+    duration = time.perf_counter() - start
+    tracing.end_span(span)
+    operation = _operation(statement)
+    STATEMENTS.inc(operation)
+    STATEMENT_DURATION.observe(duration, operation)
+    timing.record("db", duration)
+    if SLOW_QUERIES.enabled and duration >= SLOW_QUERIES.threshold and not SLOW_QUERIES.should_skip(conn):
+        SLOW_STATEMENTS.inc(operation)
+        SLOW_QUERIES.record(statement, parameters, duration, executemany)
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        _, span = conn.info["query_start_time"].pop()
+        if span is not None:
+            span.record_error(exception_context.original_exception)
+            tracing.end_span(span)
+    STATEMENT_ERRORS.inc(_operation(exception_context.statement or ""))
+
+
+def install(engine: Engine) -> None:
+    """Attach statement timing, the slow query log and pool gauges to ``engine``."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    SLOW_QUERIES.attach(engine)
+
+    def pool_state():
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            return {}
+        return {
+            ("checked_out",): pool.checkedout(),
+            ("idle",): pool.checkedin(),
+            ("overflow",): max(pool.overflow(), 0),
+            ("size",): pool.size(),
+        }
+
+    POOL_CONNECTIONS.set_function(pool_state)
@@ -0,0 +1,141 @@
+"""
+Cross-instance locks for scheduler jobs.
+
+On PostgreSQL a job lock is a session-level advisory lock held on a
+dedicated connection for the duration of the job; it is released when the
+job ends or the connection drops. Other databases use a lease row in
+``scheduler_locks`` that expires after ``ttl`` seconds unless renewed, so a
+crashed instance cannot hold a job forever.
+"""
+
+import hashlib
+import os
+import socket
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+from sqlalchemy import delete, insert, text, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+
+from todo.config import config
+from todo.models.scheduler_lock import SchedulerLock
+
+from .session import engine
+
+# Identifies this process as lease owner
+OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def advisory_key(name: str) -> int:
+    """Map a lock name to a signed 64-bit advisory lock key."""
+    digest = hashlib.blake2b(name.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class JobLock:
+    """A lock on one job name; ``held`` tells whether it was acquired."""
+
+    def __init__(self, name: str, ttl: float):
+        self.name = name
+        self.ttl = ttl
+        self.held = False
+        self._conn: Optional[Connection] = None
+
+    @property
+    def _advisory(self) -> bool:
+        return engine.dialect.name == "postgresql"
+
+    def acquire(self) -> bool:
+        if self._advisory:
+            self._conn = engine.connect()
+            self.held = bool(self._conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": advisory_key(self.name)}
+            ).scalar())
+            self._conn.commit()
+            if not self.held:
+                self._conn.close()
+                self._conn = None
+            return self.held
+
+        now = datetime.now()
+        expires_at = now + timedelta(seconds=self.ttl)
+        with engine.begin() as conn:
+            try:
+                with conn.begin_nested():
+                    conn.execute(insert(SchedulerLock).values(
+                        name=self.name, owner=OWNER, expires_at=expires_at
+                    ))
+                self.held = True
+            except IntegrityError:
+                # Take over the lease only if it expired
+                result = conn.execute(
+                    update(SchedulerLock)
+                    .where(SchedulerLock.name == self.name, SchedulerLock.expires_at < now)
+                    .values(owner=OWNER, expires_at=expires_at)
+                )
+                self.held = result.rowcount == 1
+        return self.held
+
+    def renew(self) -> bool:
+        """Extend a lease; returns False if it was lost to another instance."""
+        if not self.held:
+            return False
+        if self._advisory:
+            # The lock lives as long as its connection; check that is still up
+            try:
+                self._conn.execute(text("SELECT 1"))
+                self._conn.commit()
+            except Exception:
+                self.held = False
+                conn, self._conn = self._conn, None
+                conn.invalidate()
+                conn.close()
+            return self.held
+        with engine.begin() as conn:
+            result = conn.execute(
+                update(SchedulerLock)
+                .where(SchedulerLock.name == self.name, SchedulerLock.owner == OWNER)
+                .values(expires_at=datetime.now() + timedelta(seconds=self.ttl))
+            )
+        self.held = result.rowcount == 1
+        return self.held
+
+    def release(self) -> None:
+        if not self.held:
+            return
+        self.held = False
+        if self._advisory:
+            conn, self._conn = self._conn, None
+            try:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": advisory_key(self.name)})
+                conn.commit()
+            except Exception:
+                # Drop the connection rather than pool it with the lock still held
+                conn.invalidate()
+                raise
+            finally:
+                conn.close()
+            return
+        with engine.begin() as conn:
+            conn.execute(
+                delete(SchedulerLock)
+                .where(SchedulerLock.name == self.name, SchedulerLock.owner == OWNER)
+            )
+
+
+@contextmanager
+def job_lock(name: str, ttl: Optional[float] = None) -> Iterator[JobLock]:
+    """
+    Try to lock ``name`` without waiting.
+
+    Yields the lock; callers skip their work when ``lock.held`` is False.
+    """
+    lock = JobLock(name, ttl if ttl is not None else config.SCHEDULER_LOCK_TTL_SECONDS)
+    lock.acquire()
+    try:
+        yield lock
+    finally:
+        lock.release()
@@ -1,11 +1,18 @@
 """Database session management for SQLAlchemy."""
 
 import os
+from contextlib import contextmanager
+from typing import Iterator, Tuple
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from dotenv import load_dotenv
 
+from todo.config import config
+from todo.observability import timing
+
+from .instrumentation import install as install_instrumentation
+
 # Load environment variables
 load_dotenv()
 
@@ -14,11 +21,39 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("No DATABASE_URL set for the application")
 
+
+
+def split_connection_budget(budget: int, workers: int) -> Tuple[int, int]:
+    """
+    Split a total connection budget evenly across worker processes.
+
+    Returns the (pool_size, max_overflow) of one worker; about a quarter of
+    its share is kept as overflow for bursts.
+    """
+    per_worker = max(1, budget // max(workers, 1))
+    overflow = per_worker // 4
+    return per_worker - overflow, overflow
+
+
+if config.DB_CONNECTION_BUDGET > 0:
+    _pool_size, _max_overflow = split_connection_budget(config.DB_CONNECTION_BUDGET, config.WEB_CONCURRENCY)
+else:
+    _pool_size, _max_overflow = config.DB_POOL_SIZE, config.DB_MAX_OVERFLOW
+
+# Pool options are not accepted by SQLite's single-connection pools
+_pool_options = {} if DATABASE_URL.startswith("sqlite") else {
+    "pool_size": _pool_size,
+    "max_overflow": _max_overflow,
+    "pool_timeout": config.DB_POOL_TIMEOUT,
+}
+
 # Create engine with basic configuration
 engine = create_engine(
     DATABASE_URL,
-    echo=True
+    echo=config.DB_ECHO,
+    **_pool_options
 )
+install_instrumentation(engine)
 
 # Session factory
 SessionLocal = sessionmaker(
@@ -28,8 +63,54 @@ SessionLocal = sessionmaker(
     class_=Session
 )
 
+def pool_capacity() -> int:
+    """
+    Return how many connections the engine's pool can hand out at once.
+    """
+    pool = engine.pool
+    size = getattr(pool, "size", 1)
+    # QueuePool reports its size through a method, SingletonThreadPool as an attribute
+    if callable(size):
+        size = size()
+    overflow = getattr(pool, "_max_overflow", 0)
+    return size + max(overflow, 0)
+
+
 def get_session() -> Session:
     """
     Create and return a new SQLAlchemy session.
     """
-    return SessionLocal()
\ No newline at end of file
+    return SessionLocal()
+
+
+def commit(session: Session) -> None:
+    """
+    Commit the session, or only flush it when a unit of work is active.
+
+    Repositories call this instead of ``session.commit()`` so that several
+    repository operations can share one transaction (see ``unit_of_work``).
+    """
+    with timing.phase("commit"):
+        if session.info.get("unit_of_work"):
+            session.flush()
+        else:
+            session.commit()
+
+
+@contextmanager
+def unit_of_work(session: Session) -> Iterator[Session]:
+    """
+    Run several repository operations in a single transaction.
+
+    Inside the block repository writes are flushed instead of committed;
+    the transaction is committed once on exit or rolled back on error.
+    """
+    session.info["unit_of_work"] = True
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.info.pop("unit_of_work", None)
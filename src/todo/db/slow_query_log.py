@@ -0,0 +1,193 @@
+"""
+Threshold-based slow query log.
+
+Statements slower than the threshold are recorded with redacted parameters,
+their duration and the repository method that issued them. On PostgreSQL,
+slow SELECTs can additionally be explained with ``EXPLAIN (ANALYZE, BUFFERS)``
+on a background thread, using a separate pooled connection.
+
+The log keeps the most recent slow statements in a ring buffer and the
+slowest distinct statements in a top-N table.
+"""
+
+import logging
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from todo.config import config
+
+logger = logging.getLogger(__name__)
+
+# Parameter types that never carry user-supplied text
+_SAFE_TYPES = (bool, int, float, Decimal, date, datetime)
+
+# Explains queued but not yet run; further slow statements are not explained
+_MAX_PENDING_EXPLAINS = 4
+
+_SKIP_FLAG = "slow_query_log_skip"
+
+
+@dataclass
+class SlowQuery:
+    """One slow statement execution."""
+
+    statement: str
+    parameters: Any
+    duration_ms: float
+    origin: Optional[str]
+    recorded_at: datetime = field(default_factory=datetime.now)
+    count: int = 1
+    explain: Optional[str] = None
+
+
+def redact(parameters: Any) -> Any:
+    """Replace parameter values that may hold user data with a placeholder."""
+    if isinstance(parameters, dict):
+        return {key: redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact(value) for value in parameters]
+    if parameters is None or isinstance(parameters, _SAFE_TYPES):
+        return parameters
+    return "<redacted>"
+
+
+def find_origin() -> Optional[str]:
+    """Return the innermost repository method on the current call stack."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("todo.repositories."):
+            return f"{module.rsplit('.', 1)[-1]}:{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return None
+
+
+class SlowQueryLog:
+    """Collects statements slower than ``threshold_ms``."""
+
+    def __init__(self, threshold_ms: float, size: int = 100, explain: bool = False):
+        self.threshold = threshold_ms / 1000
+        self.size = size
+        self.explain_enabled = explain
+        self.engine: Optional[Engine] = None
+        self._recent: Deque[SlowQuery] = deque(maxlen=size)
+        self._top: Dict[str, SlowQuery] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def attach(self, engine: Engine) -> None:
+        """Use ``engine`` for EXPLAIN capture (PostgreSQL only)."""
+        self.engine = engine
+        if self.explain_enabled and engine.dialect.name != "postgresql":
+            logger.info("EXPLAIN capture is only supported on PostgreSQL; disabled")
+            self.explain_enabled = False
+
+    @staticmethod
+    def should_skip(conn) -> bool:
+        return conn.info.get(_SKIP_FLAG, False)
+
+    def record(self, statement: str, parameters: Any, duration: float, executemany: bool) -> None:
+        """Record a statement that took ``duration`` seconds, if it was slow."""
+        if duration < self.threshold:
+            return
+
+        entry = SlowQuery(
+            statement=statement,
+            parameters=redact(parameters[:5] if executemany else parameters),
+            duration_ms=duration * 1000,
+            origin=find_origin(),
+        )
+        logger.warning(
+            "Slow query (%.1f ms) from %s: %s",
+            entry.duration_ms, entry.origin or "unknown", " ".join(statement.split())
+        )
+
+        explain = False
+        with self._lock:
+            self._recent.append(entry)
+            top = self._top.get(statement)
+            if top is not None:
+                top.count += 1
+                if entry.duration_ms > top.duration_ms:
+                    top.duration_ms = entry.duration_ms
+                    top.parameters = entry.parameters
+                    top.origin = entry.origin
+                    top.recorded_at = entry.recorded_at
+            else:
+                top = SlowQuery(**{**entry.__dict__})
+                self._top[statement] = top
+                if len(self._top) > self.size:
+                    slowest = sorted(self._top.values(), key=lambda q: q.duration_ms, reverse=True)
+                    self._top = {q.statement: q for q in slowest[:self.size]}
+                explain = (
+                    self.explain_enabled
+                    and not executemany
+                    and statement.lstrip()[:6].upper() == "SELECT"
+                    and self._pending < _MAX_PENDING_EXPLAINS
+                )
+                if explain:
+                    self._pending += 1
+
+        if explain:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+            self._executor.submit(self._explain, statement, parameters, top, entry)
+
+    def _explain(self, statement: str, parameters: Any, *entries: SlowQuery) -> None:
+        """Run EXPLAIN ANALYZE in a rolled back transaction and attach the plan."""
+        try:
+            with self.engine.connect() as conn:
+                conn.info[_SKIP_FLAG] = True
+                try:
+                    rows = conn.exec_driver_sql(
+                        "EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters
+                    ).fetchall()
+                finally:
+                    conn.rollback()
+                    conn.info.pop(_SKIP_FLAG, None)
+            plan = "\n".join(row[0] for row in rows)
+            with self._lock:
+                for entry in entries:
+                    entry.explain = plan
+        except Exception as e:
+            logger.warning("EXPLAIN of slow query failed: %s", e)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def recent(self) -> List[SlowQuery]:
+        """Most recent slow statements, newest first."""
+        with self._lock:
+            return list(reversed(self._recent))
+
+    def top(self, limit: Optional[int] = None) -> List[SlowQuery]:
+        """Slowest distinct statements, slowest first."""
+        with self._lock:
+            slowest = sorted(self._top.values(), key=lambda q: q.duration_ms, reverse=True)
+        return slowest[:limit] if limit else slowest
+
+    def clear(self) -> None:
+        with self._lock:
+            self._recent.clear()
+            self._top.clear()
+
+
+# Global slow query log
+SLOW_QUERIES = SlowQueryLog(
+    threshold_ms=config.SLOW_QUERY_THRESHOLD_MS,
+    size=config.SLOW_QUERY_LOG_SIZE,
+    explain=config.SLOW_QUERY_EXPLAIN,
+)
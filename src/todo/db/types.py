@@ -0,0 +1,43 @@
+"""Custom column types."""
+
+from typing import Optional, Sequence
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class CodedString(TypeDecorator):
+    """
+    A string from a fixed set of values, stored as its smallint position.
+
+    The model, queries and API keep using the strings; only the database
+    sees the codes. Codes are positions in ``values``, so new values must
+    only ever be appended.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, values: Sequence[str]):
+        super().__init__()
+        self.values = tuple(values)
+        self._codes = {value: code for code, value in enumerate(self.values)}
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        try:
+            return self._codes[value]
+        except KeyError:
+            raise ValueError(f"Invalid value: {value!r}. Valid: {self.values}") from None
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        # Negative codes would silently index from the end
+        if not 0 <= value < len(self.values):
+            raise ValueError(f"Invalid code: {value!r}. Valid: 0..{len(self.values) - 1}")
+        return self.values[value]
+
+    def process_literal_param(self, value: Optional[str], dialect) -> str:
+        return "NULL" if value is None else str(self.process_bind_param(value, dialect))
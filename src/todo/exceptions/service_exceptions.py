@@ -16,10 +16,34 @@ class ProjectLimitExceededError(ToDoError):
     """Raised when the maximum number of projects has been reached."""
     pass
 
+class ProjectPurgeInProgressError(ToDoError):
+    """Raised when restoring a project that a background job is purging."""
+    pass
+
 class TaskLimitExceededError(ToDoError):
     """Raised when the maximum number of tasks for a project has been reached."""
     pass
 
 class InvalidDeadlineError(ValidationError):
     """Raised when the provided deadline is in the past."""
-    pass
\ No newline at end of file
+    pass
+
+class BatchOperationError(ToDoError):
+    """Raised when one operation of a batch fails; the whole batch is rolled back."""
+
+    def __init__(self, index: int, error: Exception):
+        super().__init__(f"Operation {index} failed: {error}")
+        self.index = index
+        self.error = error
+
+class IdempotencyKeyInProgressError(ToDoError):
+    """Raised when a request with the same Idempotency-Key is still being processed."""
+    pass
+
+class IdempotencyKeyMismatchError(ToDoError):
+    """Raised when an Idempotency-Key is reused with a different request payload."""
+    pass
+
+class JobNotFoundError(ToDoError):
+    """Raised when a background job with a given ID does not exist."""
+    pass
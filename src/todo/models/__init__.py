@@ -3,5 +3,13 @@
 from todo.db.base import Base
 from .project import Project
 from .task import Task
+from .idempotency_key import IdempotencyKey
+from .scheduler_lock import SchedulerLock
+from .job_run import JobRun
+from .background_job import BackgroundJob
+from .job_watermark import JobWatermark
+from .archived_task import ArchivedTask
+from .task_event import TaskEvent
+from .task_daily_stat import TaskDailyStat
 
-__all__ = ["Base", "Project", "Task"]
\ No newline at end of file
+__all__ = ["Base", "Project", "Task", "IdempotencyKey", "SchedulerLock", "JobRun", "BackgroundJob", "JobWatermark", "ArchivedTask", "TaskEvent", "TaskDailyStat"]
\ No newline at end of file
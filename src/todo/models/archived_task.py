@@ -0,0 +1,39 @@
+"""SQLAlchemy model for archived (long closed) tasks."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import String, Text, DateTime, Date, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from todo.db.base import Base
+from todo.db.types import CodedString
+from .task import VALID_STATUSES
+
+
+class ArchivedTask(Base):
+    """A done task moved out of ``tasks`` by the archive job.
+
+    Rows keep their original task id and columns, so they read like tasks;
+    they are read-only and do not count towards ``MAX_NUMBER_OF_TASK``.
+    """
+
+    __tablename__ = "tasks_archive"
+
+    # Columns
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    title: Mapped[str] = mapped_column(String(30), nullable=False)
+    project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), index=True)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(CodedString(VALID_STATUSES), nullable=False)
+    deadline: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    closed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    #Columns with default
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default_factory=datetime.now)
+
+    def __repr__(self) -> str:
+        return f"ArchivedTask(id={self.id}, title='{self.title}', status='{self.status}')"
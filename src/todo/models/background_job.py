@@ -0,0 +1,52 @@
+"""SQLAlchemy model for the background job queue."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import String, DateTime, Integer, JSON, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from todo.db.base import Base
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+
+class BackgroundJob(Base):
+    """A unit of work queued by the API and run by ``todo-worker``.
+
+    Workers claim the queued job with the highest priority whose
+    ``run_at`` has passed; failed attempts are re-queued with a later
+    ``run_at`` until ``max_attempts`` is reached.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_priority_run_at", "status", "priority", "run_at"),
+    )
+
+    # Columns
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    payload: Mapped[Any] = mapped_column(JSON, nullable=False)
+
+    #Columns with default
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, init=False)
+    status: Mapped[str] = mapped_column(String(10), nullable=False, default="queued")
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=5)
+    run_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default_factory=datetime.now)
+    locked_by: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, default=None)
+    locked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, default=None)
+    result: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True, default=None)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True, default=None)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default_factory=datetime.now)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, default=None)
+
+    def __repr__(self) -> str:
+        return f"BackgroundJob(id={self.id}, kind='{self.kind}', status='{self.status}')"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
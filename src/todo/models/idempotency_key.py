@@ -0,0 +1,47 @@
+"""SQLAlchemy model for stored idempotent responses."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import String, DateTime, Integer, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from todo.db.base import Base
+
+
+class IdempotencyKey(Base):
+    """A client-supplied Idempotency-Key and the response it produced.
+
+    A row without a status code is a reservation: the first request with
+    this key is still running, or stopped without finishing if
+    ``locked_until`` has passed.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    # Columns
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(255), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+    #Columns with default
+    status_code: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=None)
+    response_body: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True, default=None)
+    locked_until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, default=None)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default_factory=datetime.now)
+
+    def __repr__(self) -> str:
+        return f"IdempotencyKey(key='{self.key}', scope='{self.scope}', status_code={self.status_code})"
+
+    @property
+    def is_completed(self) -> bool:
+        """Whether the original request finished and its response is stored."""
+        return self.status_code is not None
+
+    @property
+    def is_abandoned(self) -> bool:
+        """Whether this is a reservation whose request crashed before finishing."""
+        return not self.is_completed and (self.locked_until is None or self.locked_until <= datetime.now())
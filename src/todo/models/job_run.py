@@ -0,0 +1,39 @@
+"""SQLAlchemy model for scheduler job run history."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, Integer, Float, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from todo.db.base import Base
+
+
+class JobRun(Base):
+    """One run of a scheduled job, or a compacted day of runs.
+
+    Old successful runs are compacted into one row per job and day; such a
+    row has ``runs > 1`` and holds the mean duration and summed row counts.
+    """
+
+    __tablename__ = "job_runs"
+    __table_args__ = (
+        Index("ix_job_runs_job_name_started_at", "job_name", "started_at"),
+    )
+
+    # Columns
+    job_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    duration_ms: Mapped[float] = mapped_column(Float, nullable=False)
+
+    #Columns with default
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, init=False)
+    rows_scanned: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=None)
+    rows_affected: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=None)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True, default=None)
+    runs: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    def __repr__(self) -> str:
+        return f"JobRun(id={self.id}, job_name='{self.job_name}', duration_ms={self.duration_ms:.1f})"
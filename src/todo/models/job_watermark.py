@@ -0,0 +1,30 @@
+"""SQLAlchemy model for scheduler job watermarks."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import String, Date, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from todo.db.base import Base
+
+
+class JobWatermark(Base):
+    """How far an incremental job (or job shard) has processed its input.
+
+    The autoclose job stores the last deadline date whose tasks were all
+    handled, so each run only scans deadlines that lapsed since.
+    """
+
+    __tablename__ = "job_watermarks"
+
+    # Columns
+    name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    value: Mapped[date] = mapped_column(Date, nullable=False)
+
+    #Columns with default
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default_factory=datetime.now)
+
+    def __repr__(self) -> str:
+        return f"JobWatermark(name='{self.name}', value={self.value})"
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, date
 from typing import List, Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Text, DateTime, Integer
+from sqlalchemy import String, Text, DateTime, Integer, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from todo.db.base import Base
@@ -19,10 +19,27 @@ class Project(Base):
     """SQLAlchemy model for Project entity."""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        # Names are unique among live projects; a deleted project frees its name
+        Index(
+            "ix_projects_name",
+            "name",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        # Only deleted rows are indexed, for the purge job
+        Index(
+            "ix_projects_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            sqlite_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     # Columns
     id: Mapped[int] = mapped_column(Integer,primary_key=True, autoincrement=True)
-    name: Mapped[str] = mapped_column(String(30), unique=True, nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(30), nullable=False)
 
     # Relationships
     tasks: Mapped[List["Task"]] = relationship(
@@ -36,6 +53,9 @@ class Project(Base):
     description: Mapped[str] = mapped_column(Text, default="")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
 
+    # Set by DELETE; the purge job removes the project and its tasks later
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, default=None)
+
     def __repr__(self) -> str:
         return f"Project(id={self.id}, name='{self.name}')"
 
@@ -0,0 +1,28 @@
+"""SQLAlchemy model for scheduler job leases."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from todo.db.base import Base
+
+
+class SchedulerLock(Base):
+    """A time-limited lease on a scheduler job (or job shard).
+
+    Used where PostgreSQL advisory locks are not available. A lease whose
+    ``expires_at`` has passed may be taken over by another instance.
+    """
+
+    __tablename__ = "scheduler_locks"
+
+    # Columns
+    name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    owner: Mapped[str] = mapped_column(String(255), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"SchedulerLock(name='{self.name}', owner='{self.owner}', expires_at={self.expires_at})"
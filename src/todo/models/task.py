@@ -5,10 +5,11 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Text, DateTime, Date, ForeignKey, Integer
+from sqlalchemy import String, Text, DateTime, Date, ForeignKey, Integer, Boolean, Index, false, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from todo.db.base import Base
+from todo.db.types import CodedString
 from todo.exceptions.base import ValidationError
 from todo.exceptions.service_exceptions import TaskLimitExceededError, InvalidDeadlineError
 from ..config import config
@@ -24,11 +25,27 @@ class Task(Base):
     """SQLAlchemy model for Task entity."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Only flagged rows are indexed; the flag is rarely set
+        Index(
+            "ix_tasks_overdue_recheck",
+            "overdue_recheck",
+            postgresql_where=text("overdue_recheck"),
+            sqlite_where=text("overdue_recheck = 1"),
+        ),
+        # Only deleted rows are indexed, for the purge job
+        Index(
+            "ix_tasks_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            sqlite_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     # Columns
     id: Mapped[int] = mapped_column(Integer,primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
-    deadline: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    deadline: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True)
     closed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Foreign Key
@@ -38,9 +55,17 @@ class Task(Base):
     project: Mapped["Project"] = relationship("Project", back_populates="tasks")
 
     description: Mapped[str] = mapped_column(Text, default="")
-    status: Mapped[str] = mapped_column(String(10), default="todo")
+    # Stored as a smallint code (see ``CodedString``); append new statuses only
+    status: Mapped[str] = mapped_column(CodedString(VALID_STATUSES), default="todo")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
 
+    # Set when a write leaves the task open with a lapsed deadline; the
+    # incremental autoclose scan only looks at newly lapsed deadlines otherwise
+    overdue_recheck: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+
+    # Set by DELETE; the purge job removes the row later
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, default=None)
+
     def __repr__(self) -> str:
         return f"Task(id={self.id}, title='{self.title}', status='{self.status}')"
 
@@ -110,12 +135,20 @@ class Task(Base):
             elif new_status != "done":
                 self.closed_at = None
 
-
+            self._flag_lapsed_deadline()
 
         except ValueError as e:
             self.status = original_status
             raise e
 
+    def _flag_lapsed_deadline(self) -> None:
+        """Flag the task for the autoclose job if it is open and its deadline passed."""
+        self.overdue_recheck = (
+            self.status != "done"
+            and self.deadline is not None
+            and self.deadline < date.today()
+        )
+
     def edit(
         self,
         title: Optional[str] = None,
@@ -171,6 +204,8 @@ class Task(Base):
                     self.deadline = deadline
                 self._validate_deadline()
 
+            self._flag_lapsed_deadline()
+
         except ValueError as e:
             # Rollback all changes if any validation fails
             self.title = original_title
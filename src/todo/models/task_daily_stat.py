@@ -0,0 +1,33 @@
+"""SQLAlchemy model for per-project daily task throughput rollups."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import Date, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from todo.db.base import Base
+
+
+class TaskDailyStat(Base):
+    """Number of tasks created and closed in a project on one day.
+
+    Maintained by the ``rollup_task_stats`` job from ``task_events`` (and by
+    ``todo-backfill-stats`` from the task tables for older days), so stats
+    reads never aggregate raw task rows.
+    """
+
+    __tablename__ = "task_daily_stats"
+
+    # Columns
+    project_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Indexed on its own for the rollup job, which rewrites whole days
+    day: Mapped[date] = mapped_column(Date, primary_key=True, index=True)
+
+    #Columns with default
+    created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    closed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"TaskDailyStat(project_id={self.project_id}, day={self.day}, created={self.created}, closed={self.closed})"
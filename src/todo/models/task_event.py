@@ -0,0 +1,45 @@
+"""SQLAlchemy model for the append-only task event log."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, Integer, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from todo.db.base import Base
+from todo.db.types import CodedString
+from .task import VALID_STATUSES
+
+
+TASK_EVENT_KINDS = ("created", "updated", "status_changed", "deleted", "restored")
+
+
+class TaskEvent(Base):
+    """One write to a task, with the status before and after it.
+
+    Rows are only ever inserted. There is no foreign key to ``tasks``, so
+    the history outlives archiving and deletion of the task itself.
+    """
+
+    __tablename__ = "task_events"
+    __table_args__ = (
+        Index("ix_task_events_task_id_occurred_at", "task_id", "occurred_at"),
+        # Lets the stats rollup read only the days it recomputes
+        Index("ix_task_events_occurred_at", "occurred_at"),
+    )
+
+    # Columns
+    task_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    project_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    #Columns with default
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, init=False)
+    from_status: Mapped[Optional[str]] = mapped_column(CodedString(VALID_STATUSES), nullable=True, default=None)
+    to_status: Mapped[Optional[str]] = mapped_column(CodedString(VALID_STATUSES), nullable=True, default=None)
+
+    def __repr__(self) -> str:
+        return f"TaskEvent(id={self.id}, task_id={self.task_id}, kind='{self.kind}')"
@@ -0,0 +1,5 @@
+"""Instrumentation for the ToDo List application."""
+
+from .metrics import REGISTRY
+
+__all__ = ["REGISTRY"]
@@ -0,0 +1,137 @@
+"""
+Liveness and readiness probes.
+
+Readiness runs ``SELECT 1`` through the engine pool, at most once per probe
+interval and by one caller at a time; other callers get the cached result.
+The check is async: a cached result is answered on the event loop and a
+due probe runs on a worker thread, so probes never wait for a free request
+thread. It also reports pool saturation and the age of the scheduler
+heartbeat, a file the scheduler process touches on every loop iteration.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+
+def beat(path: str) -> None:
+    """Record a scheduler heartbeat."""
+    if path:
+        Path(path).touch()
+
+
+def heartbeat_age(path: str) -> Optional[float]:
+    """Seconds since the last heartbeat, or None if there is none."""
+    try:
+        return max(0.0, time.time() - os.stat(path).st_mtime)
+    except (OSError, ValueError):
+        return None
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of the last database probe."""
+
+    ok: bool
+    latency_ms: Optional[float] = None
+    error: Optional[str] = None
+    checked_at: float = field(default_factory=time.monotonic)
+
+
+class HealthChecker:
+    """Computes the readiness report of this worker."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        probe_interval: float = 2.0,
+        heartbeat_file: str = "",
+        max_heartbeat_age: float = 180.0,
+    ):
+        self.engine = engine
+        self.probe_interval = probe_interval
+        self.heartbeat_file = heartbeat_file
+        self.max_heartbeat_age = max_heartbeat_age
+        self.ready = True
+        self._last: Optional[ProbeResult] = None
+        self._lock = threading.Lock()
+
+    def pool_status(self) -> dict:
+        """Connections in use against what the pool can hand out."""
+        pool = self.engine.pool
+        if not hasattr(pool, "checkedout"):
+            return {"checked_out": None, "capacity": None, "saturated": False}
+        capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        checked_out = pool.checkedout()
+        return {
+            "checked_out": checked_out,
+            "capacity": capacity,
+            "saturated": checked_out >= capacity,
+        }
+
+    def _probe(self) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except Exception as e:
+            return ProbeResult(ok=False, error=type(e).__name__)
+        return ProbeResult(ok=True, latency_ms=(time.perf_counter() - start) * 1000)
+
+    def cached_probe(self) -> Optional[ProbeResult]:
+        """The last probe result if it is still fresh, else None."""
+        last = self._last
+        if last is not None and time.monotonic() - last.checked_at < self.probe_interval:
+            return last
+        return None
+
+    def probe_database(self, saturated: bool) -> ProbeResult:
+        """Return a probe result no older than the probe interval."""
+        cached = self.cached_probe()
+        if cached is not None:
+            return cached
+        # A saturated pool would make the probe wait for pool_timeout
+        if saturated:
+            return ProbeResult(ok=False, error="pool saturated")
+        if not self._lock.acquire(blocking=False):
+            return self._last or ProbeResult(ok=False, error="probe in progress")
+        try:
+            self._last = self._probe()
+            return self._last
+        finally:
+            self._lock.release()
+
+    async def check(self) -> dict:
+        """Build the readiness report; ``ready`` is False if traffic should stop."""
+        pool = self.pool_status()
+        database = self.cached_probe()
+        if database is None:
+            database = await asyncio.to_thread(self.probe_database, pool["saturated"])
+        age = heartbeat_age(self.heartbeat_file) if self.heartbeat_file else None
+
+        if age is None:
+            scheduler = "unknown"
+        else:
+            scheduler = "ok" if age <= self.max_heartbeat_age else "stale"
+
+        return {
+            "ready": self.ready and database.ok and not pool["saturated"],
+            "warmed_up": self.ready,
+            "database": {
+                "ok": database.ok,
+                "latency_ms": database.latency_ms,
+                "error": database.error,
+            },
+            "pool": pool,
+            "scheduler": {
+                "status": scheduler,
+                "heartbeat_age_seconds": age,
+            },
+        }
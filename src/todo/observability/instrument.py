@@ -0,0 +1,33 @@
+"""Decorators attaching timing and tracing to application layers."""
+
+import functools
+import inspect
+from typing import Callable
+
+from . import timing, tracing
+
+
+def wrap(func: Callable, layer: str, span_name: str) -> Callable:
+    """
+    Wrap ``func`` so each call is timed as phase ``layer`` and traced as
+    span ``span_name``. With neither a timing collector nor a sampled
+    trace active, the call goes straight through.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if timing.current() is None and tracing.current_span() is None:
+            return func(*args, **kwargs)
+        with timing.phase(layer), tracing.span(span_name, {"code.layer": layer}):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def instrument(layer: str) -> Callable[[type], type]:
+    """Class decorator instrumenting all public methods as ``layer``."""
+    def decorator(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.isfunction(value):
+                continue
+            setattr(cls, attr, wrap(value, layer, f"{cls.__name__}.{attr}"))
+        return cls
+    return decorator
@@ -0,0 +1,221 @@
+"""
+Structured, non-blocking logging.
+
+``configure`` routes every record through a bounded queue to a background
+thread that formats and writes it, so request and job threads never wait on
+stdout. Records are written as one JSON object per line (or as plain text),
+with the fields passed in ``extra`` and the current trace id, if any.
+
+Per-row events opt in to a rate limit by passing ``extra=rate_limited(...)``:
+past ``rate_limit`` such records per minute with the same logger and
+message template, records are dropped and the next record let through
+carries the number suppressed. Other records (access and error logs) are
+never dropped by it. Jobs should still prefer one summary record with
+counts over a record per row.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple
+
+from . import tracing
+
+# Attributes every LogRecord has; anything else was passed in ``extra``
+_RECORD_ATTRIBUTES = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime"}
+
+# Record attribute set by ``rate_limited``; not written out
+_RATE_LIMITED = "_rate_limited"
+
+
+def rate_limited(**fields: Any) -> Dict[str, Any]:
+    """``extra`` for a per-row record that may be dropped by the rate limit."""
+    return {**fields, _RATE_LIMITED: True}
+
+
+def record_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    """Return the structured fields attached to ``record``."""
+    return {
+        key: value for key, value in record.__dict__.items()
+        if key not in _RECORD_ATTRIBUTES and not key.startswith("_")
+    }
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(record_fields(record))
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable lines with the structured fields appended as key=value."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        line = super().formatMessage(record)
+        fields = record_fields(record)
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let at most ``limit`` records per ``interval`` seconds through for each
+    logger and message template; the first record of the next window gets
+    a ``suppressed`` field with the number of records dropped. Only records
+    logged with ``extra=rate_limited(...)`` are counted.
+    """
+
+    def __init__(self, limit: int, interval: float = 60.0):
+        super().__init__()
+        self.limit = limit
+        self.interval = interval
+        self._windows: Dict[Tuple[str, Any], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, _RATE_LIMITED, False):
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window is not None else 0
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            if window[1] < self.limit:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+
+class _QueueHandler(QueueHandler):
+    """Queue handler that keeps structured fields and never blocks."""
+
+    def __init__(self, log_queue: "queue.Queue"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve everything that depends on the calling thread before the
+        # record crosses to the writer thread
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        span = tracing.current_span()
+        if span is not None:
+            record.trace_id = span.trace_id
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: Optional[QueueListener] = None
+_handler: Optional[_QueueHandler] = None
+_settings: Optional[Dict[str, Any]] = None
+
+
+def parse_levels(spec: str) -> Dict[str, str]:
+    """Parse ``"todo.repositories=WARNING,sqlalchemy.engine=INFO"``."""
+    levels = {}
+    for item in spec.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure(
+    level: str = "INFO",
+    fmt: str = "json",
+    levels: Optional[Dict[str, str]] = None,
+    queue_size: int = 10000,
+    rate_limit: int = 60,
+) -> None:
+    """Install the queue handler on the root logger and start the writer thread."""
+    global _listener, _handler, _settings
+    _settings = dict(level=level, fmt=fmt, levels=levels, queue_size=queue_size, rate_limit=rate_limit)
+    root = logging.getLogger()
+    if _listener is not None:
+        _listener.stop()
+    if _handler is not None:
+        root.removeHandler(_handler)
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(TextFormatter() if fmt == "text" else JsonFormatter())
+
+    log_queue: "queue.Queue" = queue.Queue(queue_size)
+    _handler = _QueueHandler(log_queue)
+    if rate_limit > 0:
+        _handler.addFilter(RateLimitFilter(rate_limit))
+    _listener = QueueListener(log_queue, stream, respect_handler_level=False)
+
+    root.addHandler(_handler)
+    root.setLevel(level.upper())
+    for name, module_level in (levels or {}).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener.start()
+    atexit.register(shutdown)
+
+
+def shutdown() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def after_fork() -> None:
+    """Restart the writer thread in a forked worker; threads do not survive fork."""
+    global _listener
+    if _settings is not None:
+        _listener = None
+        configure(**_settings)
+
+
+def configure_from_env(config) -> None:
+    """Configure logging according to the application configuration (once)."""
+    if _listener is not None:
+        return
+    configure(
+        config.LOG_LEVEL,
+        config.LOG_FORMAT,
+        parse_levels(config.LOG_LEVELS),
+        config.LOG_QUEUE_SIZE,
+        config.LOG_RATE_LIMIT_PER_MINUTE,
+    )
@@ -0,0 +1,219 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+Recording is lock-free: every thread writes to its own shard (a plain
+dict), and shards are only summed when ``/metrics`` is scraped. Each
+worker process exposes its own values.
+
+If ``prometheus_client`` is installed, its default registry (process and
+runtime collectors) is appended to the exposition; it is not required.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _ShardedMetric:
+    """Base class keeping one value dict per recording thread."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def _snapshots(self) -> List[dict]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        # dict.copy() is atomic under the GIL, so concurrent writers are safe
+        return [shard.copy() for shard in shards]
+
+    def collect(self) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class Counter(_ShardedMetric):
+    """Monotonically increasing value."""
+
+    type_name = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def values(self) -> Dict[LabelValues, float]:
+        totals: Dict[LabelValues, float] = {}
+        for snapshot in self._snapshots():
+            for labels, value in snapshot.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def collect(self) -> Iterable[str]:
+        values = self.values()
+        if not values and not self.labelnames:
+            values = {(): 0}
+        for labels, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Value that can go up and down, or be computed at scrape time."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._function: Optional[Callable[[], Dict[LabelValues, float]]] = None
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set_function(self, function: Callable[[], Dict[LabelValues, float]]) -> None:
+        """Compute the gauge at scrape time; ``function`` returns {labels: value}."""
+        self._function = function
+
+    def values(self) -> Dict[LabelValues, float]:
+        if self._function is not None:
+            return self._function()
+        return super().values()
+
+
+class Histogram(_ShardedMetric):
+    """Distribution of observations in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shard()
+        data = shard.get(labels)
+        if data is None:
+            # One slot per bucket, one for +Inf, then sum
+            data = shard[labels] = [0] * (len(self.buckets) + 2)
+        data[bisect_left(self.buckets, value)] += 1
+        data[-1] += value
+
+    def collect(self) -> Iterable[str]:
+        totals: Dict[LabelValues, List[float]] = {}
+        for snapshot in self._snapshots():
+            for labels, data in snapshot.items():
+                total = totals.setdefault(labels, [0] * len(data))
+                for i, value in enumerate(list(data)):
+                    total[i] += value
+
+        names = self.labelnames + ("le",)
+        for labels, data in sorted(totals.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), data):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(names, labels + (_format_value(bound),))} {cumulative}"
+            label_str = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_str} {_format_value(data[-1])}"
+            yield f"{self.name}_count{label_str} {cumulative}"
+
+
+class MetricsRegistry:
+    """Holds all metrics of the process and renders them."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _ShardedMetric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        """Return all metrics in Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.collect())
+        output = "\n".join(lines) + "\n"
+
+        try:
+            from prometheus_client import REGISTRY as PROMETHEUS_REGISTRY, generate_latest
+        except ImportError:
+            return output
+        return output + generate_latest(PROMETHEUS_REGISTRY).decode()
+
+
+# Global registry instance
+REGISTRY = MetricsRegistry()
+
+# Cache effectiveness, shared by every cache in the application
+CACHE_REQUESTS = REGISTRY.counter(
+    "todo_cache_requests_total",
+    "Cache lookups by cache name and result (hit or miss).",
+    ("cache", "result"),
+)
@@ -0,0 +1,222 @@
+"""
+On-demand request profiling.
+
+A request is profiled when an admin asks for it (``X-Profile`` header) or
+when its route has been armed for the next N requests. Sync endpoints run
+in a worker thread, so a request is profiled in two parts that are merged
+into one artifact: the endpoint call in its worker thread, and the event
+loop thread while the request is in flight (validation, serialization and
+middleware; this part may include other requests handled concurrently).
+
+cProfile is always available and produces a pstats file; pyinstrument is
+used when installed and selected, and produces speedscope JSON.
+"""
+
+import cProfile
+import functools
+import itertools
+import marshal
+import pstats
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Deque, List, Optional, Pattern
+
+try:
+    import pyinstrument
+except ImportError:  # pragma: no cover - optional dependency
+    pyinstrument = None
+
+
+@dataclass
+class ProfileArtifact:
+    """A finished profile ready for download."""
+
+    id: str
+    method: str
+    path: str
+    duration_ms: float
+    format: str
+    media_type: str
+    filename: str
+    content: bytes = field(repr=False)
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class _ArmedRoute:
+    method: Optional[str]
+    route: str
+    pattern: Pattern
+    remaining: int
+
+
+class ProfileStore:
+    """Armed routes and the most recent profile artifacts."""
+
+    def __init__(self, max_stored: int = 20):
+        self._artifacts: Deque[ProfileArtifact] = deque(maxlen=max_stored)
+        self._armed: List[_ArmedRoute] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    @property
+    def armed(self) -> bool:
+        return bool(self._armed)
+
+    def arm(self, route: str, count: int, method: Optional[str] = None) -> None:
+        """Profile the next ``count`` requests whose path matches a route template."""
+        pattern = re.compile("^" + re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(route.rstrip("/"))) + "/?$")
+        with self._lock:
+            self._armed = [a for a in self._armed if not (a.route == route and a.method == method)]
+            self._armed.append(_ArmedRoute(method.upper() if method else None, route, pattern, count))
+
+    def disarm(self) -> None:
+        with self._lock:
+            self._armed = []
+
+    def armed_routes(self) -> List[dict]:
+        with self._lock:
+            return [{"route": a.route, "method": a.method, "remaining": a.remaining} for a in self._armed]
+
+    def claim(self, method: str, path: str) -> bool:
+        """Use up one armed slot matching the request, if any."""
+        with self._lock:
+            for armed in self._armed:
+                if armed.method in (None, method) and armed.pattern.match(path):
+                    armed.remaining -= 1
+                    if armed.remaining <= 0:
+                        self._armed.remove(armed)
+                    return True
+        return False
+
+    def next_id(self) -> str:
+        return f"{int(time.time())}-{next(self._ids)}"
+
+    def add(self, artifact: ProfileArtifact) -> None:
+        with self._lock:
+            self._artifacts.append(artifact)
+
+    def list(self) -> List[ProfileArtifact]:
+        with self._lock:
+            return list(reversed(self._artifacts))
+
+    def get(self, profile_id: str) -> Optional[ProfileArtifact]:
+        with self._lock:
+            return next((a for a in self._artifacts if a.id == profile_id), None)
+
+
+class ProfileSession:
+    """Collects the profile of one request across threads."""
+
+    def __init__(self, profile_id: str, use_pyinstrument: bool):
+        self.profile_id = profile_id
+        self.use_pyinstrument = use_pyinstrument and pyinstrument is not None
+        self._parts: list = []
+        self._lock = threading.Lock()
+        self._loop_profiler = None
+
+    def _new_profiler(self):
+        if self.use_pyinstrument:
+            return pyinstrument.Profiler(async_mode="disabled")
+        return cProfile.Profile()
+
+    def _collect(self, profiler) -> None:
+        with self._lock:
+            self._parts.append(profiler.last_session if self.use_pyinstrument else profiler)
+
+    # Only one request at a time can profile the (shared) event loop thread
+    _loop_busy = False
+
+    def start_loop(self) -> None:
+        """Profile the event loop thread until ``stop_loop``."""
+        if ProfileSession._loop_busy:
+            return
+        ProfileSession._loop_busy = True
+        self._loop_profiler = self._new_profiler()
+        self._loop_profiler.start() if self.use_pyinstrument else self._loop_profiler.enable()
+
+    def stop_loop(self) -> None:
+        profiler = self._loop_profiler
+        if profiler is None:
+            return
+        profiler.stop() if self.use_pyinstrument else profiler.disable()
+        ProfileSession._loop_busy = False
+        self._collect(profiler)
+
+    def run(self, func: Callable, *args, **kwargs):
+        """Call ``func`` under a profiler in the current thread."""
+        profiler = self._new_profiler()
+        if self.use_pyinstrument:
+            profiler.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.stop()
+                self._collect(profiler)
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ allows one active cProfile, which already sees all threads
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            self._collect(profiler)
+
+    def finish(self, method: str, path: str, duration: float) -> Optional[ProfileArtifact]:
+        """Merge all parts into a downloadable artifact, or None if nothing was recorded."""
+        if not self._parts:
+            return None
+        if self.use_pyinstrument:
+            from pyinstrument.renderers import SpeedscopeRenderer
+            from pyinstrument.session import Session
+
+            combined = functools.reduce(Session.combine, self._parts)
+            return ProfileArtifact(
+                id=self.profile_id, method=method, path=path,
+                duration_ms=duration * 1000, format="speedscope",
+                media_type="application/json", filename=f"profile-{self.profile_id}.speedscope.json",
+                content=SpeedscopeRenderer().render(combined).encode(),
+            )
+
+        stats = pstats.Stats(self._parts[0])
+        for part in self._parts[1:]:
+            stats.add(part)
+        return ProfileArtifact(
+            id=self.profile_id, method=method, path=path,
+            duration_ms=duration * 1000, format="pstats",
+            media_type="application/octet-stream", filename=f"profile-{self.profile_id}.prof",
+            content=marshal.dumps(stats.stats),
+        )
+
+
+_current: ContextVar[Optional[ProfileSession]] = ContextVar("profile_session", default=None)
+
+
+def activate(session: ProfileSession):
+    return _current.set(session)
+
+
+def deactivate(token) -> None:
+    _current.reset(token)
+
+
+def profiled(func: Callable) -> Callable:
+    """Run ``func`` under the request's profiler when one is active."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        session = _current.get()
+        if session is None:
+            return func(*args, **kwargs)
+        return session.run(func, *args, **kwargs)
+    return wrapper
+
+
+# Global profile store
+PROFILES = ProfileStore()
@@ -0,0 +1,95 @@
+"""
+Lightweight per-request timing reported as a ``Server-Timing`` header.
+
+A ``ServerTiming`` collector is only installed for sampled requests; for
+all others every hook below is a single context variable lookup. Times
+are exclusive: a service's time does not include the repository calls it
+makes, and a repository's time does not include its SQL statements, so
+the entries add up to the request total.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+
+class ServerTiming:
+    """Accumulates exclusive durations per phase for one request."""
+
+    __slots__ = ("durations", "counts", "_stack")
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self._stack: List[list] = []
+
+    def _add(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def start(self, name: str) -> None:
+        """Open a phase; nested phases are subtracted from it."""
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def stop(self) -> None:
+        """Close the innermost open phase."""
+        name, start, children = self._stack.pop()
+        duration = time.perf_counter() - start
+        self._add(name, duration - children)
+        if self._stack:
+            self._stack[-1][2] += duration
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add an already measured duration as a child of the open phase."""
+        self._add(name, seconds)
+        if self._stack:
+            self._stack[-1][2] += seconds
+
+    def header_value(self, total: float) -> str:
+        """Render the collected phases as a Server-Timing header value."""
+        entries = [
+            f'{name};dur={seconds * 1000:.2f};desc="{self.counts[name]}x"'
+            for name, seconds in self.durations.items()
+        ]
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[Optional[ServerTiming]] = ContextVar("server_timing", default=None)
+
+
+def activate(collector: Optional[ServerTiming]):
+    """Install ``collector`` for the current request; returns a reset token."""
+    return _current.set(collector)
+
+
+def deactivate(token) -> None:
+    """Remove the collector installed by ``activate``."""
+    _current.reset(token)
+
+
+def current() -> Optional[ServerTiming]:
+    """Return the collector of the current request, if timing is enabled."""
+    return _current.get()
+
+
+def record(name: str, seconds: float) -> None:
+    """Record an externally measured duration (e.g. a SQL statement)."""
+    collector = _current.get()
+    if collector is not None:
+        collector.record(name, seconds)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time the enclosed block as phase ``name``."""
+    collector = _current.get()
+    if collector is None:
+        yield
+        return
+    collector.start(name)
+    try:
+        yield
+    finally:
+        collector.stop()
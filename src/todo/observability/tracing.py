@@ -0,0 +1,335 @@
+"""
+Minimal OpenTelemetry-compatible tracing.
+
+Spans carry W3C trace context (``traceparent``) and are exported in the
+OTLP/JSON span format, either to a collector over HTTP or to a local
+console/file exporter, so no collector is needed to inspect them.
+
+Sampling is decided once per trace at the root span: an incoming sampled
+``traceparent`` is honoured, otherwise ``sample_rate`` applies. Child
+spans are only created under a sampled parent, so unsampled requests pay
+a single context variable lookup per instrumented call.
+"""
+
+import atexit
+import importlib
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "kind",
+        "start_ns", "end_ns", "attributes", "status", "status_message",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes or {}
+        self.status = STATUS_UNSET
+        self.status_message = ""
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Return the span in OTLP/JSON representation."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": self.status, "message": self.status_message},
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class ConsoleSpanExporter:
+    """Writes one OTLP/JSON span per line to stdout."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def export(self, spans: List[Span]) -> None:
+        self.stream.write("".join(json.dumps(span.to_otlp()) + "\n" for span in spans))
+        self.stream.flush()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class FileSpanExporter(ConsoleSpanExporter):
+    """Appends one OTLP/JSON span per line to a file."""
+
+    def __init__(self, path: str):
+        super().__init__(open(path, "a", encoding="utf-8"))
+
+    def shutdown(self) -> None:
+        self.stream.close()
+
+
+class OtlpHttpSpanExporter:
+    """Posts spans to an OTLP/HTTP collector using the JSON encoding."""
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.resource = {"attributes": [_otlp_attribute("service.name", service_name)]}
+
+    def export(self, spans: List[Span]) -> None:
+        body = json.dumps({
+            "resourceSpans": [{
+                "resource": self.resource,
+                "scopeSpans": [{
+                    "scope": {"name": "todo"},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }],
+        }).encode()
+        request = urllib.request.Request(
+            self.endpoint, data=body, headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+class BatchSpanProcessor:
+    """Exports finished spans in batches from a background thread."""
+
+    def __init__(self, exporter, max_queue_size: int = 2048, batch_size: int = 256, interval: float = 2.0):
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            batch: List[Span] = []
+            deadline = time.monotonic() + self.interval
+            while len(batch) < self.batch_size:
+                try:
+                    span = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if span is None:
+                    running = False
+                    break
+                batch.append(span)
+            if batch:
+                try:
+                    self.exporter.export(batch)
+                except Exception as e:
+                    logger.warning("Span export failed: %s", e)
+
+    def shutdown(self) -> None:
+        # Never block at exit on a full queue; the thread then stops at the join timeout
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        self._thread.join(timeout=5)
+        self.exporter.shutdown()
+
+
+_processor: Optional[BatchSpanProcessor] = None
+_sample_rate: float = 0.0
+_current: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def build_exporter(name: str, file_path: str, otlp_endpoint: str, service_name: str):
+    """
+    Create an exporter by name: ``console``, ``file``, ``otlp`` or a
+    ``module:attribute`` path to a factory returning an object with
+    ``export(spans)`` and ``shutdown()``.
+    """
+    if name == "console":
+        return ConsoleSpanExporter()
+    if name == "file":
+        return FileSpanExporter(file_path)
+    if name == "otlp":
+        return OtlpHttpSpanExporter(otlp_endpoint, service_name)
+    module_name, _, attribute = name.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)()
+
+
+def configure(exporter, sample_rate: float) -> None:
+    """Enable tracing with ``exporter`` and a root sampling probability."""
+    global _processor, _sample_rate
+    if _processor is not None:
+        atexit.unregister(_processor.shutdown)
+        _processor.shutdown()
+    _processor = BatchSpanProcessor(exporter)
+    _sample_rate = sample_rate
+    atexit.register(_processor.shutdown)
+
+
+def after_fork() -> None:
+    """Restart the exporter thread in a forked worker; threads do not survive fork."""
+    global _processor
+    if _processor is not None:
+        # Spans queued in the parent belong to it; start over with the same exporter
+        atexit.unregister(_processor.shutdown)
+        _processor = BatchSpanProcessor(_processor.exporter)
+        atexit.register(_processor.shutdown)
+
+
+def is_enabled() -> bool:
+    return _processor is not None
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def parse_traceparent(value: Optional[str]):
+    """Return ``(trace_id, parent_id, sampled)`` from a traceparent header, or None."""
+    match = _TRACEPARENT_RE.match(value.strip().lower()) if value else None
+    if not match or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2), bool(int(match.group(3), 16) & 1)
+
+
+def start_root_span(
+    name: str,
+    traceparent: Optional[str] = None,
+    kind: int = SPAN_KIND_SERVER,
+    attributes: Optional[Dict[str, Any]] = None,
+    sample_rate: Optional[float] = None,
+) -> Optional[Span]:
+    """Start a span that begins (or continues) a trace, if it is sampled."""
+    if _processor is None:
+        return None
+    parent = parse_traceparent(traceparent)
+    if parent is not None:
+        trace_id, parent_id, sampled = parent
+    else:
+        trace_id, parent_id = f"{random.getrandbits(128):032x}", None
+        sampled = random.random() < (_sample_rate if sample_rate is None else sample_rate)
+    if not sampled:
+        return None
+    return Span(name, trace_id, parent_id, kind, attributes)
+
+
+def start_span(name: str, kind: int = SPAN_KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None) -> Optional[Span]:
+    """Start a child of the current span without making it current."""
+    parent = _current.get()
+    if parent is None:
+        return None
+    return Span(name, parent.trace_id, parent.span_id, kind, attributes)
+
+
+def end_span(span: Optional[Span]) -> None:
+    """Finish a span and hand it to the exporter."""
+    if span is None or _processor is None:
+        return
+    span.end_ns = time.time_ns()
+    _processor.on_end(span)
+
+
+@contextmanager
+def activate(span: Optional[Span]) -> Iterator[Optional[Span]]:
+    """Make ``span`` current for the block, then end it."""
+    if span is None:
+        yield None
+        return
+    token = _current.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_error(e)
+        raise
+    finally:
+        _current.reset(token)
+        end_span(span)
+
+
+@contextmanager
+def span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Optional[Span]]:
+    """Run the block in a child span of the current span, if any."""
+    with activate(start_span(name, attributes=attributes)) as child:
+        yield child
+
+
+def configure_from_env(config) -> None:
+    """Enable tracing according to the application configuration."""
+    if config.TRACING_EXPORTER in ("", "none"):
+        return
+    exporter = build_exporter(
+        config.TRACING_EXPORTER,
+        config.TRACING_FILE_PATH,
+        config.TRACING_OTLP_ENDPOINT,
+        config.TRACING_SERVICE_NAME or f"todo-{os.getpid()}",
+    )
+    configure(exporter, config.TRACING_SAMPLE_RATE)
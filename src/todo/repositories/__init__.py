@@ -1,4 +1,21 @@
 from .project_repository import ProjectRepository
 from .task_repository import TaskRepository
+from .idempotency_repository import IdempotencyRepository
+from .job_run_repository import JobRunRepository
+from .background_job_repository import BackgroundJobRepository
+from .job_watermark_repository import JobWatermarkRepository
+from .task_archive_repository import TaskArchiveRepository
+from .task_event_repository import TaskEventRepository
+from .task_stats_repository import TaskStatsRepository
 
-__all__ = ["ProjectRepository", "TaskRepository"]
\ No newline at end of file
+__all__ = [
+    "ProjectRepository",
+    "TaskRepository",
+    "IdempotencyRepository",
+    "JobRunRepository",
+    "BackgroundJobRepository",
+    "JobWatermarkRepository",
+    "TaskArchiveRepository",
+    "TaskEventRepository",
+    "TaskStatsRepository",
+]
\ No newline at end of file
@@ -0,0 +1,139 @@
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from ..db.session import commit
+from ..models.background_job import BackgroundJob
+from ..observability.instrument import instrument
+
+
+@instrument("repo")
+class BackgroundJobRepository:
+    """Repository class for the background job queue."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_by_id(self, job_id: int) -> Optional[BackgroundJob]:
+        """Retrieve a job by its ID."""
+        return self.session.get(BackgroundJob, job_id)
+
+    def is_running(self, kind: str, project_id: int) -> bool:
+        """Whether a job of ``kind`` for ``project_id`` is being run by a worker."""
+        stmt = (
+            select(BackgroundJob.id)
+            .where(
+                BackgroundJob.kind == kind,
+                BackgroundJob.status == "running",
+                BackgroundJob.payload["project_id"].as_integer() == project_id,
+            )
+            .limit(1)
+        )
+        return self.session.scalar(stmt) is not None
+
+    def enqueue(self, kind: str, payload: Any, priority: int = 0, max_attempts: int = 5) -> BackgroundJob:
+        """Add a job to the queue."""
+        job = BackgroundJob(kind=kind, payload=payload, priority=priority, max_attempts=max_attempts)
+        self.session.add(job)
+        commit(self.session)
+        return job
+
+    def claim(self, worker_id: str) -> Optional[BackgroundJob]:
+        """
+        Take the next due job, highest priority first.
+
+        The candidate row is selected with FOR UPDATE SKIP LOCKED, so workers
+        never wait on each other (PostgreSQL). The conditional update makes
+        the claim safe where row locks are not supported (SQLite).
+        """
+        now = datetime.now()
+        stmt = (
+            select(BackgroundJob.id)
+            .where(BackgroundJob.status == "queued", BackgroundJob.run_at <= now)
+            .order_by(BackgroundJob.priority.desc(), BackgroundJob.run_at, BackgroundJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job_id = self.session.scalar(stmt)
+        if job_id is None:
+            self.session.rollback()
+            return None
+
+        result = self.session.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id, BackgroundJob.status == "queued")
+            .values(
+                status="running",
+                locked_by=worker_id,
+                locked_at=now,
+                attempts=BackgroundJob.attempts + 1,
+            )
+        )
+        self.session.commit()
+        if result.rowcount != 1:
+            return None
+        return self.session.get(BackgroundJob, job_id, populate_existing=True)
+
+    def _finish(self, job: BackgroundJob, worker_id: str, **values: Any) -> bool:
+        """Update a job still held by ``worker_id``; False if it was taken over."""
+        result = self.session.execute(
+            update(BackgroundJob)
+            .where(
+                BackgroundJob.id == job.id,
+                BackgroundJob.status == "running",
+                BackgroundJob.locked_by == worker_id,
+            )
+            .values(locked_by=None, **values)
+            .execution_options(synchronize_session="fetch")
+        )
+        commit(self.session)
+        return result.rowcount == 1
+
+    def complete(self, job: BackgroundJob, worker_id: str, result: Any) -> bool:
+        """Mark a job run by ``worker_id`` as succeeded."""
+        return self._finish(job, worker_id, status="succeeded", result=result, error=None, finished_at=datetime.now())
+
+    def fail(self, job: BackgroundJob, worker_id: str, error: str, retry_at: Optional[datetime]) -> bool:
+        """Re-queue a job ``worker_id`` failed to run for ``retry_at``, or mark it failed for good."""
+        if retry_at is None:
+            return self._finish(job, worker_id, status="failed", error=error, finished_at=datetime.now())
+        return self._finish(job, worker_id, status="queued", error=error, run_at=retry_at)
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """Refresh the lock of a job ``worker_id`` is still running; False if it lost it."""
+        result = self.session.execute(
+            update(BackgroundJob)
+            .where(
+                BackgroundJob.id == job_id,
+                BackgroundJob.status == "running",
+                BackgroundJob.locked_by == worker_id,
+            )
+            .values(locked_at=datetime.now())
+        )
+        commit(self.session)
+        return result.rowcount == 1
+
+    def requeue_stale(self, locked_before: datetime, error: str) -> Tuple[int, int]:
+        """
+        Re-queue running jobs whose worker stopped before finishing them.
+
+        Jobs that have used all their attempts are marked failed with
+        ``error`` instead, so a job that kills its worker is not run forever.
+
+        Returns the number of jobs re-queued and failed.
+        """
+        stale = (BackgroundJob.status == "running", BackgroundJob.locked_at < locked_before)
+        failed = self.session.execute(
+            update(BackgroundJob)
+            .where(*stale, BackgroundJob.attempts >= BackgroundJob.max_attempts)
+            .values(status="failed", locked_by=None, error=error, finished_at=datetime.now())
+        )
+        requeued = self.session.execute(
+            update(BackgroundJob)
+            .where(*stale, BackgroundJob.attempts < BackgroundJob.max_attempts)
+            .values(status="queued", locked_by=None, run_at=datetime.now())
+        )
+        commit(self.session)
+        return requeued.rowcount, failed.rowcount
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import and_, delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..config import config
+from ..db.session import commit
+from ..models.idempotency_key import IdempotencyKey
+from ..observability.instrument import instrument
+
+
+@instrument("repo")
+class IdempotencyRepository:
+    """Repository class for stored idempotent responses."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get(self, key: str, scope: str) -> Optional[IdempotencyKey]:
+        """Return the unexpired record for a key, if any."""
+        record = self.session.get(IdempotencyKey, (key, scope))
+        if record is not None and record.expires_at <= datetime.now():
+            return None
+        return record
+
+    def reserve(self, key: str, scope: str, request_hash: str) -> Optional[datetime]:
+        """
+        Insert a reservation for the key, held for IDEMPOTENCY_LOCK_TIMEOUT_SECONDS.
+
+        Returns the reservation's ``locked_until``, which identifies it to
+        ``complete`` and ``release``, or None if another request already
+        holds the key. An expired record, or a reservation whose lock ran
+        out before its request finished, is replaced.
+        """
+        now = datetime.now()
+        self.session.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.key == key,
+                IdempotencyKey.scope == scope,
+                or_(
+                    IdempotencyKey.expires_at <= now,
+                    and_(
+                        IdempotencyKey.status_code.is_(None),
+                        or_(IdempotencyKey.locked_until.is_(None), IdempotencyKey.locked_until <= now),
+                    ),
+                ),
+            )
+        )
+        locked_until = now + timedelta(seconds=config.IDEMPOTENCY_LOCK_TIMEOUT_SECONDS)
+        self.session.add(IdempotencyKey(
+            key=key,
+            scope=scope,
+            request_hash=request_hash,
+            expires_at=now + timedelta(seconds=config.IDEMPOTENCY_KEY_TTL_SECONDS),
+            locked_until=locked_until,
+        ))
+        try:
+            self.session.commit()
+        except IntegrityError:
+            self.session.rollback()
+            return None
+        return locked_until
+
+    def _reservation(self, key: str, scope: str, locked_until: datetime):
+        """Condition matching the unfinished reservation made with ``locked_until``."""
+        return and_(
+            IdempotencyKey.key == key,
+            IdempotencyKey.scope == scope,
+            IdempotencyKey.status_code.is_(None),
+            IdempotencyKey.locked_until == locked_until,
+        )
+
+    def complete(
+        self, key: str, scope: str, locked_until: datetime, status_code: int, response_body: Any
+    ) -> bool:
+        """
+        Store the response produced for a reserved key.
+
+        Returns False if the reservation was taken over by a retry after its
+        lock ran out; nothing is stored then.
+        """
+        result = self.session.execute(
+            update(IdempotencyKey)
+            .where(self._reservation(key, scope, locked_until))
+            .values(status_code=status_code, response_body=response_body, locked_until=None)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return False
+        commit(self.session)
+        return True
+
+    def release(self, key: str, scope: str, locked_until: datetime) -> None:
+        """Drop a reservation so the key can be retried."""
+        self.session.execute(
+            delete(IdempotencyKey).where(self._reservation(key, scope, locked_until))
+        )
+        self.session.commit()
+
+    def delete_expired(self) -> int:
+        """Delete all expired records and return how many were removed."""
+        result = self.session.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.expires_at <= datetime.now())
+        )
+        self.session.commit()
+        return result.rowcount
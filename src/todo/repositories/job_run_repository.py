@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from ..db.session import commit
+from ..models.job_run import JobRun
+from ..observability.instrument import instrument
+
+
+@instrument("repo")
+class JobRunRepository:
+    """Repository class for the scheduler job run history."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def create(
+        self,
+        job_name: str,
+        started_at: datetime,
+        duration_ms: float,
+        rows_scanned: Optional[int] = None,
+        rows_affected: Optional[int] = None,
+        error: Optional[str] = None,
+        runs: int = 1,
+    ) -> JobRun:
+        """Record a job run."""
+        run = JobRun(
+            job_name=job_name,
+            started_at=started_at,
+            duration_ms=duration_ms,
+            rows_scanned=rows_scanned,
+            rows_affected=rows_affected,
+            error=error,
+            runs=runs,
+        )
+        self.session.add(run)
+        commit(self.session)
+        return run
+
+    def get_recent(self, job_name: Optional[str] = None, limit: int = 50) -> List[JobRun]:
+        """Most recent runs, newest first."""
+        stmt = select(JobRun).order_by(JobRun.started_at.desc()).limit(limit)
+        if job_name is not None:
+            stmt = stmt.where(JobRun.job_name == job_name)
+        return list(self.session.scalars(stmt))
+
+    def get_since(self, since: datetime, job_name: Optional[str] = None) -> List[JobRun]:
+        """Runs started at or after ``since``, oldest first."""
+        stmt = select(JobRun).where(JobRun.started_at >= since).order_by(JobRun.started_at)
+        if job_name is not None:
+            stmt = stmt.where(JobRun.job_name == job_name)
+        return list(self.session.scalars(stmt))
+
+    def get_compactable(self, before: datetime) -> List[JobRun]:
+        """Successful single runs started before ``before``."""
+        stmt = select(JobRun).where(
+            JobRun.started_at < before,
+            JobRun.runs == 1,
+            JobRun.error.is_(None),
+        ).order_by(JobRun.job_name, JobRun.started_at)
+        return list(self.session.scalars(stmt))
+
+    def delete_runs(self, runs: List[JobRun]) -> None:
+        """Delete the given runs (flushed, committed by the caller)."""
+        ids = [run.id for run in runs]
+        for start in range(0, len(ids), 500):
+            self.session.execute(delete(JobRun).where(JobRun.id.in_(ids[start:start + 500])))
+
+    def delete_older_than(self, cutoff: datetime) -> int:
+        """Delete runs started before ``cutoff``; returns the number deleted."""
+        result = self.session.execute(delete(JobRun).where(JobRun.started_at < cutoff))
+        commit(self.session)
+        return result.rowcount
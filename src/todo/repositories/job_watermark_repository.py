@@ -0,0 +1,31 @@
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from ..db.session import commit
+from ..models.job_watermark import JobWatermark
+from ..observability.instrument import instrument
+
+
+@instrument("repo")
+class JobWatermarkRepository:
+    """Repository class for scheduler job watermarks."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get(self, name: str) -> Optional[date]:
+        """Return the watermark of a job, or None if it never completed a run."""
+        watermark = self.session.get(JobWatermark, name)
+        return watermark.value if watermark else None
+
+    def set(self, name: str, value: date) -> None:
+        """Store the watermark of a job."""
+        watermark = self.session.get(JobWatermark, name)
+        if watermark is None:
+            self.session.add(JobWatermark(name=name, value=value))
+        else:
+            watermark.value = value
+            watermark.updated_at = datetime.now()
+        commit(self.session)
@@ -1,42 +1,84 @@
+from datetime import date, datetime
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select, func, delete, update
 
 from ..models.project import Project
+from ..models.task import Task
 from ..exceptions.service_exceptions import (
     ProjectNotFoundError,
     ProjectNameExistsError,
     ProjectLimitExceededError,
 )
 from ..config import config
+from ..db.session import commit
+from ..observability.instrument import instrument
+from ..signals import mark_deadlines_changed
 
 
+@instrument("repo")
 class ProjectRepository:
     """Repository class for Project database operations."""
 
     def __init__(self, session: Session) -> None:
         self.session = session
 
-    def get_by_id(self, project_id: int) -> Optional[Project]:
-        """Retrieve project by its ID."""
-        return self.session.get(Project, project_id)
+    def get_by_id(self, project_id: int, with_tasks: bool = False) -> Optional[Project]:
+        """Retrieve a live (not deleted) project by its ID, optionally with its tasks loaded."""
+        options = [selectinload(Project.tasks.and_(Task.deleted_at.is_(None)))] if with_tasks else None
+        project = self.session.get(Project, project_id, options=options)
+        if project is None or project.deleted_at is not None:
+            return None
+        return project
+
+    def get_all(self, with_tasks: bool = False) -> List[Project]:
+        """
+        Return list of all live projects ordered by creation time.
 
-    def get_all(self) -> List[Project]:
-        """Return list of all projects ordered by creation time."""
-        stmt = select(Project).order_by(Project.created_at)
+        With ``with_tasks`` the tasks of all projects are loaded in one
+        extra query (selectin loading) instead of one query per project.
+        """
+        stmt = select(Project).where(Project.deleted_at.is_(None)).order_by(Project.created_at)
+        if with_tasks:
+            stmt = stmt.options(selectinload(Project.tasks.and_(Task.deleted_at.is_(None))))
         return list(self.session.scalars(stmt))
 
     def get_by_name(self, name: str) -> Optional[Project]:
-        """Return a project by its unique name."""
-        stmt = select(Project).where(Project.name == name)
+        """Return a live project by its unique name."""
+        stmt = select(Project).where(Project.name == name, Project.deleted_at.is_(None))
         return self.session.scalar(stmt)
 
     def get_project_count(self) -> int:
-        """Return total number of stored projects."""
-        stmt = select(func.count(Project.id))
+        """Return total number of live projects."""
+        stmt = select(func.count(Project.id)).where(Project.deleted_at.is_(None))
+        return self.session.scalar(stmt)
+
+    def lock_deleted(self, project_id: int) -> Optional[Project]:
+        """
+        Lock and return a soft-deleted project (SELECT ... FOR UPDATE).
+
+        Returns None if the project is live or gone. The lock is held until
+        the session commits, so a concurrent restore or purge waits for it.
+        """
+        stmt = (
+            select(Project)
+            .where(Project.id == project_id, Project.deleted_at.is_not(None))
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
         return self.session.scalar(stmt)
 
+    def get_deleted_ids(self, deleted_before: datetime, limit: int) -> List[int]:
+        """Return IDs of projects deleted before ``deleted_before``, oldest first."""
+        stmt = (
+            select(Project.id)
+            .where(Project.deleted_at < deleted_before)
+            .order_by(Project.deleted_at)
+            .limit(limit)
+        )
+        return list(self.session.scalars(stmt))
+
     def create(self, name: str, description: str = "") -> Project:
         """Create a new project with validation."""
         # Check project limit
@@ -51,7 +93,7 @@ class ProjectRepository:
 
         project = Project(name=name, description=description)
         self.session.add(project)
-        self.session.commit()
+        commit(self.session)
         self.session.refresh(project)
 
         return project
@@ -81,20 +123,76 @@ class ProjectRepository:
         if description is not None:
             project.description = description
 
-        self.session.commit()
+        commit(self.session)
         self.session.refresh(project)
 
         return project
 
     def delete(self, project_id: int) -> bool:
-        """Delete a project by ID."""
-        project = self.get_by_id(project_id)
-        if not project:
+        """
+        Soft-delete a project by ID.
+
+        A single UPDATE whatever the project's size: its tasks are hidden
+        with it (also from the autoclose and archive jobs) and removed later
+        by the purge job.
+        """
+        result = self.session.execute(
+            update(Project)
+            .where(Project.id == project_id, Project.deleted_at.is_(None))
+            .values(deleted_at=datetime.now())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
             raise ProjectNotFoundError(
                 f"Project with ID {project_id} not found"
             )
 
-        self.session.delete(project)
-        self.session.commit()
+        mark_deadlines_changed(self.session)
+        commit(self.session)
 
         return True
+
+    def restore(self, project_id: int) -> Project:
+        """Undo the soft delete of a project that was not purged yet."""
+        project = self.session.get(Project, project_id)
+        if not project or project.deleted_at is None:
+            raise ProjectNotFoundError(
+                f"Deleted project with ID {project_id} not found"
+            )
+
+        if self.get_project_count() >= config.MAX_NUMBER_OF_PROJECT:
+            raise ProjectLimitExceededError("Max number of projects reached.")
+
+        if self.get_by_name(project.name):
+            raise ProjectNameExistsError(
+                f"Project with name '{project.name}' already exists"
+            )
+
+        project.deleted_at = None
+        # The autoclose job skipped its tasks while it was deleted, so lapsed
+        # deadlines may be behind the job's watermark now
+        self.session.execute(
+            update(Task)
+            .where(
+                Task.project_id == project_id,
+                Task.deleted_at.is_(None),
+                Task.status != "done",
+                Task.deadline < date.today(),
+            )
+            .values(overdue_recheck=True)
+            .execution_options(synchronize_session=False)
+        )
+        mark_deadlines_changed(self.session)
+        commit(self.session)
+        self.session.refresh(project)
+
+        return project
+
+    def purge(self, project_id: int) -> None:
+        """Hard-delete a soft-deleted project row; its tasks must have been removed first."""
+        self.session.execute(
+            delete(Project)
+            .where(Project.id == project_id, Project.deleted_at.is_not(None))
+            .execution_options(synchronize_session=False)
+        )
+        commit(self.session)
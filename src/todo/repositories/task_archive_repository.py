@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy import select, delete, insert, literal, DateTime
+from sqlalchemy.orm import Session
+
+from ..db.session import commit
+from ..models.archived_task import ArchivedTask
+from ..models.task import Task
+from ..observability.instrument import instrument
+from .task_repository import in_live_project
+
+# Columns copied from ``tasks`` to ``tasks_archive``
+_ARCHIVED_COLUMNS = (
+    "id", "title", "project_id", "description", "status", "deadline", "closed_at", "created_at"
+)
+
+
+@instrument("repo")
+class TaskArchiveRepository:
+    """
+    Repository class for archived tasks: moving long closed tasks out of
+    ``tasks`` and reading them back.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_by_id(self, task_id: int) -> Optional[ArchivedTask]:
+        """Retrieve an archived task by its (original) ID."""
+        return self.session.get(ArchivedTask, task_id)
+
+    def get_by_project_id(self, project_id: int) -> List[ArchivedTask]:
+        """Retrieve the archived tasks of a project."""
+        stmt = select(ArchivedTask).where(ArchivedTask.project_id == project_id)
+        return list(self.session.scalars(stmt))
+
+    def archive_closed(
+        self,
+        closed_before: datetime,
+        batch_size: int,
+        on_batch: Optional[Callable[[int], bool]] = None,
+    ) -> int:
+        """
+        Move done tasks closed before ``closed_before`` to the archive.
+        Tasks of deleted projects stay where they are until the purge.
+
+        Each batch of ``batch_size`` rows is locked with SKIP LOCKED, copied
+        and deleted in its own transaction, so concurrent writers are never
+        blocked for long. ``on_batch`` is called with the number of tasks
+        moved after each batch and stops the run by returning False.
+
+        Returns the number of tasks archived.
+        """
+        archived = 0
+        while True:
+            stmt = (
+                select(Task.id)
+                .where(
+                    Task.status == "done",
+                    Task.closed_at < closed_before,
+                    Task.deleted_at.is_(None),
+                    in_live_project(),
+                )
+                .order_by(Task.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            ids = list(self.session.scalars(stmt))
+            if not ids:
+                self.session.rollback()
+                return archived
+
+            rows = select(
+                *(getattr(Task, column) for column in _ARCHIVED_COLUMNS),
+                literal(datetime.now(), DateTime),
+            ).where(Task.id.in_(ids))
+            self.session.execute(
+                insert(ArchivedTask).from_select([*_ARCHIVED_COLUMNS, "archived_at"], rows)
+            )
+            self.session.execute(
+                delete(Task).where(Task.id.in_(ids)).execution_options(synchronize_session=False)
+            )
+            commit(self.session)
+            archived += len(ids)
+
+            if on_batch is not None and not on_batch(len(ids)):
+                return archived
+            if len(ids) < batch_size:
+                return archived
+
+    def delete_by_project(self, project_id: int, batch_size: int) -> int:
+        """
+        Delete the archived tasks of a project, committing every
+        ``batch_size`` rows.
+
+        Returns the number of archived tasks deleted.
+        """
+        deleted = 0
+        while True:
+            stmt = (
+                select(ArchivedTask.id)
+                .where(ArchivedTask.project_id == project_id)
+                .order_by(ArchivedTask.id)
+                .limit(batch_size)
+            )
+            ids = list(self.session.scalars(stmt))
+            if not ids:
+                return deleted
+            self.session.execute(
+                delete(ArchivedTask).where(ArchivedTask.id.in_(ids)).execution_options(synchronize_session=False)
+            )
+            commit(self.session)
+            deleted += len(ids)
@@ -0,0 +1,135 @@
+"""
+Repository for the task event log.
+
+Events recorded during a transaction are buffered on the session and
+written with multi-row INSERTs just before it commits, so a request pays
+for at most one extra statement however many events it records, and the
+events commit or roll back together with the writes they describe.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+from sqlalchemy import event, select, delete, insert, literal, DateTime, String
+from sqlalchemy.orm import Session
+
+from ..db.session import commit
+from ..db.types import CodedString
+from ..models.task import Task, VALID_STATUSES
+from ..models.task_event import TaskEvent
+from ..observability.instrument import instrument
+
+_BUFFER = "task_events"
+
+# Rows per INSERT statement, well under the bind parameter limits
+INSERT_CHUNK_SIZE = 1000
+
+
+@instrument("repo")
+class TaskEventRepository:
+    """Repository class for recording and reading task events."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def record(
+        self,
+        task: Task,
+        kind: str,
+        from_status: Optional[str] = None,
+        to_status: Optional[str] = None,
+    ) -> None:
+        """
+        Buffer an event for ``task`` until the session commits.
+
+        The task's id is read at flush time, so new tasks can be recorded
+        before they are inserted.
+        """
+        if not self.session.in_transaction():
+            # Rolling back a session with no transaction fires no
+            # after_rollback; open the one these events belong to
+            self.session.begin()
+        self.session.info.setdefault(_BUFFER, []).append(
+            (task, kind, from_status, to_status, datetime.now())
+        )
+
+    def record_status_change(self, task_ids: Sequence[int], new_status: str) -> None:
+        """
+        Record ``status_changed`` events for the listed tasks whose status
+        differs from ``new_status``, in one INSERT ... SELECT.
+
+        Must run before the status is updated.
+        """
+        rows = select(
+            Task.id,
+            Task.project_id,
+            literal("status_changed", String),
+            Task.status,
+            literal(new_status, CodedString(VALID_STATUSES)),
+            literal(datetime.now(), DateTime),
+        ).where(Task.id.in_(task_ids), Task.status != new_status)
+        self.session.execute(
+            insert(TaskEvent).from_select(
+                ["task_id", "project_id", "kind", "from_status", "to_status", "occurred_at"], rows
+            )
+        )
+
+    def get_by_task(self, task_id: int, project_id: int) -> List[TaskEvent]:
+        """Return the events of a task in the order they occurred."""
+        stmt = (
+            select(TaskEvent)
+            .where(TaskEvent.task_id == task_id, TaskEvent.project_id == project_id)
+            .order_by(TaskEvent.occurred_at, TaskEvent.id)
+        )
+        return list(self.session.scalars(stmt))
+
+    def delete_by_project(self, project_id: int, batch_size: int) -> int:
+        """
+        Delete the events of a purged project, committing every
+        ``batch_size`` rows.
+
+        Returns the number of events deleted.
+        """
+        deleted = 0
+        while True:
+            stmt = (
+                select(TaskEvent.id)
+                .where(TaskEvent.project_id == project_id)
+                .order_by(TaskEvent.id)
+                .limit(batch_size)
+            )
+            ids = list(self.session.scalars(stmt))
+            if not ids:
+                return deleted
+            self.session.execute(
+                delete(TaskEvent).where(TaskEvent.id.in_(ids)).execution_options(synchronize_session=False)
+            )
+            commit(self.session)
+            deleted += len(ids)
+
+
+@event.listens_for(Session, "before_commit")
+def _flush_buffered_events(session: Session) -> None:
+    pending = session.info.pop(_BUFFER, None)
+    if not pending:
+        return
+    # Assign ids to tasks created in this transaction
+    session.flush()
+    rows = [
+        {
+            "task_id": task.id,
+            "project_id": task.project_id,
+            "kind": kind,
+            "from_status": from_status,
+            "to_status": to_status,
+            "occurred_at": occurred_at,
+        }
+        for task, kind, from_status, to_status, occurred_at in pending
+    ]
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        session.execute(insert(TaskEvent).values(rows[start:start + INSERT_CHUNK_SIZE]))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_buffered_events(session: Session) -> None:
+    session.info.pop(_BUFFER, None)
@@ -1,10 +1,12 @@
-from typing import List, Optional
+import logging
+from typing import Callable, List, Optional, Sequence
 
-from datetime import date
-from sqlalchemy import select, func, and_
+from datetime import date, datetime
+from sqlalchemy import select, func, and_, delete, update
 from sqlalchemy.orm import Session
 
 from ..config import config
+from ..db.session import commit
 from ..exceptions.service_exceptions import (
     TaskNotFoundError,
     ProjectNotFoundError,
@@ -12,8 +14,20 @@ from ..exceptions.service_exceptions import (
 )
 from ..models.project import Project
 from ..models.task import Task
+from ..observability import log
+from ..observability.instrument import instrument
+from ..signals import mark_deadlines_changed
+from .task_event_repository import TaskEventRepository
 
+logger = logging.getLogger(__name__)
 
+
+def in_live_project():
+    """Condition matching tasks whose project is not soft-deleted."""
+    return Task.project_id.in_(select(Project.id).where(Project.deleted_at.is_(None)))
+
+
+@instrument("repo")
 class TaskRepository:
     """
     Repository class responsible for handling database operations
@@ -25,10 +39,11 @@ class TaskRepository:
         Initialize the repository with a database session.
         """
         self.session = session
+        self.events = TaskEventRepository(session)
 
     def get_by_id(self, task_id: int) -> Optional[Task]:
         """
-        Retrieve a task by its ID.
+        Retrieve a live (not deleted) task by its ID.
 
         Args:
             task_id (int): ID of the task.
@@ -36,16 +51,19 @@ class TaskRepository:
         Returns:
         Optional[Task]: The task if found, else None.
         """
-        return self.session.get(Task, task_id)
+        task = self.session.get(Task, task_id)
+        if task is None or task.deleted_at is not None:
+            return None
+        return task
 
     def get_all(self) -> List[Task]:
         """
-         Retrieve all tasks stored in the database.
+         Retrieve all live tasks of live projects.
 
          Returns:
              List[Task]: A list of all tasks.
          """
-        stmt = select(Task)
+        stmt = select(Task).where(Task.deleted_at.is_(None), in_live_project())
         return list(self.session.scalars(stmt))
 
     def get_by_project_id(self, project_id: int) -> List[Task]:
@@ -58,7 +76,7 @@ class TaskRepository:
          Returns:
              List[Task]: List of tasks under the project.
          """
-        stmt = select(Task).where(Task.project_id == project_id)
+        stmt = select(Task).where(Task.project_id == project_id, Task.deleted_at.is_(None))
         return list(self.session.scalars(stmt))
 
     def get_task_count_by_project(self, project_id: int) -> int:
@@ -71,7 +89,7 @@ class TaskRepository:
         Returns:
             int: Number of associated tasks.
         """
-        stmt = select(func.count(Task.id)).where(Task.project_id == project_id)
+        stmt = select(func.count(Task.id)).where(Task.project_id == project_id, Task.deleted_at.is_(None))
         return self.session.scalar(stmt)
 
     def create(
@@ -102,7 +120,7 @@ class TaskRepository:
 
 
         project = self.session.get(Project, project_id)
-        if not project:
+        if not project or project.deleted_at is not None:
             raise ProjectNotFoundError(
                 f"Project with ID {project_id} not found"
             )
@@ -123,7 +141,10 @@ class TaskRepository:
             deadline=deadline,
         )
         self.session.add(task)
-        self.session.commit()
+        self.events.record(task, "created", to_status=task.status)
+        if deadline is not None:
+            mark_deadlines_changed(self.session)
+        commit(self.session)
         self.session.refresh(task)
         return task
 
@@ -158,14 +179,18 @@ class TaskRepository:
                 f"Task with ID {task_id} not found"
             )
 
+        previous_status = task.status
         task.edit(
             title=title,
             description=description,
             status=status,
             deadline=deadline,
         )
+        self.events.record(task, "updated", previous_status, task.status)
+        if deadline is not None or status is not None:
+            mark_deadlines_changed(self.session)
 
-        self.session.commit()
+        commit(self.session)
         self.session.refresh(task)
         return task
 
@@ -190,14 +215,18 @@ class TaskRepository:
                 f"Task with ID {task_id} not found"
             )
 
+        previous_status = task.status
         task.change_status(new_status)
-        self.session.commit()
+        if task.status != previous_status:
+            self.events.record(task, "status_changed", previous_status, task.status)
+        mark_deadlines_changed(self.session)
+        commit(self.session)
         self.session.refresh(task)
         return task
 
     def delete(self, task_id: int) -> bool:
         """
-         Delete a task by its ID.
+         Soft-delete a task by its ID; the purge job removes it later.
 
          Args:
              task_id (int): ID of the task.
@@ -209,48 +238,304 @@ class TaskRepository:
              bool: True if deletion succeeded.
          """
 
-        task = self.get_by_id(task_id)
-        if not task:
+        result = self.session.execute(
+            update(Task)
+            .where(Task.id == task_id, Task.deleted_at.is_(None))
+            .values(deleted_at=datetime.now())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
             raise TaskNotFoundError(
                 f"Task with ID {task_id} not found"
             )
 
-        self.session.delete(task)
-        self.session.commit()
+        task = self.session.get(Task, task_id)
+        self.events.record(task, "deleted", from_status=task.status)
+        commit(self.session)
         return True
 
-    def get_overdue_tasks(self) -> List[Task]:
-        """Get all tasks that are overdue and not done."""
+    def get_deleted_by_id(self, task_id: int) -> Optional[Task]:
+        """Retrieve a soft-deleted task that was not purged yet."""
+        task = self.session.get(Task, task_id)
+        if task is None or task.deleted_at is None:
+            return None
+        return task
 
-        stmt = select(Task).where(
-            and_(
-                Task.deadline < date.today(),
-                Task.status != "done",
-                Task.closed_at.is_(None)
+    def restore(self, task_id: int) -> Task:
+        """
+        Undo the soft delete of a task.
+
+        Raises:
+            TaskNotFoundError: If no deleted task has this ID.
+            TaskLimitExceededError: If the project's task limit is reached.
+        """
+        task = self.get_deleted_by_id(task_id)
+        if not task:
+            raise TaskNotFoundError(
+                f"Deleted task with ID {task_id} not found"
             )
-        )
+
+        if (
+            self.get_task_count_by_project(task.project_id)
+            >= config.MAX_NUMBER_OF_TASK
+        ):
+            raise TaskLimitExceededError(
+                "Max number of tasks for this project reached."
+            )
+
+        task.deleted_at = None
+        task._flag_lapsed_deadline()
+        self.events.record(task, "restored", to_status=task.status)
+        mark_deadlines_changed(self.session)
+        commit(self.session)
+        self.session.refresh(task)
+        return task
+
+    def purge_deleted(
+        self,
+        deleted_before: datetime,
+        batch_size: int,
+        on_batch: Optional[Callable[[int], bool]] = None,
+    ) -> int:
+        """
+        Hard-delete tasks soft-deleted before ``deleted_before``, committing
+        every ``batch_size`` rows. ``on_batch`` is called with the number of
+        tasks deleted after each batch and stops the run by returning False.
+
+        Returns the number of tasks deleted.
+        """
+        deleted = 0
+        while True:
+            stmt = (
+                select(Task.id)
+                .where(Task.deleted_at < deleted_before)
+                .order_by(Task.id)
+                .limit(batch_size)
+            )
+            ids = list(self.session.scalars(stmt))
+            if not ids:
+                return deleted
+            self.session.execute(
+                delete(Task).where(Task.id.in_(ids)).execution_options(synchronize_session=False)
+            )
+            commit(self.session)
+            deleted += len(ids)
+            if on_batch is not None and not on_batch(len(ids)):
+                return deleted
+
+    def get_overdue_tasks(
+        self,
+        shard: int = 0,
+        shards: int = 1,
+        limit: Optional[int] = None,
+        lock: bool = False,
+        deadline_after: Optional[date] = None,
+        recheck: bool = False,
+    ) -> List[Task]:
+        """
+        Get tasks that are overdue and not done, skipping deleted tasks and
+        the tasks of deleted projects.
+
+        Args:
+            shard (int, optional): Shard to read, by ``project_id % shards``.
+            shards (int, optional): Number of shards. Defaults to 1 (all tasks).
+            limit (int, optional): Maximum number of tasks to return.
+            lock (bool, optional): Lock the returned rows, skipping rows
+                locked by other transactions (PostgreSQL only).
+            deadline_after (date, optional): Only tasks whose deadline is
+                after this date.
+            recheck (bool, optional): Only tasks flagged with
+                ``overdue_recheck``.
+
+        Returns:
+            List[Task]: Overdue tasks ordered by ID.
+        """
+
+        conditions = [
+            Task.deadline < date.today(),
+            Task.status != "done",
+            Task.closed_at.is_(None),
+            Task.deleted_at.is_(None),
+            in_live_project(),
+        ]
+        if shards > 1:
+            conditions.append(Task.project_id % shards == shard)
+        if deadline_after is not None:
+            conditions.append(Task.deadline > deadline_after)
+        if recheck:
+            conditions.append(Task.overdue_recheck.is_(True))
+
+        stmt = select(Task).where(and_(*conditions)).order_by(Task.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if lock:
+            stmt = stmt.with_for_update(skip_locked=True)
 
         return list(self.session.scalars(stmt))
 
-    def close_overdue_tasks(self) -> int:
+    def get_earliest_open_deadline(
+        self,
+        shard: int = 0,
+        shards: int = 1,
+        after: Optional[date] = None,
+        before: Optional[date] = None,
+    ) -> Optional[date]:
+        """
+        Get the earliest deadline among live tasks that are not done, if any.
+
+        ``after`` and ``before`` bound the deadlines considered (exclusive).
+        """
+
+        conditions = [
+            Task.deadline.is_not(None),
+            Task.status != "done",
+            Task.closed_at.is_(None),
+            Task.deleted_at.is_(None),
+            in_live_project(),
+        ]
+        if shards > 1:
+            conditions.append(Task.project_id % shards == shard)
+        if after is not None:
+            conditions.append(Task.deadline > after)
+        if before is not None:
+            conditions.append(Task.deadline < before)
+
+        stmt = select(func.min(Task.deadline)).where(and_(*conditions))
+
+        return self.session.scalar(stmt)
+
+    def close_overdue_tasks(
+        self,
+        shard: int = 0,
+        shards: int = 1,
+        batch_size: Optional[int] = None,
+        on_batch: Optional[Callable[[int, int], bool]] = None,
+        deadline_after: Optional[date] = None,
+        recheck: bool = False,
+    ) -> int:
         """
-        Close all overdue tasks using model's business logic.
+        Close overdue tasks using model's business logic.
+
+        With ``batch_size`` the tasks are closed and committed in batches of
+        rows locked with SKIP LOCKED, so concurrent runs never block on or
+        close the same rows. ``on_batch`` is called after each batch with
+        the number of tasks scanned and closed, and stops the run by
+        returning False. ``deadline_after`` and ``recheck`` narrow the
+        tasks as in ``get_overdue_tasks``.
+
         Returns the number of tasks closed.
         """
-        overdue_tasks = self.get_overdue_tasks()
         closed_count = 0
 
-        for task in overdue_tasks:
-            try:
+        while True:
+            overdue_tasks = self.get_overdue_tasks(
+                shard, shards, limit=batch_size, lock=True,
+                deadline_after=deadline_after, recheck=recheck
+            )
+            batch_closed = 0
+
+            for task in overdue_tasks:
+                try:
+                    previous_status = task.status
+                    task.change_status("done")
+                    self.events.record(task, "status_changed", previous_status, "done")
+                    batch_closed += 1
+                except Exception as e:
+                    # Callers log the totals
+                    logger.warning(
+                        "Failed to close overdue task",
+                        extra=log.rate_limited(task_id=task.id, error=str(e)),
+                    )
+                    continue
+
+            if batch_closed > 0:
+                commit(self.session)
+            else:
+                self.session.rollback()
+            closed_count += batch_closed
+
+            if on_batch is not None and not on_batch(len(overdue_tasks), batch_closed):
+                break
+            # Stop when done, or when a batch only held tasks that fail to close
+            if batch_size is None or len(overdue_tasks) < batch_size or batch_closed == 0:
+                break
+
+        return closed_count
+
+    def _project_task_ids(
+        self,
+        project_id: int,
+        after_id: int,
+        batch_size: int,
+        task_ids: Optional[Sequence[int]] = None,
+        include_deleted: bool = False,
+    ) -> List[int]:
+        """Next ``batch_size`` task ids of a project, in id order, after ``after_id``."""
+        conditions = [Task.project_id == project_id, Task.id > after_id]
+        if not include_deleted:
+            conditions.append(Task.deleted_at.is_(None))
+        if task_ids is not None:
+            conditions.append(Task.id.in_(task_ids))
+        stmt = select(Task.id).where(and_(*conditions)).order_by(Task.id).limit(batch_size)
+        return list(self.session.scalars(stmt))
+
+    def delete_by_project(self, project_id: int, batch_size: int) -> int:
+        """
+        Hard-delete all tasks of a project, soft-deleted ones included,
+        committing every ``batch_size`` rows so no transaction holds many
+        row locks for long.
+
+        Returns the number of tasks deleted.
+        """
+        deleted = 0
+        while True:
+            ids = self._project_task_ids(project_id, 0, batch_size, include_deleted=True)
+            if not ids:
+                return deleted
+            self.session.execute(
+                delete(Task).where(Task.id.in_(ids)).execution_options(synchronize_session=False)
+            )
+            commit(self.session)
+            deleted += len(ids)
 
-                task.change_status("done")
-                closed_count += 1
-                print(f"   ✅ Closed: {task.title} (Project: {task.project.name})")
-            except Exception as e:
-                print(f"   ❌ Failed to close task {task.id}: {e}")
-                continue
+    def bulk_change_status(
+        self,
+        project_id: int,
+        new_status: str,
+        batch_size: int,
+        task_ids: Optional[Sequence[int]] = None,
+    ) -> int:
+        """
+        Set the status of a project's tasks (all, or ``task_ids``) in batches.
 
-        if closed_count > 0:
-            self.session.commit()
+        Follows ``Task.change_status``: tasks marked done keep an existing
+        ``closed_at`` or get the current time, other statuses clear it, and
+        reopened tasks with a lapsed deadline are flagged for the autoclose job.
+        Every task whose status actually changes gets a ``status_changed`` event.
 
-        return closed_count
\ No newline at end of file
+        Returns the number of tasks updated.
+        """
+        if new_status == "done":
+            closed_at = func.coalesce(Task.closed_at, datetime.now())
+            overdue_recheck = False
+        else:
+            closed_at = None
+            overdue_recheck = and_(Task.deadline.is_not(None), Task.deadline < date.today())
+
+        updated = 0
+        last_id = 0
+        while True:
+            ids = self._project_task_ids(project_id, last_id, batch_size, task_ids)
+            if not ids:
+                return updated
+            self.events.record_status_change(ids, new_status)
+            self.session.execute(
+                update(Task)
+                .where(Task.id.in_(ids))
+                .values(status=new_status, closed_at=closed_at, overdue_recheck=overdue_recheck)
+                .execution_options(synchronize_session=False)
+            )
+            mark_deadlines_changed(self.session)
+            commit(self.session)
+            updated += len(ids)
+            last_id = ids[-1]
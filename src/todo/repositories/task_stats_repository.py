@@ -0,0 +1,138 @@
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+
+from sqlalchemy import select, func, delete, insert, union_all, literal, case, and_, or_
+from sqlalchemy.orm import Session
+
+from ..db.session import commit
+from ..models.archived_task import ArchivedTask
+from ..models.task import Task
+from ..models.task_daily_stat import TaskDailyStat
+from ..models.task_event import TaskEvent
+from ..observability.instrument import instrument
+
+_STAT_COLUMNS = ["project_id", "day", "created", "closed"]
+
+
+def _day_bounds(start: date, end: date):
+    """Datetime range covering the days ``start`` to ``end`` inclusive."""
+    return datetime.combine(start, time.min), datetime.combine(end + timedelta(days=1), time.min)
+
+
+@instrument("repo")
+class TaskStatsRepository:
+    """Repository class for the per-project daily task rollups."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_range(self, project_id: int, start: date, end: date) -> List[TaskDailyStat]:
+        """Return a project's rollup rows from ``start`` to ``end`` (inclusive), by day."""
+        stmt = (
+            select(TaskDailyStat)
+            .where(
+                TaskDailyStat.project_id == project_id,
+                TaskDailyStat.day >= start,
+                TaskDailyStat.day <= end,
+            )
+            .order_by(TaskDailyStat.day)
+        )
+        return list(self.session.scalars(stmt))
+
+    def get_first_event_day(self) -> Optional[date]:
+        """Day of the oldest task event, or None if there are none."""
+        first = self.session.scalar(select(func.min(TaskEvent.occurred_at)))
+        return first.date() if first is not None else None
+
+    def get_first_task_day(self) -> Optional[date]:
+        """Creation day of the oldest task, archived ones included, or None."""
+        firsts = [
+            self.session.scalar(select(func.min(model.created_at)))
+            for model in (Task, ArchivedTask)
+        ]
+        firsts = [first for first in firsts if first is not None]
+        return min(firsts).date() if firsts else None
+
+    def _replace(self, start: date, end: date, rows) -> int:
+        """Replace the rollup rows of ``start`` to ``end`` with ``rows`` in one transaction."""
+        self.session.execute(
+            delete(TaskDailyStat).where(TaskDailyStat.day >= start, TaskDailyStat.day <= end)
+        )
+        result = self.session.execute(insert(TaskDailyStat).from_select(_STAT_COLUMNS, rows))
+        commit(self.session)
+        return result.rowcount
+
+    def rollup_events(self, start: date, end: date) -> int:
+        """
+        Recompute the rollups of ``start`` to ``end`` from ``task_events``.
+
+        A task counts as created on the day of its ``created`` event and as
+        closed on each day it moved to done. Recomputing whole days keeps
+        reruns idempotent.
+
+        Returns the number of rollup rows written.
+        """
+        range_start, range_end = _day_bounds(start, end)
+        day = func.date(TaskEvent.occurred_at)
+        closing = and_(
+            TaskEvent.kind.in_(("created", "updated", "status_changed")),
+            TaskEvent.to_status == "done",
+            or_(TaskEvent.from_status.is_(None), TaskEvent.from_status != "done"),
+        )
+        rows = (
+            select(
+                TaskEvent.project_id,
+                day,
+                func.sum(case((TaskEvent.kind == "created", 1), else_=0)),
+                func.sum(case((closing, 1), else_=0)),
+            )
+            .where(TaskEvent.occurred_at >= range_start, TaskEvent.occurred_at < range_end)
+            .group_by(TaskEvent.project_id, day)
+        )
+        return self._replace(start, end, rows)
+
+    def rollup_tasks(self, start: date, end: date) -> int:
+        """
+        Recompute the rollups of ``start`` to ``end`` from the ``created_at``
+        and ``closed_at`` of live and archived tasks.
+
+        Used to backfill days before the event log; this scans the task
+        tables, so it is not meant for the periodic job.
+
+        Returns the number of rollup rows written.
+        """
+        range_start, range_end = _day_bounds(start, end)
+        parts = []
+        for model in (Task, ArchivedTask):
+            parts.append(
+                select(
+                    model.project_id.label("project_id"),
+                    func.date(model.created_at).label("day"),
+                    literal(1).label("created"),
+                    literal(0).label("closed"),
+                ).where(model.created_at >= range_start, model.created_at < range_end)
+            )
+            parts.append(
+                select(
+                    model.project_id,
+                    func.date(model.closed_at),
+                    literal(0),
+                    literal(1),
+                ).where(model.status == "done", model.closed_at >= range_start, model.closed_at < range_end)
+            )
+        events = union_all(*parts).subquery()
+        rows = (
+            select(
+                events.c.project_id,
+                events.c.day,
+                func.sum(events.c.created),
+                func.sum(events.c.closed),
+            )
+            .group_by(events.c.project_id, events.c.day)
+        )
+        return self._replace(start, end, rows)
+
+    def delete_by_project(self, project_id: int) -> None:
+        """Delete the rollups of a purged project."""
+        self.session.execute(delete(TaskDailyStat).where(TaskDailyStat.project_id == project_id))
+        commit(self.session)
@@ -1,4 +1,15 @@
 from .project_service import ProjectService
 from .task_service import TaskService
+from .batch_service import BatchService
+from .idempotency_service import IdempotencyService
+from .job_run_service import JobRunService
+from .background_job_service import BackgroundJobService
 
-__all__ = ["ProjectService", "TaskService"]
\ No newline at end of file
+__all__ = [
+    "ProjectService",
+    "TaskService",
+    "BatchService",
+    "IdempotencyService",
+    "JobRunService",
+    "BackgroundJobService",
+]
\ No newline at end of file
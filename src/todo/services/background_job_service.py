@@ -0,0 +1,163 @@
+"""Service layer for the background job queue and its job handlers."""
+
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..config import config
+from ..exceptions.service_exceptions import JobNotFoundError, ProjectNotFoundError
+from ..models.archived_task import ArchivedTask
+from ..models.background_job import BackgroundJob
+from ..models.project import Project
+from ..repositories.background_job_repository import BackgroundJobRepository
+from ..repositories.project_repository import ProjectRepository
+from ..repositories.task_repository import TaskRepository
+from ..repositories.task_archive_repository import TaskArchiveRepository
+from ..observability.instrument import instrument
+from .project_service import PURGE_JOB_KIND, ProjectService
+
+# Rows deleted or updated per transaction by the bulk handlers
+BATCH_SIZE = 500
+
+# Errors a retry cannot fix: a malformed payload or a deleted project
+PERMANENT_ERRORS = (KeyError, ProjectNotFoundError)
+
+JobHandler = Callable[[Session, Dict[str, Any]], Any]
+
+# Handlers by job kind, registered with ``job_handler``
+HANDLERS: Dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Register the function running jobs of ``kind``."""
+    def register(func: JobHandler) -> JobHandler:
+        HANDLERS[kind] = func
+        return func
+    return register
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff before the next attempt of a failed job."""
+    return timedelta(seconds=config.JOB_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0))
+
+
+@instrument("service")
+class BackgroundJobService:
+    """Enqueues background jobs and runs them for the worker."""
+
+    def __init__(self, session: Session):
+        """Initialize the service with a repository."""
+        self.session = session
+        self.job_repo = BackgroundJobRepository(session)
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], priority: int = 0) -> BackgroundJob:
+        """Queue a job of a registered kind.
+
+        Args:
+            kind (str): Job kind, one of ``HANDLERS``.
+            payload (dict): JSON arguments passed to the handler.
+            priority (int): Higher priorities are claimed first.
+        """
+        if kind not in HANDLERS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        return self.job_repo.enqueue(kind, payload, priority, config.JOB_MAX_ATTEMPTS)
+
+    def get_job(self, job_id: int) -> BackgroundJob:
+        """Retrieve a job by ID."""
+        job = self.job_repo.get_by_id(job_id)
+        if not job:
+            raise JobNotFoundError(f"Job with ID {job_id} not found")
+        return job
+
+    def claim(self, worker_id: str) -> Optional[BackgroundJob]:
+        """Claim the next due job for ``worker_id``, if any."""
+        return self.job_repo.claim(worker_id)
+
+    def run(self, job: BackgroundJob, worker_id: str) -> bool:
+        """Run a job claimed by ``worker_id`` and record its result, error or next attempt.
+
+        Returns False if the outcome was not recorded because the job's lock
+        expired and it was re-queued (or claimed by another worker) meanwhile.
+        """
+        try:
+            result = HANDLERS[job.kind](self.session, job.payload)
+        except Exception as e:
+            self.session.rollback()
+            error = f"{type(e).__name__}: {e}"
+            retry_at = None
+            if job.attempts < job.max_attempts and not isinstance(e, PERMANENT_ERRORS):
+                retry_at = datetime.now() + retry_delay(job.attempts)
+            return self.job_repo.fail(job, worker_id, error, retry_at)
+        return self.job_repo.complete(job, worker_id, result)
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """Keep the lock of a job ``worker_id`` is running from going stale."""
+        return self.job_repo.heartbeat(job_id, worker_id)
+
+    def requeue_stale(self) -> Tuple[int, int]:
+        """Re-queue (or fail, out of attempts) jobs locked longer than JOB_LOCK_TIMEOUT_SECONDS."""
+        locked_before = datetime.now() - timedelta(seconds=config.JOB_LOCK_TIMEOUT_SECONDS)
+        return self.job_repo.requeue_stale(locked_before, "Worker stopped while running the job")
+
+
+def _get_project(session: Session, project_id: int):
+    project = ProjectRepository(session).get_by_id(project_id)
+    if not project:
+        raise ProjectNotFoundError(f"Project with ID {project_id} not found")
+    return project
+
+
+@job_handler(PURGE_JOB_KIND)
+def delete_project(session: Session, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Purge a soft-deleted project now, removing its tasks in batches first.
+
+    A project restored before the job ran is left alone.
+    """
+    project_id = payload["project_id"]
+    deleted = ProjectService(session).purge_project(project_id, BATCH_SIZE)
+    if deleted is None:
+        if session.get(Project, project_id) is None:
+            raise ProjectNotFoundError(f"Project with ID {project_id} not found")
+        return {"project_id": project_id, "tasks_deleted": 0, "restored": True}
+    return {"project_id": project_id, "tasks_deleted": deleted}
+
+
+@job_handler("tasks.bulk_status")
+def bulk_change_status(session: Session, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Set the status of all (or the listed) tasks of a project."""
+    project_id = payload["project_id"]
+    _get_project(session, project_id)
+    updated = TaskRepository(session).bulk_change_status(
+        project_id, payload["status"], BATCH_SIZE, payload.get("task_ids")
+    )
+    return {"project_id": project_id, "status": payload["status"], "tasks_updated": updated}
+
+
+@job_handler("project.export")
+def export_project(session: Session, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Export a project and its tasks, archived ones included, as JSON."""
+    project = _get_project(session, payload["project_id"])
+    archived = TaskArchiveRepository(session).get_by_project_id(project.id)
+    tasks: List[Dict[str, Any]] = [
+        {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status,
+            "deadline": task.deadline.isoformat() if task.deadline else None,
+            "closed_at": task.closed_at.isoformat() if task.closed_at else None,
+            "created_at": task.created_at.isoformat(),
+            "archived": isinstance(task, ArchivedTask),
+        }
+        for task in TaskRepository(session).get_by_project_id(project.id) + archived
+    ]
+    return {
+        "project": {
+            "id": project.id,
+            "name": project.name,
+            "description": project.description,
+            "created_at": project.created_at.isoformat(),
+        },
+        "tasks": tasks,
+    }
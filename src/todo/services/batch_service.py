@@ -0,0 +1,99 @@
+"""Service layer for running several operations in one transaction."""
+
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from sqlalchemy.orm import Session
+
+from ..db.session import unit_of_work
+from ..exceptions.base import ValidationError
+from ..exceptions.service_exceptions import BatchOperationError
+from .project_service import ProjectService
+from .task_service import TaskService
+from ..observability.instrument import instrument
+
+
+@instrument("service")
+class BatchService:
+    """Executes an ordered list of project/task operations atomically."""
+
+    def __init__(self, session: Session):
+        """Initialize the service with the shared session."""
+        self.session = session
+        self.project_service = ProjectService(session)
+        self.task_service = TaskService(session)
+
+    def execute(
+        self, operations: List[Any], snapshot: Callable[[str, Any], Any]
+    ) -> List[Dict[str, Any]]:
+        """Run all operations in a single transaction.
+
+        Each operation exposes ``op``, ``resource``, ``ref``, ``id``,
+        ``project_id`` and an already validated ``data`` dict. Ids created by
+        earlier operations can be referenced as ``"$<ref>"``.
+
+        ``snapshot(resource, entity)`` serializes each result right after its
+        operation, while the entity still reflects it; a later operation of
+        the batch may change or delete it, and the commit expires it.
+
+        Raises:
+            BatchOperationError: If any operation fails; nothing is committed.
+        """
+        refs: Dict[str, int] = {}
+        results = []
+
+        with unit_of_work(self.session):
+            for index, operation in enumerate(operations):
+                try:
+                    entity_id, entity = self._apply(operation, refs)
+                except Exception as e:
+                    raise BatchOperationError(index, e) from e
+
+                if operation.ref:
+                    refs[operation.ref] = entity_id
+                results.append({
+                    "index": index,
+                    "op": operation.op,
+                    "resource": operation.resource,
+                    "id": entity_id,
+                    "ref": operation.ref,
+                    "result": snapshot(operation.resource, entity) if entity is not None else None,
+                })
+
+        return results
+
+    @staticmethod
+    def _resolve(value: Optional[Union[int, str]], refs: Dict[str, int]) -> Optional[int]:
+        """Turn a '$<ref>' reference into the id created earlier in the batch."""
+        if isinstance(value, str):
+            name = value[1:]
+            if name not in refs:
+                raise ValidationError(f"Unknown reference '{value}'")
+            return refs[name]
+        return value
+
+    def _apply(self, operation: Any, refs: Dict[str, int]):
+        """Apply one operation and return ``(id, entity)``."""
+        entity_id = self._resolve(operation.id, refs)
+        data = operation.data
+
+        if operation.resource == "project":
+            if operation.op == "create":
+                project = self.project_service.create_project(**data)
+                return project.id, project
+            if operation.op == "update":
+                return entity_id, self.project_service.update_project(entity_id, **data)
+            self.project_service.delete_project(entity_id)
+            return entity_id, None
+
+        project_id = self._resolve(operation.project_id, refs)
+        if operation.op == "create":
+            task = self.task_service.create_task(project_id, **data)
+            return task.id, task
+        if operation.op == "update":
+            return entity_id, self.task_service.update_task(project_id, entity_id, **data)
+        if operation.op == "status":
+            return entity_id, self.task_service.change_task_status(
+                project_id, entity_id, data["status"]
+            )
+        self.task_service.delete_task(project_id, entity_id)
+        return entity_id, None
@@ -0,0 +1,138 @@
+"""Service layer for replaying responses of idempotent requests."""
+
+import hashlib
+import json
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..db.session import unit_of_work
+from ..observability.metrics import CACHE_REQUESTS
+from ..exceptions.service_exceptions import (
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyMismatchError,
+)
+from ..repositories.idempotency_repository import IdempotencyRepository
+from ..observability.instrument import instrument
+
+
+@dataclass(frozen=True)
+class IdempotentResult:
+    """Response to send for an idempotent request."""
+
+    status_code: int
+    body: Any
+    replayed: bool
+
+
+@instrument("service")
+class IdempotencyService:
+    """Runs a write at most once per Idempotency-Key and replays its response."""
+
+    # Per-key locks coalescing concurrent duplicates within this process
+    _locks: Dict[Tuple[str, str], list] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, session: Session):
+        """Initialize the service with a repository."""
+        self.session = session
+        self.idempotency_repo = IdempotencyRepository(session)
+
+    @staticmethod
+    def fingerprint(payload: Any) -> str:
+        """Return a stable hash of a JSON-compatible request payload."""
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    @classmethod
+    @contextmanager
+    def _key_lock(cls, key: str, scope: str) -> Iterator[None]:
+        """Hold the in-process lock for a key; the entry is dropped when unused."""
+        with cls._locks_guard:
+            entry = cls._locks.setdefault((key, scope), [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with cls._locks_guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del cls._locks[(key, scope)]
+
+    def _replay(self, key: str, scope: str, request_hash: str):
+        """Return the stored result for a key, or None if the key is unused."""
+        record = self.idempotency_repo.get(key, scope)
+        if record is None:
+            CACHE_REQUESTS.inc("idempotency", "miss")
+            return None
+        if record.request_hash != request_hash:
+            raise IdempotencyKeyMismatchError(
+                "Idempotency-Key was already used with a different request payload"
+            )
+        if record.is_abandoned:
+            # Its request died before finishing; the key is taken over
+            CACHE_REQUESTS.inc("idempotency", "miss")
+            return None
+        if not record.is_completed:
+            raise IdempotencyKeyInProgressError(
+                "A request with this Idempotency-Key is still being processed"
+            )
+        CACHE_REQUESTS.inc("idempotency", "hit")
+        return IdempotentResult(record.status_code, record.response_body, replayed=True)
+
+    def run(
+        self,
+        key: str,
+        scope: str,
+        request_hash: str,
+        status_code: int,
+        handler: Callable[[], Any],
+    ) -> IdempotentResult:
+        """Run ``handler`` once for the key, or replay the stored response.
+
+        The write done by ``handler`` and the stored response are committed
+        in the same transaction. Concurrent duplicates in this process wait
+        for the first request and then replay its response; duplicates in
+        other processes get IdempotencyKeyInProgressError. A reservation
+        left by a request that died is taken over once its lock runs out
+        (IDEMPOTENCY_LOCK_TIMEOUT_SECONDS); if the first request finishes
+        after that after all, its write is rolled back.
+
+        Raises:
+            IdempotencyKeyMismatchError: If the key was used with another payload.
+            IdempotencyKeyInProgressError: If the key is held by another process.
+        """
+        with self._key_lock(key, scope):
+            result = self._replay(key, scope, request_hash)
+            if result is not None:
+                return result
+
+            locked_until = self.idempotency_repo.reserve(key, scope, request_hash)
+            if locked_until is None:
+                result = self._replay(key, scope, request_hash)
+                if result is not None:
+                    return result
+                raise IdempotencyKeyInProgressError(
+                    "A request with this Idempotency-Key is still being processed"
+                )
+
+            try:
+                with unit_of_work(self.session):
+                    body = handler()
+                    if not self.idempotency_repo.complete(key, scope, locked_until, status_code, body):
+                        raise IdempotencyKeyInProgressError(
+                            "The Idempotency-Key was taken over by a retry while this request ran"
+                        )
+            except Exception:
+                self.idempotency_repo.release(key, scope, locked_until)
+                raise
+
+            return IdempotentResult(status_code, body, replayed=False)
+
+    def purge_expired(self) -> int:
+        """Delete expired keys and return how many were removed."""
+        return self.idempotency_repo.delete_expired()
@@ -0,0 +1,108 @@
+"""Service layer for the scheduler job run history."""
+
+import math
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..db.session import unit_of_work
+from ..models.job_run import JobRun
+from ..repositories.job_run_repository import JobRunRepository
+from ..observability.instrument import instrument
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@instrument("service")
+class JobRunService:
+    """Records job runs and summarizes their performance."""
+
+    def __init__(self, session: Session):
+        """Initialize the service with a repository."""
+        self.session = session
+        self.job_run_repo = JobRunRepository(session)
+
+    def record(
+        self,
+        job_name: str,
+        started_at: datetime,
+        duration_ms: float,
+        rows_scanned: Optional[int] = None,
+        rows_affected: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> JobRun:
+        """Store one job run."""
+        return self.job_run_repo.create(
+            job_name, started_at, duration_ms, rows_scanned, rows_affected, error
+        )
+
+    def get_recent_runs(self, job_name: Optional[str] = None, limit: int = 50) -> List[JobRun]:
+        """Most recent runs, newest first."""
+        return self.job_run_repo.get_recent(job_name, limit)
+
+    def summarize(self, days: int = 7, job_name: Optional[str] = None) -> List[Dict]:
+        """
+        Per-job run counts and duration percentiles over the last ``days`` days.
+
+        Compacted rows count towards runs and errors but not percentiles.
+        """
+        runs_by_job: Dict[str, List[JobRun]] = defaultdict(list)
+        for run in self.job_run_repo.get_since(datetime.now() - timedelta(days=days), job_name):
+            runs_by_job[run.job_name].append(run)
+
+        summaries = []
+        for name, runs in sorted(runs_by_job.items()):
+            durations = sorted(run.duration_ms for run in runs if run.runs == 1)
+            summaries.append({
+                "job_name": name,
+                "runs": sum(run.runs for run in runs),
+                "errors": sum(1 for run in runs if run.error),
+                "last_run_at": runs[-1].started_at,
+                "last_error": next((run.error for run in reversed(runs) if run.error), None),
+                "rows_affected": sum(run.rows_affected or 0 for run in runs),
+                "p50_ms": percentile(durations, 50),
+                "p95_ms": percentile(durations, 95),
+                "p99_ms": percentile(durations, 99),
+                "max_ms": durations[-1] if durations else None,
+            })
+        return summaries
+
+    def compact(self, older_than_days: int) -> int:
+        """
+        Merge successful runs older than ``older_than_days`` into one row per job and day.
+
+        Returns the number of rows removed.
+        """
+        runs = self.job_run_repo.get_compactable(datetime.now() - timedelta(days=older_than_days))
+        groups: Dict[tuple, List[JobRun]] = defaultdict(list)
+        for run in runs:
+            groups[(run.job_name, run.started_at.date())].append(run)
+
+        removed = 0
+        with unit_of_work(self.session):
+            for (name, _), group in groups.items():
+                if len(group) < 2:
+                    continue
+                self.job_run_repo.delete_runs(group)
+                self.job_run_repo.create(
+                    name,
+                    started_at=group[0].started_at,
+                    duration_ms=sum(run.duration_ms for run in group) / len(group),
+                    rows_scanned=sum(run.rows_scanned or 0 for run in group),
+                    rows_affected=sum(run.rows_affected or 0 for run in group),
+                    runs=len(group),
+                )
+                removed += len(group) - 1
+        return removed
+
+    def purge(self, retention_days: int) -> int:
+        """Delete runs older than ``retention_days``."""
+        return self.job_run_repo.delete_older_than(datetime.now() - timedelta(days=retention_days))
@@ -2,18 +2,42 @@
 
 from __future__ import annotations
 
+from datetime import date, timedelta
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from ..repositories.background_job_repository import BackgroundJobRepository
 from ..repositories.project_repository import ProjectRepository
-from todo.exceptions.service_exceptions import ProjectNotFoundError
+from ..repositories.task_repository import TaskRepository
+from ..repositories.task_archive_repository import TaskArchiveRepository
+from ..repositories.task_event_repository import TaskEventRepository
+from ..repositories.task_stats_repository import TaskStatsRepository
+from todo.exceptions.base import ValidationError
+from todo.exceptions.service_exceptions import ProjectNotFoundError, ProjectPurgeInProgressError
+from ..observability.instrument import instrument
 
+# Longest range of daily stats returned at once
+MAX_STATS_RANGE_DAYS = 366
+
+# Range returned when none is given
+DEFAULT_STATS_RANGE_DAYS = 30
+
+# Job kind purging a deleted project right away (see background_job_service)
+PURGE_JOB_KIND = "project.delete"
+
+
+@instrument("service")
 class ProjectService:
     """Provides business logic for managing projects."""
 
     def __init__(self, session: Session):
         """Initialize the service with a repository."""
         self.project_repo = ProjectRepository(session)
+        self.task_repo = TaskRepository(session)
+        self.archive_repo = TaskArchiveRepository(session)
+        self.event_repo = TaskEventRepository(session)
+        self.stats_repo = TaskStatsRepository(session)
+        self.job_repo = BackgroundJobRepository(session)
 
     def create_project(self, name: str, description: str = ""):
         """Create a new project.
@@ -24,13 +48,22 @@ class ProjectService:
         """
         return self.project_repo.create(name, description)
 
-    def list_projects(self) -> List:
-        """Return all projects sorted by creation time."""
-        return self.project_repo.get_all()
+    def list_projects(self, include_tasks: bool = False) -> List:
+        """Return all projects sorted by creation time.
+
+        Args:
+            include_tasks (bool): Load the tasks of every project up front.
+        """
+        return self.project_repo.get_all(with_tasks=include_tasks)
 
-    def get_project(self, project_id: int):
-        """Retrieve a specific project by ID."""
-        project = self.project_repo.get_by_id(project_id)
+    def get_project(self, project_id: int, include_tasks: bool = False):
+        """Retrieve a specific project by ID.
+
+        Args:
+            project_id (int): The project ID.
+            include_tasks (bool): Load the project's tasks up front.
+        """
+        project = self.project_repo.get_by_id(project_id, with_tasks=include_tasks)
         if not project:
             raise ProjectNotFoundError(f"Project with ID {project_id} not found")
         return project
@@ -47,6 +80,60 @@ class ProjectService:
         return self.project_repo.update(project_id, name, description)
 
     def delete_project(self, project_id: int) -> str:
-        """Delete a project and its associated tasks."""
+        """Soft-delete a project; it and its tasks are purged later."""
         self.project_repo.delete(project_id)
         return f"Project {project_id} deleted successfully"
+
+    def get_project_stats(self, project_id: int, start: Optional[date] = None, end: Optional[date] = None):
+        """Return a project's daily task rollups from ``start`` to ``end`` (inclusive).
+
+        Args:
+            project_id (int): The project ID.
+            start (Optional[date]): First day; defaults to 30 days before ``end``.
+            end (Optional[date]): Last day; defaults to today.
+
+        Returns:
+            tuple: The effective ``start`` and ``end``, and the rollup rows
+            of the days that have any.
+        """
+        if not self.project_repo.get_by_id(project_id):
+            raise ProjectNotFoundError(f"Project with ID {project_id} not found")
+
+        end = end or date.today()
+        start = start or end - timedelta(days=DEFAULT_STATS_RANGE_DAYS - 1)
+        if start > end:
+            raise ValidationError("'from' must not be after 'to'.")
+        if (end - start).days + 1 > MAX_STATS_RANGE_DAYS:
+            raise ValidationError(f"Stats range must be at most {MAX_STATS_RANGE_DAYS} days.")
+
+        return start, end, self.stats_repo.get_range(project_id, start, end)
+
+    def restore_project(self, project_id: int):
+        """Undo the deletion of a project that was not purged yet.
+
+        Refused while a purge job of the project is running. The project row
+        is locked before that check, so a purge job claimed meanwhile finds
+        the project live and leaves it alone.
+        """
+        if self.project_repo.lock_deleted(project_id) is None:
+            raise ProjectNotFoundError(f"Deleted project with ID {project_id} not found")
+        if self.job_repo.is_running(PURGE_JOB_KIND, project_id):
+            raise ProjectPurgeInProgressError(f"Project {project_id} is being purged")
+        return self.project_repo.restore(project_id)
+
+    def purge_project(self, project_id: int, batch_size: int) -> Optional[int]:
+        """Hard-delete a soft-deleted project, removing its tasks, archived
+        tasks and task events in batches first.
+
+        Returns the number of tasks deleted, or None if the project is live
+        (restored since it was deleted) or gone, in which case nothing is
+        deleted.
+        """
+        if self.project_repo.lock_deleted(project_id) is None:
+            return None
+        deleted = self.task_repo.delete_by_project(project_id, batch_size)
+        deleted += self.archive_repo.delete_by_project(project_id, batch_size)
+        self.event_repo.delete_by_project(project_id, batch_size)
+        self.stats_repo.delete_by_project(project_id)
+        self.project_repo.purge(project_id)
+        return deleted
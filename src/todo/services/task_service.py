@@ -4,18 +4,32 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from ..repositories.task_repository import TaskRepository
+from ..repositories.task_archive_repository import TaskArchiveRepository
+from ..repositories.task_event_repository import TaskEventRepository
 from ..repositories.project_repository import ProjectRepository
 from ..exceptions.service_exceptions import TaskNotFoundError, ProjectNotFoundError
+from ..observability.instrument import instrument
 
 
+@instrument("service")
 class TaskService:
     """Provides business logic for managing tasks."""
 
     def __init__(self, session: Session):
         """Initialize the service with a repository."""
         self.task_repo = TaskRepository(session)
+        self.archive_repo = TaskArchiveRepository(session)
+        self.event_repo = TaskEventRepository(session)
         self.project_repo = ProjectRepository(session)
 
+    def _get_project_task(self, project_id: int, task_id: int):
+        """Return a live task of a live project, or raise TaskNotFoundError."""
+        task = self.task_repo.get_by_id(task_id)
+        # Tasks of a deleted project stay until purged but are hidden with it
+        if not task or task.project_id != project_id or not self.project_repo.get_by_id(project_id):
+            raise TaskNotFoundError(f"Task with ID {task_id} not found in project {project_id}")
+        return task
+
     def create_task(
         self,
         project_id: int,
@@ -27,36 +41,63 @@ class TaskService:
         """Add a new task to a project."""
         return self.task_repo.create(project_id, title, description, status, deadline)
 
-    def list_tasks(self, project_id: int) -> List:
+    def list_tasks(self, project_id: int, include_archived: bool = False) -> List:
         """List all tasks for a given project.
 
         Args:
             project_id (int): The ID of the parent project.
+            include_archived (bool): Also return archived tasks, ordered by ID
+                together with the others.
         """
         # Verify project exists
         project = self.project_repo.get_by_id(project_id)
         if not project:
             raise ProjectNotFoundError(f"Project with ID {project_id} not found")
 
-        return self.task_repo.get_by_project_id(project_id)
+        tasks = self.task_repo.get_by_project_id(project_id)
+        if include_archived:
+            tasks = sorted(tasks + self.archive_repo.get_by_project_id(project_id), key=lambda task: task.id)
+        return tasks
 
     def change_task_status(self, project_id: int, task_id: int, new_status: str):
         """Change the status of a specific task."""
-        task = self.task_repo.get_by_id(task_id)
-        if not task or task.project_id != project_id:
-            raise TaskNotFoundError(f"Task with ID {task_id} not found in project {project_id}")
+        task = self._get_project_task(project_id, task_id)
 
         return self.task_repo.change_status(task_id, new_status)
 
     def delete_task(self, project_id: int, task_id: int) -> str:
         """Remove a task from a project."""
-        task = self.task_repo.get_by_id(task_id)
-        if not task or task.project_id != project_id:
-            raise TaskNotFoundError(f"Task with ID {task_id} not found in project {project_id}")
+        task = self._get_project_task(project_id, task_id)
 
         self.task_repo.delete(task_id)
         return f"Task {task_id} deleted successfully"
 
+    def get_task_history(self, project_id: int, task_id: int) -> List:
+        """Return the events of a task, oldest first, including after it was archived or deleted."""
+        project = self.project_repo.get_by_id(project_id)
+        if not project:
+            raise ProjectNotFoundError(f"Project with ID {project_id} not found")
+
+        events = self.event_repo.get_by_task(task_id, project_id)
+        if not events:
+            # Tasks created before the event log have no history yet
+            task = self.task_repo.get_by_id(task_id) or self.archive_repo.get_by_id(task_id)
+            if not task or task.project_id != project_id:
+                raise TaskNotFoundError(f"Task with ID {task_id} not found in project {project_id}")
+        return events
+
+    def restore_task(self, project_id: int, task_id: int):
+        """Undo the deletion of a task that was not purged yet."""
+        project = self.project_repo.get_by_id(project_id)
+        if not project:
+            raise ProjectNotFoundError(f"Project with ID {project_id} not found")
+
+        task = self.task_repo.get_deleted_by_id(task_id)
+        if not task or task.project_id != project_id:
+            raise TaskNotFoundError(f"Deleted task with ID {task_id} not found in project {project_id}")
+
+        return self.task_repo.restore(task_id)
+
     def update_task(
         self,
         project_id: int,
@@ -67,21 +108,21 @@ class TaskService:
         deadline: Optional[str] = None,
     ):
         """Update an existing task."""
-        task = self.task_repo.get_by_id(task_id)
-        if not task or task.project_id != project_id:
-            raise TaskNotFoundError(f"Task with ID {task_id} not found in project {project_id}")
+        task = self._get_project_task(project_id, task_id)
 
         return self.task_repo.update(task_id, title, description, status, deadline)
 
 
-    def get_task(self, project_id: int, task_id: int):
-        """Get a specific task by ID within a project."""
+    def get_task(self, project_id: int, task_id: int, include_archived: bool = False):
+        """Get a specific task by ID within a project, looking in the archive too if asked."""
 
         project = self.project_repo.get_by_id(project_id)
         if not project:
             raise ProjectNotFoundError(f"Project with ID {project_id} not found")
 
         task = self.task_repo.get_by_id(task_id)
+        if task is None and include_archived:
+            task = self.archive_repo.get_by_id(task_id)
         if not task or task.project_id != project_id:
             raise TaskNotFoundError(f"Task with ID {task_id} not found in project {project_id}")
         return task
\ No newline at end of file
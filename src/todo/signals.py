@@ -0,0 +1,135 @@
+"""
+In-process and cross-process change signals.
+
+Repositories mark a session when a write may move the earliest open task
+deadline (see ``mark_deadlines_changed``). When that session commits,
+``deadlines_changed`` is sent to receivers in this process and, on
+PostgreSQL, a ``NOTIFY`` on ``DEADLINES_CHANNEL`` is issued inside the
+committing transaction so schedulers in other processes are woken too.
+"""
+
+import logging
+import select
+import threading
+from typing import Callable, List
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+DEADLINES_CHANNEL = "todo_deadlines"
+
+_DEADLINES_FLAG = "deadlines_changed"
+
+
+class Signal:
+    """A list of receivers called synchronously on ``send``."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._receivers: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def connect(self, receiver: Callable[[], None]) -> None:
+        with self._lock:
+            if receiver not in self._receivers:
+                self._receivers.append(receiver)
+
+    def disconnect(self, receiver: Callable[[], None]) -> None:
+        with self._lock:
+            if receiver in self._receivers:
+                self._receivers.remove(receiver)
+
+    def send(self) -> None:
+        with self._lock:
+            receivers = list(self._receivers)
+        for receiver in receivers:
+            try:
+                receiver()
+            except Exception as e:
+                logger.warning("Receiver of %s signal failed: %s", self.name, e)
+
+
+# Sent after a commit that may have moved the earliest open deadline
+deadlines_changed = Signal("deadlines_changed")
+
+
+def mark_deadlines_changed(session: Session) -> None:
+    """Send ``deadlines_changed`` once ``session`` commits."""
+    session.info[_DEADLINES_FLAG] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_other_processes(session: Session) -> None:
+    if not session.info.get(_DEADLINES_FLAG):
+        return
+    bind = session.get_bind()
+    if bind.dialect.name == "postgresql":
+        session.execute(text(f"NOTIFY {DEADLINES_CHANNEL}"))
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_this_process(session: Session) -> None:
+    if session.info.pop(_DEADLINES_FLAG, False):
+        deadlines_changed.send()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_DEADLINES_FLAG, None)
+
+
+class DeadlineListener(threading.Thread):
+    """
+    Call ``callback`` whenever another process signals a deadline change.
+
+    Only PostgreSQL delivers such notifications; the listener keeps one
+    connection of the pool in autocommit mode and reconnects on error.
+    ``callback`` is also called after every (re)connect, as notifications
+    sent while disconnected are lost.
+    """
+
+    def __init__(self, engine: Engine, callback: Callable[[], None], poll_interval: float = 5.0):
+        super().__init__(name="deadline-listener", daemon=True)
+        self.engine = engine
+        self.callback = callback
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def supported(engine: Engine) -> bool:
+        return engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg2"
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                logger.warning("Deadline listener disconnected: %s", e)
+                self._stop_event.wait(self.poll_interval)
+
+    def _listen(self) -> None:
+        raw = self.engine.raw_connection()
+        try:
+            connection = raw.driver_connection
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {DEADLINES_CHANNEL}")
+            self.callback()
+
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select([connection], [], [], self.poll_interval)
+                if not readable:
+                    continue
+                connection.poll()
+                if connection.notifies:
+                    connection.notifies.clear()
+                    self.callback()
+        finally:
+            # Never hand a LISTENing autocommit connection back to the pool
+            raw.invalidate()
@@ -0,0 +1,30 @@
+"""Shared fixtures for the test suite."""
+
+import os
+import tempfile
+
+# Settings are read once on import and the engine is bound to the first
+# DATABASE_URL it sees, so every test module shares this scratch SQLite file
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db")
+# Every TestClient request comes from the same address; keep them off one rate limit bucket
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from todo.api.main import app
+from todo.db.session import engine
+from todo.models import Base
+
+
+@pytest.fixture(autouse=True)
+def database():
+    """Give each test an empty schema."""
+    Base.metadata.create_all(engine)
+    yield
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
@@ -0,0 +1,79 @@
+"""Tests for archiving long closed tasks."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from todo.commands.archive_closed_tasks import archive_closed_tasks
+from todo.config import config
+from todo.db.session import engine
+from todo.models.archived_task import ArchivedTask
+from todo.models.task import Task
+
+
+@pytest.fixture
+def project(client):
+    return client.post("/api/v1/projects/", json={"name": "project"}).json()
+
+
+def create_task(client, project, title, closed_days_ago=None):
+    """Create a task, done ``closed_days_ago`` days ago when given."""
+    url = f"/api/v1/projects/{project['id']}/tasks"
+    task = client.post(url, json={"title": title}).json()
+    if closed_days_ago is not None:
+        client.patch(f"{url}/{task['id']}/status", json={"status": "done"})
+        with engine.begin() as conn:
+            conn.execute(
+                update(Task)
+                .where(Task.id == task["id"])
+                .values(closed_at=datetime.now() - timedelta(days=closed_days_ago))
+            )
+    return task["id"]
+
+
+def test_archive_moves_only_long_closed_tasks(client, project):
+    old = create_task(client, project, "old", closed_days_ago=config.TASK_ARCHIVE_AFTER_DAYS + 1)
+    recent = create_task(client, project, "recent", closed_days_ago=1)
+    open_task = create_task(client, project, "open")
+
+    assert archive_closed_tasks() == 1
+
+    with engine.connect() as conn:
+        assert list(conn.scalars(select(ArchivedTask.id))) == [old]
+        assert list(conn.scalars(select(Task.id).order_by(Task.id))) == [recent, open_task]
+
+
+def test_archived_tasks_are_read_with_include_archived(client, project):
+    old = create_task(client, project, "old", closed_days_ago=config.TASK_ARCHIVE_AFTER_DAYS + 1)
+    create_task(client, project, "open")
+    archive_closed_tasks()
+    url = f"/api/v1/projects/{project['id']}/tasks"
+
+    assert [task["title"] for task in client.get(url).json()["tasks"]] == ["open"]
+    archived = client.get(url, params={"include_archived": True}).json()["tasks"]
+    assert [task["title"] for task in archived] == ["old", "open"]
+
+    assert client.get(f"{url}/{old}").status_code == 404
+    response = client.get(f"{url}/{old}", params={"include_archived": True})
+    assert response.status_code == 200
+    assert response.json()["id"] == old
+
+
+def test_archived_tasks_are_read_only(client, project):
+    old = create_task(client, project, "old", closed_days_ago=config.TASK_ARCHIVE_AFTER_DAYS + 1)
+    archive_closed_tasks()
+
+    response = client.patch(f"/api/v1/projects/{project['id']}/tasks/{old}/status", json={"status": "todo"})
+
+    assert response.status_code == 404
+
+
+def test_tasks_of_a_deleted_project_are_not_archived(client, project):
+    create_task(client, project, "old", closed_days_ago=config.TASK_ARCHIVE_AFTER_DAYS + 1)
+    client.delete(f"/api/v1/projects/{project['id']}")
+
+    assert archive_closed_tasks() == 0
+
+    with engine.connect() as conn:
+        assert list(conn.scalars(select(ArchivedTask.id))) == []
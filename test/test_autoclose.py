@@ -0,0 +1,129 @@
+"""Tests for the incremental autoclose job."""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from todo.commands.autoclose_overdue import autoclose_overdue_tasks
+from todo.db.session import engine, get_session
+from todo.exceptions.base import ValidationError
+from todo.models.task import Task
+from todo.repositories.job_watermark_repository import JobWatermarkRepository
+from todo.repositories.task_repository import TaskRepository
+
+WATERMARK = "autoclose_overdue_tasks:0/1"
+
+
+@pytest.fixture
+def project(client):
+    return client.post("/api/v1/projects/", json={"name": "project"}).json()
+
+
+def create_task(client, project, days_overdue):
+    """Create an open task whose deadline lapsed ``days_overdue`` days ago."""
+    task = client.post(f"/api/v1/projects/{project['id']}/tasks", json={"title": "task"}).json()
+    # Past deadlines are rejected by the API; move it back directly
+    with engine.begin() as conn:
+        conn.execute(
+            update(Task).where(Task.id == task["id"]).values(deadline=date.today() - timedelta(days=days_overdue))
+        )
+    return task["id"]
+
+
+def get_task(task_id):
+    session = get_session()
+    try:
+        return session.get(Task, task_id)
+    finally:
+        session.close()
+
+
+def get_watermark():
+    session = get_session()
+    try:
+        return JobWatermarkRepository(session).get(WATERMARK)
+    finally:
+        session.close()
+
+
+def get_earliest_open_deadline():
+    session = get_session()
+    try:
+        return TaskRepository(session).get_earliest_open_deadline()
+    finally:
+        session.close()
+
+
+def test_first_run_scans_all_deadlines(client, project):
+    old = create_task(client, project, days_overdue=30)
+    recent = create_task(client, project, days_overdue=2)
+    upcoming = create_task(client, project, days_overdue=-3)
+
+    assert get_watermark() is None
+    assert autoclose_overdue_tasks() == 2
+
+    assert get_task(old).status == "done"
+    assert get_task(recent).status == "done"
+    assert get_task(upcoming).status == "todo"
+    assert get_watermark() == date.today() - timedelta(days=1)
+
+
+def test_watermark_stops_at_open_overdue_task(client, project, monkeypatch):
+    stuck = create_task(client, project, days_overdue=5)
+    closable = create_task(client, project, days_overdue=2)
+
+    change_status = Task.change_status
+
+    def fail_for_stuck(task, new_status):
+        if task.id == stuck:
+            raise ValidationError("cannot close")
+        change_status(task, new_status)
+
+    monkeypatch.setattr(Task, "change_status", fail_for_stuck)
+    assert autoclose_overdue_tasks() == 1
+
+    assert get_task(stuck).status == "todo"
+    assert get_task(closable).status == "done"
+    # The next run must look at the stuck task's deadline again
+    assert get_watermark() == get_task(stuck).deadline - timedelta(days=1)
+
+    monkeypatch.setattr(Task, "change_status", change_status)
+    assert autoclose_overdue_tasks() == 1
+
+    assert get_task(stuck).status == "done"
+    assert get_watermark() == date.today() - timedelta(days=1)
+
+
+def test_reopened_task_behind_watermark_is_rechecked(client, project):
+    task_id = create_task(client, project, days_overdue=3)
+    assert autoclose_overdue_tasks() == 1
+    assert get_watermark() == date.today() - timedelta(days=1)
+
+    response = client.patch(
+        f"/api/v1/projects/{project['id']}/tasks/{task_id}/status", json={"status": "todo"}
+    )
+    assert response.status_code == 200
+    assert get_task(task_id).overdue_recheck
+
+    assert autoclose_overdue_tasks() == 1
+
+    task = get_task(task_id)
+    assert task.status == "done"
+    assert not task.overdue_recheck
+
+
+def test_tasks_of_a_deleted_project_wait_for_its_restore(client, project):
+    task_id = create_task(client, project, days_overdue=3)
+    client.delete(f"/api/v1/projects/{project['id']}")
+
+    assert autoclose_overdue_tasks() == 0
+    assert get_task(task_id).status == "todo"
+    assert get_earliest_open_deadline() is None
+    assert get_watermark() == date.today() - timedelta(days=1)
+
+    assert client.post(f"/api/v1/projects/{project['id']}/restore").status_code == 200
+    assert get_earliest_open_deadline() == date.today() - timedelta(days=3)
+    # The task is behind the watermark now, so it is found through overdue_recheck
+    assert autoclose_overdue_tasks() == 1
+    assert get_task(task_id).status == "done"
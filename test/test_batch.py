@@ -0,0 +1,60 @@
+"""Tests for the transactional batch endpoint."""
+
+
+def test_batch_resolves_refs_and_snapshots_each_result(client):
+    response = client.post("/api/v1/batch", json={"operations": [
+        {"op": "create", "resource": "project", "ref": "p", "data": {"name": "batch"}},
+        {"op": "create", "resource": "task", "ref": "t", "project_id": "$p", "data": {"title": "first"}},
+        {"op": "update", "resource": "task", "id": "$t", "project_id": "$p", "data": {"title": "second"}},
+        {"op": "status", "resource": "task", "id": "$t", "project_id": "$p", "data": {"status": "doing"}},
+    ]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 4
+    project, created, updated, status = body["results"]
+    assert project["result"]["name"] == "batch"
+    assert created["id"] == updated["id"] == status["id"]
+    # Each result shows the task as that operation left it
+    assert created["result"]["title"] == "first"
+    assert updated["result"]["title"] == "second"
+    assert status["result"]["status"] == "doing"
+
+    tasks = client.get(f"/api/v1/projects/{project['id']}/tasks").json()
+    assert [task["title"] for task in tasks["tasks"]] == ["second"]
+
+
+def test_batch_result_of_task_deleted_later_in_batch(client):
+    project = client.post("/api/v1/projects/", json={"name": "project"}).json()
+
+    response = client.post("/api/v1/batch", json={"operations": [
+        {"op": "create", "resource": "task", "ref": "t", "project_id": project["id"], "data": {"title": "gone"}},
+        {"op": "delete", "resource": "task", "id": "$t", "project_id": project["id"]},
+    ]})
+
+    assert response.status_code == 200
+    created, deleted = response.json()["results"]
+    assert created["result"]["title"] == "gone"
+    assert deleted["result"] is None
+
+
+def test_failed_operation_rolls_back_the_batch(client):
+    response = client.post("/api/v1/batch", json={"operations": [
+        {"op": "create", "resource": "project", "data": {"name": "rolled back"}},
+        {"op": "create", "resource": "task", "project_id": 999, "data": {"title": "orphan"}},
+    ]})
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["index"] == 1
+    assert client.get("/api/v1/projects/").json()["count"] == 0
+
+
+def test_invalid_payload_is_rejected_before_running(client):
+    response = client.post("/api/v1/batch", json={"operations": [
+        {"op": "create", "resource": "project", "data": {"name": "valid"}},
+        {"op": "create", "resource": "project", "data": {}},
+    ]})
+
+    assert response.status_code == 422
+    assert response.json()["detail"]["index"] == 1
+    assert client.get("/api/v1/projects/").json()["count"] == 0
@@ -0,0 +1,122 @@
+"""Tests for the AIMD concurrency limiter and the load shedding middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from todo.api.middleware import concurrency
+from todo.api.middleware.concurrency import AdaptiveConcurrencyLimiter, ConcurrencyLimitMiddleware
+from todo.db import session
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time.monotonic for the limiter; advance it by assigning ``clock[0]``."""
+    now = [1000.0]
+    monkeypatch.setattr(concurrency.time, "monotonic", lambda: now[0])
+    return now
+
+
+def make_limiter(initial_limit=4, **options):
+    options = {"min_limit": 1, "max_limit": 8, "target_latency": 0.1, "smoothing": 1.0, **options}
+    return AdaptiveConcurrencyLimiter(initial_limit, **options)
+
+
+def fill(limiter):
+    """Admit requests until the limit is reached."""
+    while limiter.try_acquire():
+        pass
+
+
+def test_requests_past_the_limit_are_shed():
+    limiter = make_limiter(initial_limit=2)
+
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    assert limiter.shed_count == 1
+
+    limiter.release(0.01)
+    assert limiter.try_acquire()
+
+
+def test_limit_grows_additively_while_latency_is_under_target():
+    limiter = make_limiter(initial_limit=4)
+
+    for _ in range(4):
+        fill(limiter)
+        limiter.release(0.01)
+
+    # About +1 per ``limit`` completions
+    assert limiter.limit == pytest.approx(5, abs=0.1)
+
+
+def test_limit_does_not_grow_when_it_is_not_the_constraint():
+    limiter = make_limiter(initial_limit=4)
+
+    for _ in range(10):
+        limiter.try_acquire()
+        limiter.release(0.01)
+
+    assert limiter.limit == 4
+
+
+def test_limit_is_cut_multiplicatively_once_per_target_interval(clock):
+    limiter = make_limiter(initial_limit=8, backoff=0.5)
+    fill(limiter)
+
+    limiter.release(0.5)
+    limiter.release(0.5)
+    assert limiter.limit == 4
+
+    clock[0] += 0.1
+    limiter.release(0.5)
+    assert limiter.limit == 2
+
+    for _ in range(5):
+        clock[0] += 0.1
+        limiter.release(0.5)
+    assert limiter.limit == 1
+
+
+def test_limit_stays_within_bounds(clock):
+    limiter = make_limiter(initial_limit=20, max_limit=8)
+    assert limiter.limit == 8
+
+    for _ in range(100):
+        fill(limiter)
+        limiter.release(0.01)
+    assert limiter.limit == 8
+
+
+def test_middleware_answers_503_when_the_limit_is_reached():
+    app = FastAPI()
+
+    @app.get("/items")
+    def items():
+        return []
+
+    limiter = make_limiter(initial_limit=1, max_limit=1)
+    app.add_middleware(ConcurrencyLimitMiddleware, limiter=limiter)
+    client = TestClient(app)
+
+    assert client.get("/items").status_code == 200
+    assert limiter.in_flight == 0
+
+    limiter.try_acquire()
+    response = client.get("/items")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    # Probes and docs are never shed
+    assert client.get("/openapi.json").status_code == 200
+
+
+def test_pool_capacity_counts_overflow(monkeypatch):
+    monkeypatch.setattr(session, "engine", create_engine("sqlite://", poolclass=QueuePool, pool_size=3, max_overflow=2))
+    assert session.pool_capacity() == 5
+
+    # SingletonThreadPool exposes ``size`` as a plain attribute, not a method
+    monkeypatch.setattr(session, "engine", create_engine("sqlite://"))
+    assert session.pool_capacity() == 5
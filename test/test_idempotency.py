@@ -0,0 +1,115 @@
+"""Tests for Idempotency-Key handling on the create endpoints."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from todo.commands.purge_idempotency_keys import purge_expired_idempotency_keys
+from todo.db.session import engine
+from todo.models.idempotency_key import IdempotencyKey
+from todo.repositories.idempotency_repository import IdempotencyRepository
+from todo.services.project_service import ProjectService
+
+
+def create_project(client, key, name="project"):
+    return client.post("/api/v1/projects/", json={"name": name}, headers={"Idempotency-Key": key})
+
+
+def test_retry_replays_the_first_response(client):
+    first = create_project(client, "key-1")
+    retry = create_project(client, "key-1")
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotency-Replayed"] == "true"
+    assert "Idempotency-Replayed" not in first.headers
+    assert client.get("/api/v1/projects/").json()["count"] == 1
+
+
+def test_key_reused_with_another_payload_is_rejected(client):
+    create_project(client, "key-1", name="first")
+
+    response = create_project(client, "key-1", name="second")
+
+    assert response.status_code == 422
+    assert client.get("/api/v1/projects/").json()["count"] == 1
+
+
+def test_keys_are_scoped_to_the_endpoint(client):
+    project = create_project(client, "key-1").json()
+
+    response = client.post(
+        f"/api/v1/projects/{project['id']}/tasks", json={"title": "task"},
+        headers={"Idempotency-Key": "key-1"},
+    )
+
+    assert response.status_code == 201
+    assert "Idempotency-Replayed" not in response.headers
+
+
+def test_failed_request_releases_the_key(client):
+    create_project(client, "key-1", name="taken")
+
+    first = create_project(client, "key-2", name="taken")
+    retry = create_project(client, "key-2", name="taken")
+
+    # Errors are not stored, so the retry runs again instead of replaying
+    assert first.status_code == retry.status_code == 409
+    assert "Idempotency-Replayed" not in retry.headers
+
+
+def test_purge_removes_expired_keys(client):
+    create_project(client, "expired", name="first")
+    create_project(client, "live", name="second")
+    with engine.begin() as conn:
+        conn.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == "expired")
+            .values(expires_at=datetime.now() - timedelta(seconds=1))
+        )
+
+    assert purge_expired_idempotency_keys() == 1
+
+    assert create_project(client, "live", name="second").headers["Idempotency-Replayed"] == "true"
+
+
+def set_lock(key, locked_until):
+    with engine.begin() as conn:
+        conn.execute(update(IdempotencyKey).where(IdempotencyKey.key == key).values(locked_until=locked_until))
+
+
+def test_reservation_of_a_crashed_request_is_taken_over_after_its_lock(client, monkeypatch):
+    def crash(*args, **kwargs):
+        raise RuntimeError("worker died")
+
+    with monkeypatch.context() as m:
+        m.setattr(ProjectService, "create_project", crash)
+        # A crashed process never gets to release its reservation
+        m.setattr(IdempotencyRepository, "release", lambda *args: None)
+        assert create_project(client, "key-1").status_code == 400
+
+    response = create_project(client, "key-1")
+    assert response.status_code == 409
+    assert "still being processed" in response.json()["detail"]
+
+    set_lock("key-1", datetime.now() - timedelta(seconds=1))
+    response = create_project(client, "key-1")
+
+    assert response.status_code == 201
+    assert "Idempotency-Replayed" not in response.headers
+    assert create_project(client, "key-1").headers["Idempotency-Replayed"] == "true"
+
+
+def test_request_whose_key_was_taken_over_is_rolled_back(client, monkeypatch):
+    create = ProjectService.create_project
+
+    def taken_over(self, *args, **kwargs):
+        # The lock ran out and a retry holds the key now
+        set_lock("key-1", datetime.now() + timedelta(minutes=1))
+        return create(self, *args, **kwargs)
+
+    monkeypatch.setattr(ProjectService, "create_project", taken_over)
+    response = create_project(client, "key-1")
+
+    assert response.status_code == 409
+    assert client.get("/api/v1/projects/").json()["count"] == 0
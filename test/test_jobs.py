@@ -0,0 +1,153 @@
+"""Tests for the background job queue and worker."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from todo.commands.worker import Worker
+from todo.db.session import engine, get_session
+from todo.models.background_job import BackgroundJob
+from todo.services.background_job_service import HANDLERS, BackgroundJobService
+
+
+@pytest.fixture
+def service():
+    session = get_session()
+    yield BackgroundJobService(session)
+    session.close()
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    """Register test job kinds for the duration of a test."""
+    def register(kind, func):
+        monkeypatch.setitem(HANDLERS, kind, func)
+    return register
+
+
+def make_stale(job_id):
+    with engine.begin() as conn:
+        conn.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id)
+            .values(locked_at=datetime.now() - timedelta(hours=1))
+        )
+
+
+def get_job(job_id):
+    session = get_session()
+    try:
+        return session.get(BackgroundJob, job_id)
+    finally:
+        session.close()
+
+
+def test_claim_takes_highest_priority_due_job(service, handlers):
+    handlers("test.noop", lambda session, payload: None)
+    low = service.enqueue("test.noop", {}, priority=0)
+    high = service.enqueue("test.noop", {}, priority=5)
+    later = service.enqueue("test.noop", {}, priority=9)
+    with engine.begin() as conn:
+        conn.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == later.id)
+            .values(run_at=datetime.now() + timedelta(hours=1))
+        )
+
+    assert service.claim("worker-1").id == high.id
+    assert service.claim("worker-2").id == low.id
+    assert service.claim("worker-3") is None
+
+
+def test_failed_job_is_retried_until_max_attempts(service, handlers):
+    def fail(session, payload):
+        raise RuntimeError("boom")
+
+    handlers("test.fail", fail)
+    job = service.enqueue("test.fail", {})
+
+    for attempt in range(1, job.max_attempts + 1):
+        with engine.begin() as conn:
+            conn.execute(update(BackgroundJob).values(run_at=datetime.now()))
+        claimed = service.claim("worker")
+        assert claimed.attempts == attempt
+        assert service.run(claimed, "worker")
+
+    job = get_job(job.id)
+    assert job.status == "failed"
+    assert job.error == "RuntimeError: boom"
+    assert job.finished_at is not None
+
+
+def test_permanent_error_fails_without_retry(service):
+    job = service.enqueue("project.export", {"project_id": 999})
+
+    assert service.run(service.claim("worker"), "worker")
+
+    job = get_job(job.id)
+    assert job.status == "failed"
+    assert job.attempts == 1
+
+
+def test_stale_jobs_are_requeued_or_failed_when_out_of_attempts(service, handlers):
+    handlers("test.noop", lambda session, payload: None)
+    retried = service.enqueue("test.noop", {})
+    exhausted = service.enqueue("test.noop", {})
+    for job in (retried, exhausted):
+        service.claim("dead-worker")
+        make_stale(job.id)
+    with engine.begin() as conn:
+        conn.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == exhausted.id)
+            .values(attempts=BackgroundJob.max_attempts)
+        )
+
+    assert service.requeue_stale() == (1, 1)
+
+    assert get_job(retried.id).status == "queued"
+    assert get_job(exhausted.id).status == "failed"
+
+
+def test_heartbeat_keeps_a_running_job_from_going_stale(service, handlers):
+    handlers("test.noop", lambda session, payload: None)
+    job = service.enqueue("test.noop", {})
+    service.claim("worker-1")
+    make_stale(job.id)
+
+    assert not service.heartbeat(job.id, "worker-2")
+    assert service.heartbeat(job.id, "worker-1")
+
+    assert service.requeue_stale() == (0, 0)
+    assert get_job(job.id).status == "running"
+
+
+def test_outcome_of_a_job_taken_over_is_discarded(service, handlers):
+    handlers("test.noop", lambda session, payload: {"done": True})
+    job = service.enqueue("test.noop", {})
+    first = service.claim("worker-1")
+    make_stale(job.id)
+    service.requeue_stale()
+    service.claim("worker-2")
+
+    assert not service.run(first, "worker-1")
+
+    job = get_job(job.id)
+    assert job.status == "running"
+    assert job.locked_by == "worker-2"
+
+
+def test_worker_runs_a_queued_export(client):
+    project = client.post("/api/v1/projects/", json={"name": "project"}).json()
+    client.post(f"/api/v1/projects/{project['id']}/tasks", json={"title": "task"})
+
+    response = client.post(f"/api/v1/projects/{project['id']}/export")
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    assert Worker(concurrency=1, poll_interval=0).run_one("worker")
+
+    job = client.get(f"/api/v1/jobs/{job_id}").json()
+    assert job["status"] == "succeeded"
+    assert [task["title"] for task in job["result"]["tasks"]] == ["task"]
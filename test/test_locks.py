@@ -0,0 +1,74 @@
+"""Tests for the lease based job locks used off PostgreSQL."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+
+from todo.db.locks import OWNER, JobLock, job_lock
+from todo.db.session import engine
+from todo.models.scheduler_lock import SchedulerLock
+
+
+def set_lease(name, **values):
+    with engine.begin() as conn:
+        conn.execute(update(SchedulerLock).where(SchedulerLock.name == name).values(**values))
+
+
+def get_lease(name):
+    with engine.connect() as conn:
+        return conn.execute(select(SchedulerLock).where(SchedulerLock.name == name)).first()
+
+
+def test_lease_is_exclusive_until_released():
+    first = JobLock("job", ttl=60)
+    second = JobLock("job", ttl=60)
+
+    assert first.acquire()
+    assert get_lease("job").owner == OWNER
+    assert not second.acquire()
+    # Other names are independent
+    assert JobLock("other", ttl=60).acquire()
+
+    first.release()
+    assert get_lease("job") is None
+    assert second.acquire()
+
+
+def test_expired_lease_is_taken_over():
+    crashed = JobLock("job", ttl=60)
+    crashed.acquire()
+    set_lease("job", owner="crashed-host:1:abcd", expires_at=datetime.now() - timedelta(seconds=1))
+
+    lock = JobLock("job", ttl=60)
+    assert lock.acquire()
+
+    lease = get_lease("job")
+    assert lease.owner == OWNER
+    assert lease.expires_at > datetime.now() + timedelta(seconds=50)
+
+
+def test_renew_extends_the_lease_until_it_is_lost():
+    lock = JobLock("job", ttl=60)
+    lock.acquire()
+    set_lease("job", expires_at=datetime.now() + timedelta(seconds=1))
+
+    assert lock.renew()
+    assert get_lease("job").expires_at > datetime.now() + timedelta(seconds=50)
+
+    # Another instance took over after the lease ran out
+    set_lease("job", owner="other-host:1:abcd")
+    assert not lock.renew()
+    assert not lock.held
+
+    # Releasing a lost lease leaves the new owner's alone
+    lock.release()
+    assert get_lease("job").owner == "other-host:1:abcd"
+
+
+def test_job_lock_releases_on_exit():
+    with job_lock("job", ttl=60) as lock:
+        assert lock.held
+        with job_lock("job", ttl=60) as contender:
+            assert not contender.held
+
+    assert get_lease("job") is None
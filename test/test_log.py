@@ -0,0 +1,68 @@
+"""Tests for the queued logging setup and its per-row rate limit."""
+
+import json
+import logging
+
+import pytest
+
+from todo.observability import log
+
+
+def make_record(msg="Failed to close overdue task", name="todo.jobs", **extra):
+    record = logging.LogRecord(name, logging.WARNING, __file__, 0, msg, (), None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def output(capsys, monkeypatch):
+    """Configure logging for the test; returns a function flushing and reading the lines written."""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", list(root.handlers))
+    monkeypatch.setattr(root, "level", root.level)
+    for name in ("_listener", "_handler", "_settings"):
+        monkeypatch.setattr(log, name, None)
+
+    def read():
+        log.shutdown()
+        return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    yield read
+    log.shutdown()
+
+
+def test_filter_drops_rate_limited_records_past_the_limit(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(log.time, "monotonic", lambda: now[0])
+    limiter = log.RateLimitFilter(limit=2, interval=60)
+
+    passed = [limiter.filter(make_record(**log.rate_limited(task_id=t))) for t in range(5)]
+    assert passed == [True, True, False, False, False]
+    # Another message template has its own window
+    assert limiter.filter(make_record("Another message", **log.rate_limited()))
+
+    now[0] = 60.0
+    record = make_record(**log.rate_limited())
+    assert limiter.filter(record)
+    assert record.suppressed == 3
+
+
+def test_filter_never_drops_records_that_did_not_opt_in():
+    limiter = log.RateLimitFilter(limit=1)
+
+    assert all(limiter.filter(make_record("GET /api/v1/projects/ 200", name="uvicorn.access")) for _ in range(5))
+
+
+def test_access_logs_are_written_past_the_rate_limit(output):
+    log.configure(level="INFO", rate_limit=2)
+    access = logging.getLogger("uvicorn.access")
+    jobs = logging.getLogger("todo.jobs")
+
+    for t in range(10):
+        access.info("GET /api/v1/projects/ 200")
+        jobs.warning("Failed to close overdue task", extra=log.rate_limited(task_id=t))
+
+    lines = output()
+    assert sum(line["logger"] == "uvicorn.access" for line in lines) == 10
+    assert [line["task_id"] for line in lines if line["logger"] == "todo.jobs"] == [0, 1]
+    assert all("_rate_limited" not in line for line in lines)
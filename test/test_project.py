@@ -0,0 +1,78 @@
+"""Tests for the project endpoints."""
+
+import pytest
+from sqlalchemy import event
+
+from todo.db.session import engine
+
+
+@pytest.fixture
+def queries():
+    """Record the SQL statements executed while the test runs."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def create_projects(client, projects, tasks_per_project):
+    for p in range(projects):
+        project = client.post("/api/v1/projects/", json={"name": f"project {p}"}).json()
+        for t in range(tasks_per_project):
+            client.post(f"/api/v1/projects/{project['id']}/tasks", json={"title": f"task {t}"})
+
+
+@pytest.mark.parametrize("projects", [1, 5])
+def test_list_projects_with_tasks_uses_two_queries(client, queries, projects):
+    create_projects(client, projects, tasks_per_project=3)
+    queries.clear()
+
+    response = client.get("/api/v1/projects/", params={"include": "tasks"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == projects
+    assert all(len(project["tasks"]) == 3 for project in body["projects"])
+    assert len(queries) == 2
+
+
+def test_get_project_with_tasks_uses_two_queries(client, queries):
+    create_projects(client, 2, tasks_per_project=4)
+    queries.clear()
+
+    response = client.get("/api/v1/projects/2", params={"include": "tasks"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["id"] == 2
+    assert len(body["tasks"]) == 4
+    assert all(task["project_id"] == 2 for task in body["tasks"])
+    assert len(queries) == 2
+
+
+def test_project_without_include_does_not_load_tasks(client, queries):
+    create_projects(client, 3, tasks_per_project=2)
+    queries.clear()
+
+    listed = client.get("/api/v1/projects/")
+    single = client.get("/api/v1/projects/1")
+
+    assert "tasks" not in listed.json()["projects"][0]
+    assert "tasks" not in single.json()
+    assert len(queries) == 2
+
+
+def test_unknown_include_is_rejected(client):
+    response = client.get("/api/v1/projects/", params={"include": "owners"})
+
+    assert response.status_code == 422
+
+
+def test_get_missing_project_with_tasks_returns_404(client):
+    response = client.get("/api/v1/projects/42", params={"include": "tasks"})
+
+    assert response.status_code == 404
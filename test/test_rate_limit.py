@@ -0,0 +1,95 @@
+"""Tests for the token bucket rate limiting middleware."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from todo.api.middleware import rate_limit
+from todo.api.middleware.rate_limit import InMemoryTokenBucketStore, RateLimitMiddleware
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time.monotonic for the store; advance it by assigning ``clock[0]``."""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def take(store, key, cost, capacity=10, rate=2):
+    return asyncio.run(store.take(key, cost, capacity, rate))
+
+
+def limited_app(**options):
+    app = FastAPI()
+
+    @app.get("/items")
+    def items():
+        return []
+
+    options.setdefault("route_costs", [("GET", r"^/items$", 4)])
+    app.add_middleware(RateLimitMiddleware, **options)
+    return app
+
+
+def test_bucket_is_drained_by_cost_and_refilled_over_time(clock):
+    store = InMemoryTokenBucketStore()
+
+    assert take(store, "ip:a", 4) == (True, 0.0)
+    assert take(store, "ip:a", 4) == (True, 0.0)
+    # 2 tokens left; 4 more are needed at 2 per second
+    assert take(store, "ip:a", 4) == (False, 1.0)
+    # Other clients have their own bucket
+    assert take(store, "ip:b", 10) == (True, 0.0)
+
+    clock[0] += 1
+    assert take(store, "ip:a", 4) == (True, 0.0)
+
+    # Refills stop at the capacity
+    clock[0] += 60
+    assert take(store, "ip:a", 10) == (True, 0.0)
+    assert take(store, "ip:a", 1)[0] is False
+
+
+def test_store_keeps_at_most_max_keys_buckets(clock):
+    store = InMemoryTokenBucketStore(max_keys=2)
+    take(store, "ip:a", 10)
+    take(store, "ip:b", 10)
+    take(store, "ip:a", 0)
+
+    take(store, "ip:c", 10)
+
+    # The least recently used bucket made room
+    assert list(store._buckets) == ["ip:a", "ip:c"]
+    assert take(store, "ip:a", 1)[0] is False
+
+
+def test_empty_bucket_answers_429_with_retry_after(clock):
+    client = TestClient(limited_app(capacity=8, refill_rate=0.5))
+
+    assert [client.get("/items").status_code for _ in range(2)] == [200, 200]
+    response = client.get("/items")
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "8"
+    # Exempt paths are never limited
+    assert client.get("/openapi.json").status_code == 200
+
+
+def test_cost_above_capacity_is_rejected():
+    with pytest.raises(ValueError, match="exceeds the capacity"):
+        TestClient(limited_app(capacity=3, refill_rate=1)).get("/items")
+
+
+def test_key_header_is_only_trusted_from_proxies():
+    middleware = RateLimitMiddleware(
+        FastAPI(), capacity=10, refill_rate=1,
+        key_header="X-Api-Key", trusted_proxies=("10.0.0.0/8",),
+    )
+    headers = [(b"x-api-key", b"abc")]
+
+    assert middleware._client_key({"client": ("10.1.2.3", 1), "headers": headers}) == "key:abc"
+    assert middleware._client_key({"client": ("203.0.113.7", 1), "headers": headers}) == "ip:203.0.113.7"
+    assert middleware._client_key({"client": ("10.1.2.3", 1), "headers": []}) == "ip:10.1.2.3"
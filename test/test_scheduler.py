@@ -0,0 +1,106 @@
+"""Tests for the scheduler timer heap."""
+
+import heapq
+from datetime import datetime, timedelta
+
+from todo.commands import scheduler as scheduler_module
+from todo.commands.scheduler import RETRY_DELAY, Job, TaskScheduler, daily_at, every
+
+NOW = datetime(2024, 1, 1, 12, 0)
+
+
+def at(when):
+    """Next-run rule returning a fixed time."""
+    return lambda now: when
+
+
+def queued(scheduler):
+    """Return the (job name, run time) pairs on the heap, earliest first."""
+    heap = list(scheduler._heap)
+    return [(entry.job.name, entry.when) for entry in (heapq.heappop(heap) for _ in range(len(heap)))]
+
+
+def test_next_run_rules():
+    assert every(timedelta(hours=1))(NOW) == NOW + timedelta(hours=1)
+    assert daily_at(3)(NOW) == datetime(2024, 1, 2, 3, 0)
+    assert daily_at(13)(NOW) == datetime(2024, 1, 1, 13, 0)
+
+
+def test_heap_orders_jobs_by_run_time_then_insertion():
+    scheduler = TaskScheduler()
+    later = NOW + timedelta(hours=2)
+    for name, when in [("c", later), ("a", NOW + timedelta(hours=1)), ("b", later)]:
+        scheduler._schedule(Job(name, lambda: None, at(when)), NOW)
+
+    assert queued(scheduler) == [("a", NOW + timedelta(hours=1)), ("c", later), ("b", later)]
+
+
+def test_failing_next_run_is_retried_and_none_is_not_queued():
+    def broken(now):
+        raise RuntimeError("database is down")
+
+    scheduler = TaskScheduler()
+    scheduler._schedule(Job("broken", lambda: None, broken), NOW)
+    scheduler._schedule(Job("idle", lambda: None, at(None)), NOW)
+
+    assert queued(scheduler) == [("broken", NOW + RETRY_DELAY)]
+
+
+def test_wake_up_reschedules_only_deadline_driven_jobs(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "datetime", type("frozen", (datetime,), {"now": staticmethod(lambda: NOW)}))
+    deadline = [NOW + timedelta(days=2)]
+    scheduler = TaskScheduler()
+    scheduler.jobs = [
+        Job("autoclose", lambda: None, lambda now: deadline[0], deadline_driven=True),
+        Job("hourly", lambda: None, every(timedelta(hours=1))),
+    ]
+    for job in scheduler.jobs:
+        scheduler._schedule(job, NOW)
+
+    # A task write moved the earliest deadline forward
+    deadline[0] = NOW + timedelta(minutes=5)
+    scheduler._reschedule_deadline_jobs()
+
+    assert queued(scheduler) == [
+        ("autoclose", NOW + timedelta(minutes=5)),
+        ("hourly", NOW + timedelta(hours=1)),
+    ]
+
+
+def test_autoclose_backs_off_while_runs_make_no_progress(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "next_autoclose_run", lambda now: now)
+    scheduler = TaskScheduler()
+    scheduler._listener = object()
+
+    assert scheduler._autoclose_next_run(NOW) == NOW
+    scheduler._autoclose_stalls = 2
+    assert scheduler._autoclose_next_run(NOW) == NOW + RETRY_DELAY * 2
+    scheduler._autoclose_stalls = 20
+    assert scheduler._autoclose_next_run(NOW) == NOW + scheduler_module.AUTOCLOSE_MAX_BACKOFF
+
+
+def test_loop_runs_due_jobs_in_order_and_reschedules_them(monkeypatch):
+    monkeypatch.setattr(scheduler_module.health, "beat", lambda path: None)
+    ran = []
+    scheduler = TaskScheduler()
+
+    def run(name):
+        ran.append(name)
+        if len(ran) == 3:
+            scheduler.stop_event.set()
+
+    def setup_schedules():
+        now = datetime.now()
+        scheduler.jobs = [
+            Job("second", lambda: run("second"), at(now - timedelta(seconds=1))),
+            Job("first", lambda: run("first"), lambda t: now - timedelta(seconds=2) if not ran else None),
+        ]
+        for job in scheduler.jobs:
+            scheduler._schedule(job, now)
+
+    monkeypatch.setattr(scheduler, "setup_schedules", setup_schedules)
+    scheduler.run_scheduler()
+
+    # "first" is not queued again; "second" is, and is due right away
+    assert ran == ["first", "second", "second"]
+    assert not scheduler.is_running
@@ -0,0 +1,125 @@
+"""Tests for soft deletes, restores and the purge job."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select, update
+
+from todo.commands.purge_deleted import purge_deleted_records
+from todo.commands.worker import Worker
+from todo.config import config
+from todo.db.session import engine, get_session
+from todo.models.project import Project
+from todo.models.task import Task
+from todo.services.background_job_service import BackgroundJobService
+
+
+def create_project(client, name="project", tasks=0):
+    project = client.post("/api/v1/projects/", json={"name": name}).json()
+    for t in range(tasks):
+        client.post(f"/api/v1/projects/{project['id']}/tasks", json={"title": f"task {t}"})
+    return project
+
+
+def age_deletion(model, days):
+    """Move the deletion time of every deleted ``model`` row ``days`` days back."""
+    with engine.begin() as conn:
+        conn.execute(
+            update(model)
+            .where(model.deleted_at.is_not(None))
+            .values(deleted_at=datetime.now() - timedelta(days=days))
+        )
+
+
+def count(model):
+    with engine.connect() as conn:
+        return conn.scalar(select(func.count()).select_from(model))
+
+
+def test_deleted_project_and_its_tasks_are_hidden(client):
+    project = create_project(client, tasks=2)
+    task_id = client.get(f"/api/v1/projects/{project['id']}/tasks").json()["tasks"][0]["id"]
+
+    assert client.delete(f"/api/v1/projects/{project['id']}").status_code == 204
+
+    assert client.get(f"/api/v1/projects/{project['id']}").status_code == 404
+    assert client.get("/api/v1/projects/").json()["count"] == 0
+    assert client.get(f"/api/v1/projects/{project['id']}/tasks/{task_id}").status_code == 404
+    # Rows stay until the purge
+    assert count(Project) == 1
+    assert count(Task) == 2
+
+
+def test_restore_project_brings_back_its_tasks(client):
+    project = create_project(client, tasks=2)
+    client.delete(f"/api/v1/projects/{project['id']}")
+
+    response = client.post(f"/api/v1/projects/{project['id']}/restore")
+
+    assert response.status_code == 200
+    assert client.get(f"/api/v1/projects/{project['id']}/tasks").json()["count"] == 2
+
+
+def test_deleted_project_name_is_free_until_restore(client):
+    project = create_project(client, name="reused")
+    client.delete(f"/api/v1/projects/{project['id']}")
+
+    assert client.post("/api/v1/projects/", json={"name": "reused"}).status_code == 201
+    assert client.post(f"/api/v1/projects/{project['id']}/restore").status_code == 409
+
+
+def test_delete_and_restore_task(client):
+    project = create_project(client, tasks=1)
+    url = f"/api/v1/projects/{project['id']}/tasks"
+    task_id = client.get(url).json()["tasks"][0]["id"]
+
+    assert client.delete(f"{url}/{task_id}").status_code == 204
+    assert client.get(url).json()["count"] == 0
+
+    assert client.post(f"{url}/{task_id}/restore").status_code == 200
+    assert client.get(f"{url}/{task_id}").status_code == 200
+
+
+def test_purge_removes_only_expired_deletions(client):
+    expired = create_project(client, name="expired", tasks=3)
+    client.delete(f"/api/v1/projects/{expired['id']}")
+    age_deletion(Project, config.SOFT_DELETE_RETENTION_DAYS + 1)
+    recent = create_project(client, name="recent", tasks=1)
+    client.delete(f"/api/v1/projects/{recent['id']}")
+
+    assert purge_deleted_records() == 4
+
+    assert count(Project) == 1
+    assert count(Task) == 1
+    assert client.post(f"/api/v1/projects/{expired['id']}/restore").status_code == 404
+    assert client.post(f"/api/v1/projects/{recent['id']}/restore").status_code == 200
+
+
+def test_queued_purge_leaves_a_restored_project_alone(client):
+    project = create_project(client, tasks=2)
+    response = client.delete(f"/api/v1/projects/{project['id']}", params={"background": True})
+    assert response.status_code == 202
+
+    assert client.post(f"/api/v1/projects/{project['id']}/restore").status_code == 200
+    assert Worker(concurrency=1, poll_interval=0).run_one("worker")
+
+    job = client.get(response.json()["status_url"]).json()
+    assert job["status"] == "succeeded"
+    assert job["result"] == {"project_id": project["id"], "tasks_deleted": 0, "restored": True}
+    assert client.get(f"/api/v1/projects/{project['id']}/tasks").json()["count"] == 2
+
+
+def test_restore_is_refused_while_the_purge_runs(client):
+    project = create_project(client, tasks=1)
+    client.delete(f"/api/v1/projects/{project['id']}", params={"background": True})
+    session = get_session()
+    try:
+        job = BackgroundJobService(session).claim("worker")
+        assert job.kind == "project.delete"
+
+        assert client.post(f"/api/v1/projects/{project['id']}/restore").status_code == 409
+
+        assert BackgroundJobService(session).run(job, "worker")
+    finally:
+        session.close()
+    assert count(Project) == 0
+    assert count(Task) == 0
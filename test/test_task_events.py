@@ -0,0 +1,88 @@
+"""Tests for the buffered task event log."""
+
+import pytest
+from sqlalchemy import func, select
+
+from todo.db.session import get_session
+from todo.models.project import Project
+from todo.models.task import Task
+from todo.models.task_event import TaskEvent
+from todo.repositories import task_event_repository
+from todo.repositories.task_event_repository import TaskEventRepository
+
+
+@pytest.fixture
+def session():
+    session = get_session()
+    yield session
+    session.close()
+
+
+def count_events():
+    session = get_session()
+    try:
+        return session.scalar(select(func.count()).select_from(TaskEvent))
+    finally:
+        session.close()
+
+
+def new_task(session, title="task"):
+    project = Project(name=f"project {title}")
+    task = Task(title=title, project=project)
+    session.add(task)
+    return task
+
+
+def test_events_are_written_on_commit(session):
+    task = new_task(session)
+    events = TaskEventRepository(session)
+
+    # Recorded before the task has an id
+    events.record(task, "created")
+    events.record(task, "status_changed", "todo", "done")
+    session.flush()
+    assert count_events() == 0
+
+    session.commit()
+
+    assert [(e.kind, e.from_status, e.to_status) for e in events.get_by_task(task.id, task.project_id)] == [
+        ("created", None, None),
+        ("status_changed", "todo", "done"),
+    ]
+    assert "task_events" not in session.info
+
+
+def test_events_are_discarded_on_rollback(session):
+    task = new_task(session)
+    session.commit()
+    events = TaskEventRepository(session)
+
+    events.record(task, "status_changed", "todo", "done")
+    session.rollback()
+    session.commit()
+
+    assert count_events() == 0
+
+
+def test_events_are_inserted_in_chunks(session, monkeypatch):
+    monkeypatch.setattr(task_event_repository, "INSERT_CHUNK_SIZE", 2)
+    tasks = [new_task(session, f"task {t}") for t in range(5)]
+    events = TaskEventRepository(session)
+    for task in tasks:
+        events.record(task, "created")
+
+    session.commit()
+
+    assert count_events() == 5
+
+
+def test_status_change_skips_tasks_already_in_that_status(session):
+    todo, done = new_task(session, "todo"), new_task(session, "done")
+    done.status = "done"
+    session.commit()
+
+    TaskEventRepository(session).record_status_change([todo.id, done.id], "done")
+    session.commit()
+
+    events = session.scalars(select(TaskEvent)).all()
+    assert [(e.task_id, e.from_status, e.to_status) for e in events] == [(todo.id, "todo", "done")]
@@ -0,0 +1,79 @@
+"""Tests for the daily task throughput rollups and the stats endpoint."""
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import update
+
+from todo.commands.backfill_task_stats import backfill_task_stats
+from todo.commands.rollup_task_stats import ROLLUP_JOB, rollup_task_stats
+from todo.db.session import engine, get_session
+from todo.models.task import Task
+from todo.repositories.job_watermark_repository import JobWatermarkRepository
+
+
+def create_project(client, name, tasks, closed):
+    """Create a project with ``tasks`` tasks, the first ``closed`` of them done."""
+    project = client.post("/api/v1/projects/", json={"name": name}).json()
+    url = f"/api/v1/projects/{project['id']}/tasks"
+    for t in range(tasks):
+        task = client.post(url, json={"title": f"task {t}"}).json()
+        if t < closed:
+            client.patch(f"{url}/{task['id']}/status", json={"status": "done"})
+    return project
+
+
+def get_stats(client, project, **params):
+    return client.get(f"/api/v1/projects/{project['id']}/stats", params=params)
+
+
+def test_rollup_counts_created_and_closed_per_project(client):
+    first = create_project(client, "first", tasks=3, closed=2)
+    second = create_project(client, "second", tasks=1, closed=0)
+
+    rollup_task_stats()
+
+    stats = get_stats(client, first).json()
+    assert (stats["created"], stats["closed"]) == (3, 2)
+    assert stats["days"][-1] == {"day": date.today().isoformat(), "created": 3, "closed": 2}
+    stats = get_stats(client, second).json()
+    assert (stats["created"], stats["closed"]) == (1, 0)
+
+
+def test_rollup_reruns_are_idempotent(client):
+    project = create_project(client, "project", tasks=2, closed=1)
+
+    rollup_task_stats()
+    rollup_task_stats()
+
+    stats = get_stats(client, project).json()
+    assert (stats["created"], stats["closed"]) == (2, 1)
+    session = get_session()
+    try:
+        assert JobWatermarkRepository(session).get(ROLLUP_JOB) == date.today() - timedelta(days=1)
+    finally:
+        session.close()
+
+
+def test_backfill_counts_days_before_the_event_log(client):
+    project = create_project(client, "project", tasks=2, closed=1)
+    day = date.today() - timedelta(days=3)
+    with engine.begin() as conn:
+        conn.execute(update(Task).values(created_at=datetime.combine(day, datetime.min.time())))
+        conn.execute(
+            update(Task)
+            .where(Task.closed_at.is_not(None))
+            .values(closed_at=datetime.combine(day, datetime.min.time()))
+        )
+
+    assert backfill_task_stats(day, day) == 1
+
+    stats = get_stats(client, project, **{"from": day.isoformat(), "to": day.isoformat()}).json()
+    assert stats["days"] == [{"day": day.isoformat(), "created": 2, "closed": 1}]
+
+
+def test_stats_reject_reversed_range(client):
+    project = create_project(client, "project", tasks=0, closed=0)
+
+    response = get_stats(client, project, **{"from": "2024-02-01", "to": "2024-01-01"})
+
+    assert response.status_code == 400
@@ -0,0 +1,59 @@
+"""Tests for the custom column types."""
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, literal, select
+from sqlalchemy.exc import CompileError, StatementError
+
+from todo.db.types import CodedString
+
+metadata = MetaData()
+items = Table(
+    "items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("status", CodedString(["todo", "in_progress", "done"]), nullable=True),
+)
+
+
+@pytest.fixture
+def conn():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        yield conn
+
+
+def raw_codes(conn):
+    return conn.exec_driver_sql("SELECT status FROM items ORDER BY id").scalars().all()
+
+
+def test_values_round_trip_as_their_codes(conn):
+    conn.execute(insert(items), [{"status": "done"}, {"status": "todo"}, {"status": None}])
+
+    assert raw_codes(conn) == [2, 0, None]
+    assert conn.execute(select(items.c.status).order_by(items.c.id)).scalars().all() == ["done", "todo", None]
+    # Comparisons bind the code as well
+    assert conn.execute(select(items.c.id).where(items.c.status == "todo")).scalar_one() == 2
+
+
+def test_unknown_value_is_rejected_on_bind(conn):
+    with pytest.raises(StatementError, match="Invalid value: 'blocked'"):
+        conn.execute(insert(items).values(status="blocked"))
+
+
+@pytest.mark.parametrize("code", [3, -1])
+def test_unknown_code_is_rejected_on_read(conn, code):
+    conn.exec_driver_sql(f"INSERT INTO items (status) VALUES ({code})")
+
+    with pytest.raises(ValueError, match="Invalid code"):
+        conn.execute(select(items.c.status)).scalar_one()
+
+
+def test_literal_renders_the_code():
+    def render(value):
+        statement = select(literal(value, CodedString(["todo", "in_progress", "done"])).label("status"))
+        return str(statement.compile(compile_kwargs={"literal_binds": True}))
+
+    assert render("in_progress") == "SELECT 1 AS status"
+    with pytest.raises(CompileError, match="blocked"):
+        render("blocked")